@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -11,10 +12,34 @@ except ImportError:  # pragma: no cover - hatchling import path varies by versio
     from hatchling.builders.hooks.plugin.interface import BuildHookInterface  # type: ignore
 
 
-def _copy_tree(source: Path, destination: Path) -> None:
-    if destination.exists():
-        shutil.rmtree(destination)
-    shutil.copytree(source, destination)
+def _copy_trees(trees: list[tuple[Path, Path]]) -> None:
+    """Copy each ``(source, destination)`` directory tree, copying files concurrently.
+
+    Frontend builds produce many small files; per-file copies are syscall-bound,
+    so one shared thread pool overlaps the copies of every tree instead of copying
+    one file (or one tree) at a time.
+    """
+    pairs: list[tuple[Path, Path]] = []
+    for source, destination in trees:
+        if destination.exists():
+            shutil.rmtree(destination)
+        # Symlinked directories are followed; one pointing back at an ancestor would
+        # loop forever, so each real directory is only walked once.
+        visited: set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(source, followlinks=True):
+            real_dir = os.path.realpath(dirpath)
+            if real_dir in visited:
+                dirnames.clear()
+                continue
+            visited.add(real_dir)
+            source_dir = Path(dirpath)
+            target_dir = destination / source_dir.relative_to(source)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            pairs.extend((source_dir / name, target_dir / name) for name in filenames)
+
+    with ThreadPoolExecutor() as pool:
+        # Drain the results so the first copy error propagates.
+        list(pool.map(lambda pair: shutil.copy2(*pair), pairs))
 
 
 def _first_existing(paths: list[Path]) -> Path | None:
@@ -24,6 +49,14 @@ def _first_existing(paths: list[Path]) -> Path | None:
     return None
 
 
+def _dir_nonempty(path: Path) -> bool:
+    """Return True if ``path`` is a directory with at least one entry."""
+    if not path.is_dir():
+        return False
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
+
+
 class CustomBuildHook(BuildHookInterface):  # type: ignore
     def initialize(self, _version: str, build_data: dict[str, Any]) -> None:
         root = Path(self.root)
@@ -39,11 +72,12 @@ class CustomBuildHook(BuildHookInterface):  # type: ignore
         static_target = (
             src_pkg_root / "_static" if src_pkg_root.exists() else flat_pkg_root / "_static"
         )
+        copies: list[tuple[Path, Path]] = []
         if frontend_dist.is_dir():
-            _copy_tree(frontend_dist, static_target)
+            copies.append((frontend_dist, static_target))
         else:
             static_target = _first_existing(static_candidates) or static_target
-            if enforce_frontend and not any(static_target.rglob("*")):
+            if enforce_frontend and not _dir_nonempty(static_target):
                 raise RuntimeError(
                     "frontend/dist not found. Run `pnpm build` in frontend/ before packaging."
                 )
@@ -51,10 +85,13 @@ class CustomBuildHook(BuildHookInterface):  # type: ignore
         demo_target = src_pkg_root / "_demo" if src_pkg_root.exists() else flat_pkg_root / "_demo"
         demo_src = root.parent / "demo"
         if demo_src.is_dir():
-            _copy_tree(demo_src, demo_target)
+            copies.append((demo_src, demo_target))
         else:
             demo_target = _first_existing(demo_candidates) or demo_target
 
+        if copies:
+            _copy_trees(copies)
+
         force_include = build_data.setdefault("force_include", {})
         if static_target.exists():
             force_include[str(static_target)] = "mantora/_static"
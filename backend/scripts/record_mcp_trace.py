@@ -13,22 +13,38 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
+import re
 import sys
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 # Add src to sys.path to allow running the script directly from any directory
 src_path = str(Path(__file__).parent.parent / "src")
 if src_path not in sys.path:
     sys.path.append(src_path)
 
-import jsonschema  # noqa: E402
-from mcp.client.session import ClientSession  # noqa: E402
-from mcp.client.stdio import StdioServerParameters, stdio_client  # noqa: E402
-from mcp.types import CallToolResult, Tool  # noqa: E402
+# jsonschema, mcp and mantora.mcp are imported where they are used so `--help` and
+# argument errors don't pay for them.
+if TYPE_CHECKING:
+    from mcp.types import CallToolResult, Tool
+    from pydantic import TypeAdapter
 
-from mantora.mcp.trace_sanitizer import sanitize_trace_payload  # noqa: E402
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Raises on an invalid instance; the return value is ignored.
+_SchemaValidator = Callable[[dict[str, Any]], object]
+
+# Any non-alphanumeric character (underscore included) becomes "_" in trace file names.
+_SLUG_RE = re.compile(r"[\W_]")
+
+# JSON playbooks at least this large are streamed with ijson (when installed).
+_STREAM_PLAYBOOK_BYTES = 1024 * 1024
 
 
 def _load_schema(project_root: Path) -> dict[str, Any]:
@@ -39,24 +55,99 @@ def _load_schema(project_root: Path) -> dict[str, Any]:
     return cast(dict[str, Any], raw)
 
 
-def _validate_against_schema(*, schema: dict[str, Any], instance: dict[str, Any]) -> None:
-    jsonschema.validate(instance=instance, schema=schema)
+def _build_validator(schema: dict[str, Any]) -> _SchemaValidator:
+    """Check the golden schema once and build a reusable validator for it.
+
+    Prefers a fastjsonschema-compiled function when fastjsonschema is installed and
+    accepts the schema; otherwise uses the matching jsonschema validator class.
+    """
+    import jsonschema
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+
+    try:
+        import importlib
+
+        fastjsonschema = importlib.import_module("fastjsonschema")
+    except ImportError:
+        pass
+    else:
+        try:
+            return cast(_SchemaValidator, fastjsonschema.compile(schema))
+        except fastjsonschema.JsonSchemaDefinitionException:
+            pass
+
+    return cast(_SchemaValidator, validator_cls(schema).validate)
+
+
+def _validate_against_schema(*, validator: _SchemaValidator, instance: dict[str, Any]) -> None:
+    validator(instance)
 
 
 def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    # Payloads come from sanitize_trace_payload, which already emits sorted keys.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        text = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+        data = text.encode("utf-8")
+    path.write_bytes(data)
 
 
+@functools.cache
 def _slugify(text: str) -> str:
-    out = []
-    for ch in text.lower():
-        out.append(ch if ch.isalnum() else "_")
-    return "".join(out).strip("_")
+    return _SLUG_RE.sub("_", text.lower()).strip("_")
+
+
+def _normalize_playbook_entry(i: int, entry: Any) -> dict[str, Any]:
+    if not isinstance(entry, dict):
+        raise ValueError(f"Playbook entry {i} must be an object")
+    tool_name = entry.get("tool_name") or entry.get("name")
+    if not isinstance(tool_name, str) or not tool_name:
+        raise ValueError(f"Playbook entry {i} missing tool_name")
+    arguments = entry.get("arguments", {})
+    if arguments is None:
+        arguments = {}
+    if not isinstance(arguments, dict):
+        raise ValueError(f"Playbook entry {i} arguments must be an object")
+    return {
+        "id": entry.get("id") if isinstance(entry.get("id"), str) else None,
+        "tool_name": tool_name,
+        "arguments": arguments,
+    }
+
+
+def _stream_json_playbook(path: Path) -> list[dict[str, Any]] | None:
+    """Normalize a large JSON playbook one entry at a time.
+
+    Returns None when ijson is not installed so the caller can fall back to
+    ``json.loads``.
+    """
+    try:
+        import importlib
+
+        ijson = importlib.import_module("ijson")
+    except ImportError:
+        return None
+
+    with path.open("rb") as fp:
+        head = fp.read(4096).lstrip()
+        if not head.startswith(b"["):
+            raise ValueError("Playbook must be a list of tool call entries")
+        fp.seek(0)
+        # use_float keeps numbers as float instead of Decimal so arguments stay JSON-safe.
+        items = ijson.items(fp, "item", use_float=True)
+        return [_normalize_playbook_entry(i, entry) for i, entry in enumerate(items)]
 
 
 def _load_playbook(path: Path) -> list[dict[str, Any]]:
     if path.suffix.lower() in {".json"}:
+        if path.stat().st_size >= _STREAM_PLAYBOOK_BYTES:
+            streamed = _stream_json_playbook(path)
+            if streamed is not None:
+                return streamed
         data = json.loads(path.read_text(encoding="utf-8"))
     else:
         try:
@@ -73,26 +164,7 @@ def _load_playbook(path: Path) -> list[dict[str, Any]]:
     if not isinstance(data, list):
         raise ValueError("Playbook must be a list of tool call entries")
 
-    normalized: list[dict[str, Any]] = []
-    for i, entry in enumerate(data):
-        if not isinstance(entry, dict):
-            raise ValueError(f"Playbook entry {i} must be an object")
-        tool_name = entry.get("tool_name") or entry.get("name")
-        if not isinstance(tool_name, str) or not tool_name:
-            raise ValueError(f"Playbook entry {i} missing tool_name")
-        arguments = entry.get("arguments", {})
-        if arguments is None:
-            arguments = {}
-        if not isinstance(arguments, dict):
-            raise ValueError(f"Playbook entry {i} arguments must be an object")
-        normalized.append(
-            {
-                "id": entry.get("id") if isinstance(entry.get("id"), str) else None,
-                "tool_name": tool_name,
-                "arguments": arguments,
-            }
-        )
-    return normalized
+    return [_normalize_playbook_entry(i, entry) for i, entry in enumerate(data)]
 
 
 def _simplify_tool(tool: Tool) -> dict[str, Any]:
@@ -107,19 +179,24 @@ def _simplify_tool(tool: Tool) -> dict[str, Any]:
     return payload
 
 
+@functools.cache
+def _content_adapter() -> TypeAdapter[list[Any]]:
+    """TypeAdapter for ``CallToolResult.content``, built on first use."""
+    from mcp.types import CallToolResult
+    from pydantic import TypeAdapter
+
+    # Reuse the field's own annotation so this follows the installed mcp version.
+    return TypeAdapter(CallToolResult.model_fields["content"].annotation)
+
+
 def _simplify_call_tool_result(result: CallToolResult) -> dict[str, Any]:
-    content: list[dict[str, Any]] = []
-    for block in result.content:
-        if hasattr(block, "model_dump"):
-            content.append(
-                block.model_dump(
-                    mode="json",
-                    exclude_none=True,
-                    exclude={"meta", "annotations"},
-                )
-            )
-        else:  # pragma: no cover
-            content.append({"type": getattr(block, "type", "unknown"), "text": str(block)})
+    # One pydantic-core pass over the whole list instead of a model_dump per block.
+    content = _content_adapter().dump_python(
+        result.content,
+        mode="json",
+        exclude_none=True,
+        exclude={"__all__": {"meta", "annotations"}},
+    )
 
     return {
         "content": content,
@@ -135,8 +212,14 @@ async def _record(
     output_dir: Path,
     playbook_path: Path | None,
 ) -> None:
+    from mcp.client.session import ClientSession
+    from mcp.client.stdio import StdioServerParameters, stdio_client
+    from mcp.types import CallToolResult
+
+    from mantora.mcp.trace_sanitizer import sanitize_trace_payload
+
     project_root = Path(__file__).parent.parent
-    schema = _load_schema(project_root)
+    validator = _build_validator(_load_schema(project_root))
 
     out_root = output_dir / target_type
     traces_dir = out_root / "traces"
@@ -154,43 +237,55 @@ async def _record(
                     "tools": [_simplify_tool(t) for t in list_tools_result.tools],
                 }
             )
-            _validate_against_schema(schema=schema, instance=tools_payload)
+            _validate_against_schema(validator=validator, instance=tools_payload)
             _write_json(out_root / "tools.json", tools_payload)
 
             if playbook_path is None:
                 return
 
             playbook = _load_playbook(playbook_path)
-            for idx, step in enumerate(playbook, start=1):
-                tool_name = step["tool_name"]
-                arguments = step["arguments"]
-
-                call_result = await session.call_tool(tool_name, arguments)
-                if not isinstance(call_result, CallToolResult):  # pragma: no cover
-                    raise RuntimeError(f"Unexpected call_tool result type: {type(call_result)}")
-
-                is_error = bool(call_result.isError)
-                error_message: str | None = None
-                if is_error and call_result.content:
-                    first = call_result.content[0]
-                    text = getattr(first, "text", None)
-                    if isinstance(text, str) and text.strip():
-                        error_message = text.strip()
-
-                trace_payload = sanitize_trace_payload(
-                    {
-                        "version": 1,
-                        "tool_name": tool_name,
-                        "arguments": arguments,
-                        "result": _simplify_call_tool_result(call_result),
-                        "is_error": is_error,
-                        "error_message": error_message,
-                    }
-                )
-                _validate_against_schema(schema=schema, instance=trace_payload)
-
-                base = step.get("id") or f"{idx:02d}_{_slugify(tool_name)}"
-                _write_json(traces_dir / f"{base}.json", trace_payload)
+            # Trace files are written on worker threads so the next call_tool can start
+            # while the previous payload is serialized; all writes finish before returning.
+            writes: list[asyncio.Task[None]] = []
+            try:
+                for idx, step in enumerate(playbook, start=1):
+                    tool_name = step["tool_name"]
+                    arguments = step["arguments"]
+
+                    call_result = await session.call_tool(tool_name, arguments)
+                    if not isinstance(call_result, CallToolResult):  # pragma: no cover
+                        raise RuntimeError(f"Unexpected call_tool result type: {type(call_result)}")
+
+                    is_error = bool(call_result.isError)
+                    error_message: str | None = None
+                    if is_error and call_result.content:
+                        first = call_result.content[0]
+                        text = getattr(first, "text", None)
+                        if isinstance(text, str) and text.strip():
+                            error_message = text.strip()
+
+                    trace_payload = sanitize_trace_payload(
+                        {
+                            "version": 1,
+                            "tool_name": tool_name,
+                            "arguments": arguments,
+                            "result": _simplify_call_tool_result(call_result),
+                            "is_error": is_error,
+                            "error_message": error_message,
+                        }
+                    )
+                    _validate_against_schema(validator=validator, instance=trace_payload)
+
+                    base = step.get("id") or f"{idx:02d}_{_slugify(tool_name)}"
+                    writes.append(
+                        asyncio.create_task(
+                            asyncio.to_thread(
+                                _write_json, traces_dir / f"{base}.json", trace_payload
+                            )
+                        )
+                    )
+            finally:
+                await asyncio.gather(*writes)
 
 
 def main() -> None:
@@ -18,8 +18,6 @@ if src_path not in sys.path:
     sys.path.append(src_path)
 
 from mantora.config import load_proxy_config  # noqa: E402
-from mantora.mcp import MCPProxy, PolicyHooks  # noqa: E402
-from mantora.store.sqlite import SQLiteSessionStore  # noqa: E402
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
@@ -27,6 +25,10 @@ logger = logging.getLogger(__name__)
 
 async def main() -> None:
     """Run the proxy server."""
+    # Deferred so import-time cost of the MCP stack is paid only when the proxy runs.
+    from mantora.mcp import MCPProxy, PolicyHooks
+    from mantora.store.sqlite import SQLiteSessionStore
+
     # Load configuration
     config_path = None
     if len(sys.argv) > 1:
@@ -10,9 +10,10 @@ This script generates three distinct demo sessions to showcase Mantora v0 featur
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import sys
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from uuid import UUID, uuid4
 
@@ -31,12 +32,20 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _col(name: str, col_type: str) -> SchemaColumn:
+    """Return a shared SchemaColumn; it's frozen, so casts can reuse one instance."""
+    return SchemaColumn(name=name, type=col_type)
+
+
 async def create_compliance_session(proxy: MCPProxy) -> None:
     """Session 1: Showcases Blocker Modal and SQL Warnings."""
     logger.info("Creating 'Compliance & Safety' session...")
 
     session_id_str = proxy._session_tools.session_start("Compliance & Safety Audit")
     session_id = UUID(session_id_str)
+    # One clock read per session; offsets keep steps/casts in insertion order.
+    now = datetime.now(UTC)
 
     # Step 1: Broad SELECT (Warning: NO_LIMIT)
     logger.info("  - Step 1: Broad query warning")
@@ -44,7 +53,7 @@ async def create_compliance_session(proxy: MCPProxy) -> None:
     step_star = ObservedStep(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now,
         kind="tool_call",
         name="query",
         status="ok",
@@ -63,7 +72,7 @@ async def create_compliance_session(proxy: MCPProxy) -> None:
     step_delete = ObservedStep(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now + timedelta(milliseconds=1),
         kind="tool_call",
         name="query",
         status="error",
@@ -84,12 +93,14 @@ async def create_audit_session(proxy: MCPProxy) -> None:
 
     session_id_str = proxy._session_tools.session_start("Supply Chain Revenue Audit")
     session_id = UUID(session_id_str)
+    # One clock read per session; offsets keep steps/casts in insertion order.
+    now = datetime.now(UTC)
 
     # Step 1: List Tables (Low risk)
     step_list = ObservedStep(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now,
         kind="tool_call",
         name="list_tables",
         status="ok",
@@ -106,27 +117,23 @@ async def create_audit_session(proxy: MCPProxy) -> None:
 
     # Generate mock result data (subset of what mock server would return)
     columns = [
-        SchemaColumn(name="day", type="date"),
-        SchemaColumn(name="region", type="string"),
-        SchemaColumn(name="revenue", type="float"),
+        _col("day", "date"),
+        _col("region", "string"),
+        _col("revenue", "float"),
     ]
 
-    # Create 500 rows
-    rows = []
+    # Create 500 rows (day/region labels cycle, so format them once up front)
+    days = [f"2026-01-{d:02d}" for d in range(1, 31)]
     regions = ["East", "West", "North", "South"]
-    for i in range(500):
-        rows.append(
-            {
-                "day": f"2026-01-{i % 30 + 1:02d}",
-                "region": regions[i % 4],
-                "revenue": 1000.0 + (i * 10),
-            }
-        )
+    rows = [
+        {"day": days[i % 30], "region": regions[i % 4], "revenue": 1000.0 + (i * 10)}
+        for i in range(500)
+    ]
 
     step_query = ObservedStep(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now + timedelta(milliseconds=1),
         kind="tool_call",
         name="query",
         status="ok",
@@ -147,7 +154,7 @@ async def create_audit_session(proxy: MCPProxy) -> None:
     cast = TableCast(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now + timedelta(milliseconds=2),
         origin_step_id=step_query.id,
         title="Daily Sales Revenue (All Regions)",
         sql=sql_large,
@@ -165,12 +172,14 @@ async def create_strategy_session(proxy: MCPProxy) -> None:
 
     session_id_str = proxy._session_tools.session_start("Q1 Strategy Synchronization")
     session_id = UUID(session_id_str)
+    # One clock read per session; offsets keep steps/casts in insertion order.
+    now = datetime.now(UTC)
 
     # Step 1: Initial Context
     step_note = ObservedStep(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now,
         kind="note",
         name="user",
         status="ok",
@@ -193,7 +202,7 @@ async def create_strategy_session(proxy: MCPProxy) -> None:
     step_comp = ObservedStep(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now + timedelta(milliseconds=1),
         kind="tool_call",
         name="query",
         status="ok",
@@ -208,7 +217,7 @@ async def create_strategy_session(proxy: MCPProxy) -> None:
     cast = TableCast(
         id=uuid4(),
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=now + timedelta(milliseconds=2),
         origin_step_id=step_comp.id,
         title="North Region Month-over-Month",
         sql=sql_comp,
@@ -222,11 +231,11 @@ async def create_strategy_session(proxy: MCPProxy) -> None:
             }
         ],
         columns=[
-            SchemaColumn(name="region", type="string"),
-            SchemaColumn(name="month", type="string"),
-            SchemaColumn(name="total", type="integer"),
-            SchemaColumn(name="prior_month", type="integer"),
-            SchemaColumn(name="delta", type="float"),
+            _col("region", "string"),
+            _col("month", "string"),
+            _col("total", "integer"),
+            _col("prior_month", "integer"),
+            _col("delta", "float"),
         ],
         total_rows=1,
         truncated=False,
@@ -255,9 +264,11 @@ async def main() -> None:
     proxy = MCPProxy(config=config, store=store)
 
     try:
-        await create_compliance_session(proxy)
-        await create_audit_session(proxy)
-        await create_strategy_session(proxy)
+        # One transaction for all demo rows instead of a commit per insert.
+        with store.transaction():
+            await create_compliance_session(proxy)
+            await create_audit_session(proxy)
+            await create_strategy_session(proxy)
 
         logger.info("✅ Demo data setup complete!")
         logger.info("Created 3 sessions showcasing new v0 features.")
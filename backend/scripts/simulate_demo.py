@@ -10,8 +10,14 @@ and performing a sequence of actions to demonstrate:
 
 Usage:
     uv run python backend/scripts/simulate_demo.py
+    uv run python backend/scripts/simulate_demo.py --runs 5
+    python backend/scripts/simulate_demo.py --server-cmd python backend/scripts/run_proxy.py
+
+The proxy is spawned once and its MCP session is reused for every run, so the
+process start-up and ``initialize`` round-trip are paid a single time.
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -24,66 +30,91 @@ from mcp.client.stdio import stdio_client
 from mcp.types import TextContent
 
 
-async def run_live_demo() -> None:
-    print("🚀 Starting Live Demo Simulation...")
-
-    # Path to the proxy script
+def _default_server_cmd() -> list[str]:
     proxy_script = Path(__file__).parent / "run_proxy.py"
     config_path = Path(__file__).parent.parent.parent / "config.toml"
+    return ["uv", "run", "--project", "backend", "python", str(proxy_script), str(config_path)]
 
-    server_params = StdioServerParameters(
-        command="uv",
-        args=["run", "--project", "backend", "python", str(proxy_script), str(config_path)],
-        env=None,
-    )
+
+async def run_live_demo(*, server_cmd: list[str] | None = None, runs: int = 1) -> None:
+    print("🚀 Starting Live Demo Simulation...")
+
+    command = server_cmd or _default_server_cmd()
+    server_params = StdioServerParameters(command=command[0], args=command[1:], env=None)
 
     async with stdio_client(server_params) as (read, write), ClientSession(read, write) as session:
         await session.initialize()
 
-        # 1. Start Session
-        print("\n[Client] Starting session 'Live Security Demo'...")
-        result = await session.call_tool("session_start", arguments={"title": "Live Security Demo"})
-        content = result.content[0]
-        if isinstance(content, TextContent):
-            session_id = content.text
-            print(f"[Proxy] Session started: {session_id}")
-        else:
-            raise ValueError(f"Expected TextContent, got {type(content)}")
-
-        # 2. Trigger Warning (SELECT *)
-        print("\n[Client] Running broad query (should warn)...")
-        try:
-            # Using the 'query' tool (which the proxy forwards to mock-duckdb)
-            await session.call_tool(
-                "query", arguments={"sql": "SELECT * FROM sales_daily LIMIT 500"}
-            )
-            print("[Proxy] Query executed (check UI for 'NO_LIMIT' warning)")
-        except Exception as e:
-            print(f"[Proxy] Error: {e}")
-
-        # 3. Trigger Blocker (DELETE without WHERE)
-        print("\n[Client] Attempting dangerous DELETE (should BLOCK)...")
-        print("👉 Go to the Mantora UI now! You should see the Blocker Modal.")
-        try:
-            await session.call_tool("query", arguments={"sql": "DELETE FROM users"})
-            print("[Proxy] DELETE executed (User must have approved!)")
-        except Exception as e:
-            print(f"[Proxy] DELETE failed/blocked: {e}")
-
-        # 4. Cast Table
-        print("\n[Client] Casting generic table...")
-        await session.call_tool(
-            "cast_table",
-            arguments={
-                "title": "Demo Results",
-                "sql": "SELECT 1 as id, 'test' as name",
-                "rows": [{"id": 1, "name": "test"}],
-            },
-        )
-        print("[Proxy] Table cast created.")
+        for run in range(1, runs + 1):
+            if runs > 1:
+                print(f"\n=== Run {run}/{runs} ===")
+            await _run_scenario(session)
 
         print("\n✅ Simulation complete.")
 
 
+async def _run_scenario(session: ClientSession) -> None:
+    """Drive one demo scenario over an already-initialized proxy session."""
+    # 1. Start Session
+    print("\n[Client] Starting session 'Live Security Demo'...")
+    result = await session.call_tool("session_start", arguments={"title": "Live Security Demo"})
+    content = result.content[0]
+    if isinstance(content, TextContent):
+        session_id = content.text
+        print(f"[Proxy] Session started: {session_id}")
+    else:
+        raise ValueError(f"Expected TextContent, got {type(content)}")
+
+    # 2. Trigger Warning (SELECT *)
+    print("\n[Client] Running broad query (should warn)...")
+    try:
+        # Using the 'query' tool (which the proxy forwards to mock-duckdb)
+        await session.call_tool("query", arguments={"sql": "SELECT * FROM sales_daily LIMIT 500"})
+        print("[Proxy] Query executed (check UI for 'NO_LIMIT' warning)")
+    except Exception as e:
+        print(f"[Proxy] Error: {e}")
+
+    # 3. Trigger Blocker (DELETE without WHERE)
+    print("\n[Client] Attempting dangerous DELETE (should BLOCK)...")
+    print("👉 Go to the Mantora UI now! You should see the Blocker Modal.")
+    try:
+        await session.call_tool("query", arguments={"sql": "DELETE FROM users"})
+        print("[Proxy] DELETE executed (User must have approved!)")
+    except Exception as e:
+        print(f"[Proxy] DELETE failed/blocked: {e}")
+
+    # 4. Cast Table
+    print("\n[Client] Casting generic table...")
+    await session.call_tool(
+        "cast_table",
+        arguments={
+            "title": "Demo Results",
+            "sql": "SELECT 1 as id, 'test' as name",
+            "rows": [{"id": 1, "name": "test"}],
+        },
+    )
+    print("[Proxy] Table cast created.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--server-cmd",
+        nargs="+",
+        default=None,
+        help="Proxy command (stdio). Defaults to `uv run ... run_proxy.py config.toml`.",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=1,
+        help="Number of times to replay the scenario over the same proxy session.",
+    )
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    asyncio.run(run_live_demo(server_cmd=args.server_cmd, runs=args.runs))
+
+
 if __name__ == "__main__":
-    asyncio.run(run_live_demo())
+    main()
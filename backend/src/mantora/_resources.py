@@ -0,0 +1,32 @@
+"""Locate data directories shipped inside the ``mantora`` package."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def bundled_dir(name: str) -> Path | None:
+    """Return the on-disk package data directory ``name`` (e.g. ``_static``), if present."""
+    bundled_path = _PACKAGE_DIR / name
+    if bundled_path.is_dir():
+        return bundled_path
+
+    # Frozen builds may not lay the package out on disk next to this module.
+    if not getattr(sys, "frozen", False):
+        return None
+
+    from importlib import resources
+
+    try:
+        bundled_root = resources.files("mantora") / name
+    except Exception:
+        return None
+
+    # Only an on-disk directory can be served/read as a Path; zip-backed
+    # Traversables are rejected without materializing them.
+    if isinstance(bundled_root, Path) and bundled_root.is_dir():
+        return bundled_root
+    return None
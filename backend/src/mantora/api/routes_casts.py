@@ -3,23 +3,18 @@
 from __future__ import annotations
 
 from typing import Any
-from typing import cast as typing_cast
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 
+from mantora.api import get_store
 from mantora.casts.models import Cast, TableCast
 from mantora.export import export_cast_json, export_cast_md
-from mantora.store.interface import SessionStore
 
 router = APIRouter(prefix="/api")
 
 
-def _get_store(request: Request) -> SessionStore:
-    return typing_cast(SessionStore, request.app.state.store)
-
-
 class CastResponse(BaseModel):
     """Response model for a single cast."""
 
@@ -40,41 +35,31 @@ class CastResponse(BaseModel):
 
 
 def _cast_to_response(c: Cast) -> CastResponse:
-    """Convert a Cast model to API response."""
-    origin_step_ids = [str(sid) for sid in c.origin_step_ids]
-
+    """Convert a Cast model to API response.
+
+    Uses ``model_construct`` because every field is derived from an already-validated
+    Cast; revalidating per cast only adds cost on large ``list_casts`` responses.
+    """
+    fields: dict[str, Any] = {
+        "id": str(c.id),
+        "session_id": str(c.session_id),
+        "created_at": c.created_at.isoformat(),
+        "kind": c.kind,
+        "title": c.title,
+        "origin_step_id": str(c.origin_step_id),
+        "origin_step_ids": [str(sid) for sid in c.origin_step_ids],
+    }
     if isinstance(c, TableCast):
-        return CastResponse(
-            id=str(c.id),
-            session_id=str(c.session_id),
-            created_at=c.created_at.isoformat(),
-            kind=c.kind,
-            title=c.title,
-            origin_step_id=str(c.origin_step_id),
-            origin_step_ids=origin_step_ids,
-            sql=c.sql,
-            rows=c.rows,
-            total_rows=c.total_rows,
-            truncated=c.truncated,
-        )
-    else:
-        # Fallback for unsupported cast kinds
-        return CastResponse(
-            id=str(c.id),
-            session_id=str(c.session_id),
-            created_at=c.created_at.isoformat(),
-            kind=c.kind,
-            title=c.title,
-            origin_step_id=str(c.origin_step_id),
-            origin_step_ids=origin_step_ids,
-        )
+        fields.update(sql=c.sql, rows=c.rows, total_rows=c.total_rows, truncated=c.truncated)
+    # Other cast kinds keep the table-specific defaults.
+    return CastResponse.model_construct(**fields)
 
 
 @router.get("/sessions/{session_id}/casts", response_model=list[CastResponse])
 def list_casts(session_id: UUID, request: Request) -> list[CastResponse]:
     """List all casts for a session."""
-    store = _get_store(request)
-    if store.get_session(session_id) is None:
+    store = get_store(request)
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
     casts = store.list_casts(session_id)
     return [_cast_to_response(c) for c in casts]
@@ -83,7 +68,7 @@ def list_casts(session_id: UUID, request: Request) -> list[CastResponse]:
 @router.get("/casts/{cast_id}", response_model=CastResponse)
 def get_cast(cast_id: UUID, request: Request) -> CastResponse:
     """Get a single cast by ID."""
-    store = _get_store(request)
+    store = get_store(request)
     c = store.get_cast(cast_id)
     if c is None:
         raise HTTPException(status_code=404, detail="cast not found")
@@ -92,7 +77,7 @@ def get_cast(cast_id: UUID, request: Request) -> CastResponse:
 
 @router.get("/casts/{cast_id}/export.md")
 def get_cast_export_md(cast_id: UUID, request: Request) -> Response:
-    store = _get_store(request)
+    store = get_store(request)
     settings = request.app.state.settings
 
     if store.get_cast(cast_id) is None:
@@ -108,7 +93,7 @@ def get_cast_export_md(cast_id: UUID, request: Request) -> Response:
 
 @router.get("/casts/{cast_id}/export.json")
 def get_cast_export_json(cast_id: UUID, request: Request) -> Response:
-    store = _get_store(request)
+    store = get_store(request)
     settings = request.app.state.settings
 
     if store.get_cast(cast_id) is None:
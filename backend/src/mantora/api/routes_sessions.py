@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import os
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Literal, cast
-from uuid import UUID, uuid4
+from typing import Literal
+from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request, Response
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
 
+from mantora.api import get_store
 from mantora.context import ContextResolver
-from mantora.export import export_session_json, export_session_md
+from mantora.export import export_session_md, iter_export_session_json
 from mantora.export.receipt import ReceiptResult, generate_pr_receipt
 from mantora.models.events import (
     AddStepRequest,
@@ -19,17 +24,41 @@ from mantora.models.events import (
     ObservedStep,
     Session,
     SessionContext,
+    SessionListRow,
     SessionSummary,
     TruncatedText,
 )
+from mantora.models.ids import timestamped_uuid7
 from mantora.policy.truncation import cap_text
-from mantora.store.interface import SessionStore
 
 router = APIRouter(prefix="/api")
 
-
-def _get_store(request: Request) -> SessionStore:
-    return cast(SessionStore, request.app.state.store)
+_RESOLVER = ContextResolver()
+# Resolved git context per real repo path: (expires_at, context). Short TTL so a
+# `git init` or branch switch shows up without restarting the app.
+_REPO_CONTEXT_TTL_S = 60.0
+_REPO_CONTEXT_CACHE_MAX = 256
+_repo_context_cache: dict[str, tuple[float, SessionContext | None]] = {}
+# Sync routes run in FastAPI's threadpool, so cache reads and writes are serialized.
+_repo_context_lock = threading.Lock()
+
+
+def _resolve_repo_context(raw: str) -> SessionContext | None:
+    key = os.path.realpath(raw)
+    now = time.monotonic()
+    with _repo_context_lock:
+        cached = _repo_context_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    # Resolve outside the lock: it shells out to git and must not stall other requests.
+    resolved = _RESOLVER.resolve(project_root=Path(key), forced_source="ui")
+    with _repo_context_lock:
+        _repo_context_cache.pop(key, None)
+        if len(_repo_context_cache) >= _REPO_CONTEXT_CACHE_MAX:
+            _repo_context_cache.pop(next(iter(_repo_context_cache)), None)
+        _repo_context_cache[key] = (now + _REPO_CONTEXT_TTL_S, resolved)
+    return resolved
 
 
 def _normalize_tag(tag: str | None) -> str | None:
@@ -42,6 +71,17 @@ def _normalize_tag(tag: str | None) -> str | None:
     return capped
 
 
+# List endpoints serialize store models straight to JSON. Returning a Response skips
+# FastAPI's re-validation of every item against response_model, which stays declared
+# for the OpenAPI schema.
+_SESSION_ROWS_ADAPTER = TypeAdapter(list[SessionListRow])
+_STEPS_ADAPTER = TypeAdapter(list[ObservedStep])
+
+
+def _json_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
 class UpdateSessionRequest(BaseModel):
     tag: str | None = Field(default=None, max_length=200)
 
@@ -50,67 +90,16 @@ class UpdateSessionRepoRootRequest(BaseModel):
     repo_root: str | None = Field(default=None, max_length=2000)
 
 
-def _compute_summary(steps: list[ObservedStep]) -> SessionSummary:
-    """Compute summary statistics for a session.
-
-    Args:
-        steps: List of steps in the session.
-
-    Returns:
-        SessionSummary with aggregated counts.
-    """
-    tool_calls = 0
-    queries = 0
-    casts = 0
-    blocks = 0
-    errors = 0
-    warnings_count = 0
-
-    # Track allowed decisions to deduct from blocks
-    allowed_decisions = 0
-
-    for step in steps:
-        if step.kind == "tool_call":
-            tool_calls += 1
-            # Count queries and casts based on tool name
-            if step.name == "query" or step.name == "cast_table":
-                queries += 1
-            if step.name in ("cast_table", "cast_chart", "cast_note"):
-                casts += 1
-        elif step.kind == "blocker":
-            blocks += 1
-        elif step.kind == "blocker_decision" and step.decision == "allowed":
-            allowed_decisions += 1
-
-        if step.status == "error":
-            errors += 1
-
-        if step.warnings:
-            warnings_count += len(step.warnings)
-
-    # Net blocks (prevent specific edge cases where allowed > blocked)
-    blocks = max(0, blocks - allowed_decisions)
-
-    return SessionSummary(
-        tool_calls=tool_calls,
-        queries=queries,
-        casts=casts,
-        blocks=blocks,
-        errors=errors,
-        warnings=warnings_count,
-    )
-
-
 @router.post("/sessions", response_model=CreateSessionResponse)
 def create_session(payload: CreateSessionRequest, request: Request) -> CreateSessionResponse:
-    store = _get_store(request)
+    store = get_store(request)
     normalized_tag = _normalize_tag(payload.tag)
     context = SessionContext(tag=normalized_tag) if normalized_tag is not None else None
     session = store.create_session(title=payload.title, context=context)
     return CreateSessionResponse(session=session)
 
 
-@router.get("/sessions", response_model=list[Session])
+@router.get("/sessions", response_model=list[SessionListRow])
 def list_sessions(
     request: Request,
     q: str | None = None,
@@ -120,24 +109,23 @@ def list_sessions(
     since: datetime | None = None,
     has_warnings: bool | None = None,
     has_blocks: bool | None = None,
-) -> list[Session]:
-    store = _get_store(request)
-    return list(
-        store.list_sessions(
-            q=q,
-            tag=tag,
-            repo_name=repo_name,
-            branch=branch,
-            since=since,
-            has_warnings=has_warnings,
-            has_blocks=has_blocks,
-        )
+) -> Response:
+    store = get_store(request)
+    rows = store.list_session_rows(
+        q=q,
+        tag=tag,
+        repo_name=repo_name,
+        branch=branch,
+        since=since,
+        has_warnings=has_warnings,
+        has_blocks=has_blocks,
     )
+    return _json_response(_SESSION_ROWS_ADAPTER.dump_json(list(rows)))
 
 
 @router.get("/sessions/{session_id}", response_model=Session)
 def get_session(session_id: UUID, request: Request) -> Session:
-    store = _get_store(request)
+    store = get_store(request)
     session = store.get_session(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="session not found")
@@ -146,7 +134,7 @@ def get_session(session_id: UUID, request: Request) -> Session:
 
 @router.patch("/sessions/{session_id}", response_model=Session)
 def update_session(session_id: UUID, payload: UpdateSessionRequest, request: Request) -> Session:
-    store = _get_store(request)
+    store = get_store(request)
     normalized_tag = _normalize_tag(payload.tag)
     session = store.update_session_tag(session_id, tag=normalized_tag)
     if session is None:
@@ -158,7 +146,7 @@ def update_session(session_id: UUID, payload: UpdateSessionRequest, request: Req
 def update_session_repo_root(
     session_id: UUID, payload: UpdateSessionRepoRootRequest, request: Request
 ) -> Session:
-    store = _get_store(request)
+    store = get_store(request)
     session = store.get_session(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="session not found")
@@ -172,19 +160,20 @@ def update_session_repo_root(
     raw = payload.repo_root.strip() if isinstance(payload.repo_root, str) else ""
     if not raw:
         store.set_client_default_repo_root(client_id, repo_root=None)
-        updated_context = SessionContext(tag=existing_tag) if existing_tag else None
+        # existing_tag was validated when it was stored.
+        updated_context = SessionContext.model_construct(tag=existing_tag) if existing_tag else None
         updated = store.update_session_context(session_id, context=updated_context)
         if updated is None:
             raise HTTPException(status_code=404, detail="session not found")
         return updated
 
-    resolved = ContextResolver().resolve(project_root=Path(raw), forced_source="ui")
+    resolved = _resolve_repo_context(raw)
     if resolved is None or resolved.repo_root is None:
         raise HTTPException(status_code=400, detail="repo_root is not a git repository")
 
     store.set_client_default_repo_root(client_id, repo_root=resolved.repo_root)
 
-    merged = SessionContext(**resolved.model_dump(exclude={"tag"}), tag=existing_tag)
+    merged = resolved.model_copy(update={"tag": existing_tag})
     updated = store.update_session_context(session_id, context=merged)
     if updated is None:
         raise HTTPException(status_code=404, detail="session not found")
@@ -193,70 +182,44 @@ def update_session_repo_root(
 
 @router.delete("/sessions/{session_id}", status_code=204)
 def delete_session(session_id: UUID, request: Request) -> None:
-    store = _get_store(request)
+    store = get_store(request)
     deleted = store.delete_session(session_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="session not found")
 
 
 @router.get("/sessions/{session_id}/steps", response_model=list[ObservedStep])
-def list_steps(session_id: UUID, request: Request) -> list[ObservedStep]:
-    store = _get_store(request)
-    if store.get_session(session_id) is None:
+def list_steps(session_id: UUID, request: Request) -> Response:
+    store = get_store(request)
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
-    return list(store.list_steps(session_id))
+    return _json_response(_STEPS_ADAPTER.dump_json(list(store.list_steps(session_id))))
 
 
 @router.get("/sessions/{session_id}/summary", response_model=SessionSummary)
 def get_session_summary(session_id: UUID, request: Request) -> SessionSummary:
     """Get aggregated summary counts for a session."""
-    store = _get_store(request)
-    if store.get_session(session_id) is None:
+    store = get_store(request)
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
-    steps = list(store.list_steps(session_id))
-    return _compute_summary(steps)
+    return store.get_session_summary(session_id)
 
 
 @router.get("/sessions/{session_id}/rollup", response_model=SessionSummary)
 def get_session_rollup(session_id: UUID, request: Request) -> SessionSummary:
     """Get an enriched rollup for detail views (may perform heavier aggregation)."""
-    store = _get_store(request)
-    if store.get_session(session_id) is None:
+    store = get_store(request)
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
-    steps = list(store.list_steps(session_id))
-    summary = _compute_summary(steps)
-
-    duration_ms_total = sum(s.duration_ms or 0 for s in steps)
-    tables: set[str] = set()
-    for step in steps:
-        if step.tables_touched:
-            tables.update(step.tables_touched)
-
-    status: Literal["clean", "warnings", "blocked"]
-    if summary.blocks > 0:
-        status = "blocked"
-    elif summary.warnings > 0:
-        status = "warnings"
-    else:
-        status = "clean"
-
-    payload = summary.model_dump()
-    payload.update(
-        {
-            "duration_ms_total": duration_ms_total,
-            "status": status,
-            "tables_touched": sorted(tables),
-        }
-    )
-    return SessionSummary(**payload)
+    return store.get_session_rollup(session_id)
 
 
 @router.post("/sessions/{session_id}/steps", response_model=AddStepResponse)
 def add_step(session_id: UUID, payload: AddStepRequest, request: Request) -> AddStepResponse:
-    store = _get_store(request)
+    store = get_store(request)
     settings = request.app.state.settings
 
-    if store.get_session(session_id) is None:
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
 
     sql: TruncatedText | None = None
@@ -272,10 +235,11 @@ def add_step(session_id: UUID, payload: AddStepRequest, request: Request) -> Add
         )
         preview = TruncatedText(text=capped, truncated=truncated)
 
+    created_at, step_id = timestamped_uuid7()
     step = ObservedStep(
-        id=uuid4(),
+        id=step_id,
         session_id=session_id,
-        created_at=datetime.now(UTC),
+        created_at=created_at,
         kind=payload.kind,
         name=payload.name,
         status=payload.status,
@@ -318,10 +282,10 @@ class ReceiptRequest(BaseModel):
 def post_session_receipt(
     session_id: UUID, payload: ReceiptRequest, request: Request
 ) -> ReceiptResult:
-    store = _get_store(request)
+    store = get_store(request)
     settings = request.app.state.settings
 
-    if store.get_session(session_id) is None:
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
 
     return generate_pr_receipt(
@@ -334,16 +298,16 @@ def post_session_receipt(
 
 
 @router.get("/sessions/{session_id}/export.json")
-def get_session_export_json(session_id: UUID, request: Request) -> Response:
-    store = _get_store(request)
+def get_session_export_json(session_id: UUID, request: Request) -> StreamingResponse:
+    store = get_store(request)
     settings = request.app.state.settings
 
-    if store.get_session(session_id) is None:
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
 
-    content = export_session_json(store=store, session_id=session_id, caps=settings.caps)
-    return Response(
-        content=content,
+    chunks = iter_export_session_json(store=store, session_id=session_id, caps=settings.caps)
+    return StreamingResponse(
+        (chunk.encode() for chunk in chunks),
         media_type="application/json",
         headers={"Content-Disposition": f'attachment; filename="session-{session_id}.json"'},
     )
@@ -351,10 +315,10 @@ def get_session_export_json(session_id: UUID, request: Request) -> Response:
 
 @router.get("/sessions/{session_id}/export.md")
 def get_session_export_md(session_id: UUID, request: Request) -> Response:
-    store = _get_store(request)
+    store = get_store(request)
     settings = request.app.state.settings
 
-    if store.get_session(session_id) is None:
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
 
     content = export_session_md(store=store, session_id=session_id, caps=settings.caps)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from fastapi import APIRouter, Request
 
 from mantora.config.settings import PolicyConfig
@@ -12,8 +14,30 @@ router = APIRouter(prefix="/api", tags=["settings"])
 
 def _get_active_rules(policy: PolicyConfig) -> list[PolicyRule]:
     """Derive active policy rules from policy config."""
-    if not policy.protective_mode:
-        return []
+    return list(
+        _active_rules_for(
+            protective_mode=policy.protective_mode,
+            block_ddl=policy.block_ddl,
+            block_dml=policy.block_dml,
+            block_multi_statement=policy.block_multi_statement,
+            block_delete_without_where=policy.block_delete_without_where,
+        )
+    )
+
+
+@functools.cache
+def _active_rules_for(
+    *,
+    protective_mode: bool,
+    block_ddl: bool,
+    block_dml: bool,
+    block_multi_statement: bool,
+    block_delete_without_where: bool,
+) -> tuple[PolicyRule, ...]:
+    # Keyed on the policy flags (PolicyConfig is mutable, so not hashable itself);
+    # there are at most 32 combinations.
+    if not protective_mode:
+        return ()
 
     rules: list[PolicyRule] = []
     rules.append(
@@ -30,7 +54,7 @@ def _get_active_rules(policy: PolicyConfig) -> list[PolicyRule]:
             description="Blocks destructive SQL operations detected by conservative heuristics",
         )
     )
-    if policy.block_ddl:
+    if block_ddl:
         rules.append(
             PolicyRule(
                 id="block_ddl",
@@ -38,7 +62,7 @@ def _get_active_rules(policy: PolicyConfig) -> list[PolicyRule]:
                 description="Blocks CREATE, ALTER, DROP operations",
             )
         )
-    if policy.block_dml:
+    if block_dml:
         rules.append(
             PolicyRule(
                 id="block_dml",
@@ -46,7 +70,7 @@ def _get_active_rules(policy: PolicyConfig) -> list[PolicyRule]:
                 description="Blocks INSERT, UPDATE, DELETE operations",
             )
         )
-    if policy.block_multi_statement:
+    if block_multi_statement:
         rules.append(
             PolicyRule(
                 id="block_multi_statement",
@@ -54,7 +78,7 @@ def _get_active_rules(policy: PolicyConfig) -> list[PolicyRule]:
                 description="Blocks queries containing multiple SQL statements",
             )
         )
-    if policy.block_delete_without_where:
+    if block_delete_without_where:
         rules.append(
             PolicyRule(
                 id="block_delete_without_where",
@@ -62,7 +86,7 @@ def _get_active_rules(policy: PolicyConfig) -> list[PolicyRule]:
                 description="Blocks DELETE statements that lack a WHERE clause",
             )
         )
-    return rules
+    return tuple(rules)
 
 
 @router.get("/settings")
@@ -1,76 +1,82 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections.abc import AsyncIterator
 from contextlib import suppress
-from typing import cast
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
+from mantora.api import get_store
+from mantora.models.events import ObservedStep
 from mantora.store.interface import SessionStore
 
 router = APIRouter(prefix="/api")
 
 
-def _get_store(request: Request) -> SessionStore:
-    return cast(SessionStore, request.app.state.store)
+_STEP_ADAPTER = TypeAdapter(ObservedStep)
+_POLL_INTERVAL_S = 0.5
+_PING_INTERVAL_S = 15.0
+_BATCH_SIZE = 100
 
 
-def _encode_sse(*, event: str, data: str) -> bytes:
-    return f"event: {event}\ndata: {data}\n\n".encode()
+def _initial_cursor(store: SessionStore, session_id: UUID) -> tuple[datetime, UUID] | None:
+    """Return the ``(created_at, id)`` key of the newest step, or None if there are none."""
+    last_active = store.get_last_active_at(session_id)
+    if last_active is None:
+        return None
+    # Steps can share a timestamp; take the highest id among the newest ones.
+    newest = store.list_steps_after(
+        session_id, cursor=(last_active, UUID(int=0)), limit=_BATCH_SIZE
+    )
+    if not newest:
+        return (last_active, UUID(int=0))
+    return (newest[-1].created_at, newest[-1].id)
+
+
+def _encode_sse(*, event: str, data: bytes) -> bytes:
+    # ``data`` is already-encoded single-line JSON, so frame it without a str round trip.
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
 
 
 @router.get("/sessions/{session_id}/stream")
 async def stream_session(session_id: UUID, request: Request) -> StreamingResponse:
-    store = _get_store(request)
+    store = get_store(request)
 
-    if store.get_session(session_id) is None:
+    if not store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="session not found")
 
-    queue = store.get_step_queue(session_id)
-    if queue is None:
+    notifier = store.get_step_notifier(session_id)
+    if notifier is None:
         raise HTTPException(status_code=404, detail="session not found")
 
     async def generator() -> AsyncIterator[bytes]:
         yield b": connected\n\n"
 
-        # We need to track the last seen timestamp (or step count) to poll for new items.
-        # However, since we might miss steps that happen *while* connecting if we
-        # blindly select "from now", a safer bet is to rely on a high-water mark.
-        # But `list_steps` is usually called by the FE on load. So we just need "new" stuff.
-        # Let's count current steps as a high-water mark.
-
-        # Get initial high water mark
-        existing_steps = store.list_steps(session_id)
-        last_seen_count = len(existing_steps)
-
-        while True:
-            # Poll interval
-            await asyncio.sleep(0.5)
-
-            # Force SQLite to check filesystem for changes (helps with Docker volume sync)
-            with suppress(Exception):
-                # This is a lightweight op that forces a check of the -wal file
-                if hasattr(store, "_conn"):
-                    store._conn.execute("PRAGMA schema_version")
-
-            # Check for new steps
-            # Ideally we'd have a more efficient way than listing all,
-            # but for the SQLite demo this is fine.
-            current_steps = store.list_steps(session_id)
-
-            if len(current_steps) > last_seen_count:
-                # We have new steps!
-                new_items = current_steps[last_seen_count:]
-                for step in new_items:
-                    payload = json.dumps(step.model_dump(mode="json"), separators=(",", ":"))
-                    yield _encode_sse(event="step", data=payload)
-
-                last_seen_count = len(current_steps)
-            else:
-                yield b": ping\n\n"
+        # The client loads existing steps via list_steps; only stream steps after the
+        # newest one present at connect time.
+        cursor = _initial_cursor(store, session_id)
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+
+        with notifier.subscribe() as changed:
+            while True:
+                # The timeout picks up steps written by other processes (e.g. the MCP proxy).
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(changed.wait(), timeout=_POLL_INTERVAL_S)
+                changed.clear()
+
+                new_steps = store.list_steps_after(session_id, cursor=cursor, limit=_BATCH_SIZE)
+                for step in new_steps:
+                    yield _encode_sse(event="step", data=_STEP_ADAPTER.dump_json(step))
+                if new_steps:
+                    cursor = (new_steps[-1].created_at, new_steps[-1].id)
+                    last_sent = loop.time()
+                elif loop.time() - last_sent >= _PING_INTERVAL_S:
+                    yield b": ping\n\n"
+                    last_sent = loop.time()
 
     return StreamingResponse(generator(), media_type="text/event-stream")
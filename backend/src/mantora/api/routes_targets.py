@@ -2,22 +2,17 @@
 
 from __future__ import annotations
 
-from typing import cast
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 
+from mantora.api import get_store
 from mantora.models.targets import Target
-from mantora.store.interface import SessionStore
 
 router = APIRouter(prefix="/api/targets", tags=["targets"])
 
 
-def _get_store(request: Request) -> SessionStore:
-    return cast(SessionStore, request.app.state.store)
-
-
 class CreateTargetRequest(BaseModel):
     """Request to create a new target."""
 
@@ -39,7 +34,7 @@ class UpdateTargetRequest(BaseModel):
 @router.post("", response_model=Target, status_code=201)
 def create_target(req: CreateTargetRequest, request: Request) -> Target:
     """Create a new target configuration."""
-    store = _get_store(request)
+    store = get_store(request)
     target = store.create_target(
         name=req.name,
         type=req.type,
@@ -52,21 +47,21 @@ def create_target(req: CreateTargetRequest, request: Request) -> Target:
 @router.get("", response_model=list[Target])
 def list_targets(request: Request) -> list[Target]:
     """List all configured targets."""
-    store = _get_store(request)
+    store = get_store(request)
     return list(store.list_targets())
 
 
 @router.get("/active", response_model=Target | None)
 def get_active_target(request: Request) -> Target | None:
     """Get the currently active target."""
-    store = _get_store(request)
+    store = get_store(request)
     return store.get_active_target()
 
 
 @router.get("/{target_id}", response_model=Target)
 def get_target(target_id: UUID, request: Request) -> Target:
     """Get a specific target by ID."""
-    store = _get_store(request)
+    store = get_store(request)
     target = store.get_target(target_id)
     if target is None:
         raise HTTPException(status_code=404, detail=f"Target {target_id} not found")
@@ -76,7 +71,7 @@ def get_target(target_id: UUID, request: Request) -> Target:
 @router.put("/{target_id}", response_model=Target)
 def update_target(target_id: UUID, req: UpdateTargetRequest, request: Request) -> Target:
     """Update a target's configuration."""
-    store = _get_store(request)
+    store = get_store(request)
     target = store.update_target(
         target_id,
         name=req.name,
@@ -92,7 +87,7 @@ def update_target(target_id: UUID, req: UpdateTargetRequest, request: Request) -
 @router.delete("/{target_id}", status_code=204)
 def delete_target(target_id: UUID, request: Request) -> None:
     """Delete a target."""
-    store = _get_store(request)
+    store = get_store(request)
     deleted = store.delete_target(target_id)
     if not deleted:
         raise HTTPException(status_code=404, detail=f"Target {target_id} not found")
@@ -101,7 +96,7 @@ def delete_target(target_id: UUID, request: Request) -> None:
 @router.post("/{target_id}/activate", response_model=Target)
 def activate_target(target_id: UUID, request: Request) -> Target:
     """Set a target as active, deactivating all others."""
-    store = _get_store(request)
+    store = get_store(request)
     target = store.set_active_target(target_id)
     if target is None:
         raise HTTPException(status_code=404, detail=f"Target {target_id} not found")
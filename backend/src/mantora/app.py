@@ -1,18 +1,18 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
 import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from importlib import resources
 from pathlib import Path
-from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
+from mantora._resources import bundled_dir
 from mantora.api.routes_casts import router as casts_router
 from mantora.api.routes_pending import router as pending_router
 from mantora.api.routes_sessions import router as sessions_router
@@ -20,43 +20,72 @@ from mantora.api.routes_settings import router as settings_router
 from mantora.api.routes_stream import router as stream_router
 from mantora.api.routes_targets import router as targets_router
 from mantora.config.settings import Settings, StorageBackend
+from mantora.store.interface import SessionStore
 from mantora.store.memory import MemorySessionStore
 from mantora.store.retention import prune_sqlite_sessions
 from mantora.store.sqlite import SQLiteSessionStore
 
+_API_PREFIX = "api/"
+_PACKAGE_DIR = Path(__file__).resolve().parent
+# Frontend build output when running from a source checkout.
+_DEV_FRONTEND_DIST = _PACKAGE_DIR.parents[2] / "frontend" / "dist"
 
+
+@functools.cache
 def get_bundled_frontend_path() -> Path | None:
     """Resolve bundled frontend assets inside the package."""
-    try:
-        bundled_root = resources.files("mantora") / "_static"
-    except Exception:
-        return None
-
-    bundled_path = Path(str(bundled_root))
-    if bundled_path.is_dir():
-        return bundled_path
-    return None
+    return bundled_dir("_static")
 
 
 def get_frontend_dist_path() -> Path | None:
-    """Locate frontend assets for serving."""
+    """Locate frontend assets for serving.
+
+    The lookup is cached per ``MANTORA_FRONTEND_DIST`` value; call
+    ``_resolve_frontend_dist.cache_clear()`` if the directories change at runtime.
+    """
+    return _resolve_frontend_dist(os.environ.get("MANTORA_FRONTEND_DIST"))
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_frontend_dist(frontend_dist_env: str | None) -> Path | None:
     logger = logging.getLogger("mantora")
 
-    frontend_dist_env = os.environ.get("MANTORA_FRONTEND_DIST")
     if frontend_dist_env:
         env_path = Path(frontend_dist_env)
         if env_path.is_dir():
             return env_path
         logger.warning("MANTORA_FRONTEND_DIST set but path not found: %s", env_path)
 
-    current = Path(__file__).resolve()
-    dev_path = current.parents[3] / "frontend" / "dist"
-    if dev_path.is_dir():
-        return dev_path
+    if _DEV_FRONTEND_DIST.is_dir():
+        return _DEV_FRONTEND_DIST
 
     return get_bundled_frontend_path()
 
 
+def _build_store(settings: Settings, *, prune: bool) -> SessionStore:
+    """Construct the configured session store, optionally pruning old SQLite data."""
+    if settings.storage.backend == StorageBackend.memory:
+        return MemorySessionStore()
+
+    sqlite_path = settings.storage.sqlite_path
+    retention_days = settings.limits.retention_days
+    max_db_bytes = settings.limits.max_db_bytes
+    store = SQLiteSessionStore(
+        sqlite_path,
+        retention_days=retention_days,
+        max_db_bytes=max_db_bytes,
+    )
+
+    if prune and (retention_days > 0 or max_db_bytes > 0):
+        prune_sqlite_sessions(
+            db_path=sqlite_path,
+            retention_days=retention_days,
+            max_db_bytes=max_db_bytes,
+        )
+
+    return store
+
+
 def create_app(*, settings: Settings | None = None) -> FastAPI:
     app = FastAPI(title="Mantora")
 
@@ -64,28 +93,17 @@ def create_app(*, settings: Settings | None = None) -> FastAPI:
     app.state.settings = settings or Settings()
     logger = logging.getLogger("mantora")
 
+    # Build the store eagerly so TestClient without a lifespan still has one. The
+    # lifespan reuses it and only rebuilds after a previous shutdown closed it.
+    app.state.store = _build_store(app.state.settings, prune=True)
+    store_closed = False
+
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-        if app.state.settings.storage.backend == StorageBackend.memory:
-            app.state.store = MemorySessionStore()
-        else:
-            sqlite_path = app.state.settings.storage.sqlite_path
-            retention_days = app.state.settings.limits.retention_days
-            max_db_bytes = app.state.settings.limits.max_db_bytes
-            store = SQLiteSessionStore(
-                sqlite_path,
-                retention_days=retention_days,
-                max_db_bytes=max_db_bytes,
-            )
-
-            if retention_days > 0 or max_db_bytes > 0:
-                prune_sqlite_sessions(
-                    db_path=sqlite_path,
-                    retention_days=retention_days,
-                    max_db_bytes=max_db_bytes,
-                )
-
-            app.state.store = store
+        nonlocal store_closed
+        if store_closed:
+            app.state.store = _build_store(app.state.settings, prune=False)
+            store_closed = False
 
         try:
             yield
@@ -93,35 +111,13 @@ def create_app(*, settings: Settings | None = None) -> FastAPI:
             store = app.state.store
             if isinstance(store, SQLiteSessionStore):
                 store.close()
+                store_closed = True
 
     app.router.lifespan_context = lifespan
 
-    # Initialize store immediately for testing (TestClient doesn't trigger lifespan)
-    if not hasattr(app.state, "store"):
-        if app.state.settings.storage.backend == StorageBackend.memory:
-            app.state.store = MemorySessionStore()
-        else:
-            sqlite_path = app.state.settings.storage.sqlite_path
-            retention_days = app.state.settings.limits.retention_days
-            max_db_bytes = app.state.settings.limits.max_db_bytes
-            store = SQLiteSessionStore(
-                sqlite_path,
-                retention_days=retention_days,
-                max_db_bytes=max_db_bytes,
-            )
-
-            if retention_days > 0 or max_db_bytes > 0:
-                prune_sqlite_sessions(
-                    db_path=sqlite_path,
-                    retention_days=retention_days,
-                    max_db_bytes=max_db_bytes,
-                )
-
-            app.state.store = store
-
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=app.state.settings.cors_allow_origins,
+        allow_origins=frozenset(app.state.settings.cors_allow_origins),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -140,9 +136,23 @@ def create_app(*, settings: Settings | None = None) -> FastAPI:
         logger = logging.getLogger("mantora")
         logger.debug("Serving frontend from %s", frontend_dist)
 
-        @app.get("/")
-        async def index() -> Any:
-            return FileResponse(frontend_dist / "index.html")
+        # index.html is fixed for the life of the process: read it once and serve it
+        # from memory, with an ETag so browsers can revalidate with a 304.
+        index_path = frontend_dist / "index.html"
+        index_bytes = index_path.read_bytes() if index_path.is_file() else None
+        index_etag = (
+            f'"{hashlib.blake2b(index_bytes, digest_size=8).hexdigest()}"'
+            if index_bytes is not None
+            else ""
+        )
+
+        def index_response(request: Request) -> Response:
+            if index_bytes is None:
+                raise HTTPException(status_code=404, detail="index.html not found")
+            headers = {"ETag": index_etag, "Cache-Control": "no-cache"}
+            if request.headers.get("if-none-match") == index_etag:
+                return Response(status_code=304, headers=headers)
+            return Response(content=index_bytes, media_type="text/html", headers=headers)
 
         # Mount assets separately to avoid catch-all interference
         if (frontend_dist / "assets").is_dir():
@@ -152,16 +162,14 @@ def create_app(*, settings: Settings | None = None) -> FastAPI:
                 name="assets",
             )
 
-        @app.get("/{full_path:path}")
-        async def catch_all(full_path: str) -> Any:
-            """Catch-all for SPA routing."""
-            # If it's an API call that reached here, it's a 404
-            if full_path.startswith("api/"):
+        async def spa(request: Request) -> Response:
+            """Serve index.html for SPA routing; unknown API paths stay 404."""
+            if request.path_params["full_path"].startswith(_API_PREFIX):
                 raise HTTPException(status_code=404, detail="API route not found")
+            return index_response(request)
 
-            # If it's a static file that exists, let StaticFiles handle it
-            # (if we had it mounted at root).
-            # But since we want SPA routing, we serve index.html for everything else
-            return FileResponse(frontend_dist / "index.html")
+        # A plain Starlette route: no FastAPI parameter parsing or OpenAPI entry for
+        # what is just static navigation. The path matches "/" as well.
+        app.add_route("/{full_path:path}", spa, methods=["GET"], include_in_schema=False)
 
     return app
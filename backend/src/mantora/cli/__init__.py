@@ -1,6 +1,13 @@
 """CLI package for Mantora."""
 
 from mantora.cli.main import main
-from mantora.cli.mcp import run_proxy
+
+
+def run_proxy() -> None:
+    """Legacy ``mantora-proxy`` entrypoint (see :func:`mantora.cli.mcp.run_proxy`)."""
+    from mantora.cli.mcp import run_proxy as _run_proxy
+
+    _run_proxy()
+
 
 __all__ = ["main", "run_proxy"]
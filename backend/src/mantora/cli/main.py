@@ -1,14 +1,33 @@
 from __future__ import annotations
 
-import argparse
+import importlib
 import os
+import sys
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
-from mantora.cli.demo import configure_parser as configure_demo
-from mantora.cli.mcp import configure_parser as configure_mcp
-from mantora.cli.up import configure_parser as configure_up
+if TYPE_CHECKING:
+    import argparse
 
+_TRACE_TRUE_VALUES = frozenset({"1", "true", "yes"})
+
+# Subcommand name -> module providing `configure_parser`, in help listing order.
+_SUBCOMMAND_MODULES = {
+    "up": "mantora.cli.up",
+    "mcp": "mantora.cli.mcp",
+    "demo": "mantora.cli.demo",
+}
+
+
+def build_parser(argv: Sequence[str] | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When ``argv`` starts with a known subcommand only that subcommand is registered
+    (and its module imported); otherwise every subcommand is, so help and error
+    messages list them all.
+    """
+    import argparse
 
-def build_parser() -> argparse.ArgumentParser:
     from mantora import __version__
 
     parser = argparse.ArgumentParser(
@@ -28,28 +47,38 @@ def build_parser() -> argparse.ArgumentParser:
     )
     subparsers = parser.add_subparsers(dest="command")
 
-    configure_up(subparsers)
-    configure_mcp(subparsers)
-    configure_demo(subparsers)
+    if argv and argv[0] in _SUBCOMMAND_MODULES:
+        names: Sequence[str] = (argv[0],)
+    else:
+        names = tuple(_SUBCOMMAND_MODULES)
+    for name in names:
+        importlib.import_module(_SUBCOMMAND_MODULES[name]).configure_parser(subparsers)
 
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    # `mantora --version` is answered without building the parser or importing
+    # any subcommand module.
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv == ["--version"]:
+        from mantora import __version__
+
+        print(f"mantora {__version__}")
+        return 0
+
+    parser = build_parser(argv)
     args = parser.parse_args(argv)
 
     if not hasattr(args, "func"):
         parser.print_help()
         return 2
 
-    want_trace = bool(getattr(args, "trace", False)) or os.environ.get("MANTORA_TRACE") in {
-        "1",
-        "true",
-        "TRUE",
-        "yes",
-        "YES",
-    }
+    want_trace = (
+        bool(getattr(args, "trace", False))
+        or os.environ.get("MANTORA_TRACE", "").lower() in _TRACE_TRUE_VALUES
+    )
     try:
         return int(args.func(args))
     except KeyboardInterrupt:
@@ -65,11 +94,12 @@ def main(argv: list[str] | None = None) -> int:
             from mantora.cli.ui import print_error
 
             # Simple heuristic to extract tips from common errors
+            message = str(exc)
             tip = "re-run with --trace to see the full traceback."
-            if "Connection refused" in str(exc):
+            if "Connection refused" in message:
                 tip = "Ensure the target server (e.g., Docker container) is running."
-            elif "No such file or directory" in str(exc) and "mantora.toml" in str(exc):
+            elif "No such file or directory" in message and "mantora.toml" in message:
                 tip = "Check that your config file path is correct."
 
-            print_error(type(exc).__name__, str(exc), tip=tip)
+            print_error(type(exc).__name__, message, tip=tip)
         return 1
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
+import functools
 import logging
 import os
 import shutil
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from mantora.config import ProxyConfig, TargetConfig, load_proxy_config
-from mantora.mcp import MCPProxy, PolicyHooks
-from mantora.store.sqlite import SQLiteSessionStore
+# The proxy, config and store stacks are imported where they are used so that
+# `mantora --help` and the other subcommands don't pay for them at startup.
+if TYPE_CHECKING:
+    from mantora.config import ProxyConfig
+    from mantora.mcp import MCPProxy
+    from mantora.store.sqlite import SQLiteSessionStore
 
 logger = logging.getLogger(__name__)
 
@@ -46,30 +50,45 @@ def _parse_protective(value: str | None) -> bool | None:
     return value.lower() == "on"
 
 
+@functools.cache
+def _venv_bin_names() -> frozenset[str]:
+    """Names in the directory of the current Python executable, listed once.
+
+    NOTE: Don't use `.resolve()` here: venv `python` is often a symlink to the base
+    interpreter, and resolving would jump out of the venv and miss console scripts
+    installed into the venv's `bin/`.
+    """
+    try:
+        with os.scandir(Path(sys.executable).parent) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=32)
+def _locate_binary(binary_name: str) -> str | None:
+    """Locate a console script, preferring the one next to Mantora's Python executable.
+
+    Cursor's PATH may not include the venv bin directory, so the directory of the
+    current Python executable (pipx/venv) is checked before PATH. Results are cached
+    since neither location changes while the process runs.
+    """
+    if binary_name in _venv_bin_names():
+        return str(Path(sys.executable).parent / binary_name)
+    return shutil.which(binary_name)
+
+
 def _resolve_binary_path(binary_name: str) -> str:
     """Resolve a binary name to its full path.
 
-    Checks the directory containing the current Python executable first (for pipx/venv),
-    then falls back to PATH lookup.
-
     Args:
         binary_name: The binary name (e.g., 'mcp-server-duckdb')
 
     Returns:
-        Full path to the binary, or the original name if not found.
+        Full path to the binary, or the original name if not found
+        (which will fail at runtime with a clear error).
     """
-    # Check the bin directory next to the current Python executable
-    local_bin = Path(sys.executable).parent / binary_name
-    if local_bin.exists():
-        return str(local_bin)
-
-    # Fall back to PATH lookup
-    path_bin = shutil.which(binary_name)
-    if path_bin:
-        return path_bin
-
-    # Return original name as fallback (will fail at runtime with clear error)
-    return binary_name
+    return _locate_binary(binary_name) or binary_name
 
 
 def _resolve_command(command: list[str]) -> list[str]:
@@ -86,50 +105,38 @@ def _resolve_command(command: list[str]) -> list[str]:
 
     # Only resolve if the first element looks like a bare binary name (no path separator)
     binary = command[0]
-    if os.sep not in binary and not binary.startswith("/"):
+    if os.path.basename(binary) == binary:  # noqa: PTH119 - checks both separators, no Path
         resolved = _resolve_binary_path(binary)
         return [resolved, *command[1:]]
 
     return command
 
 
+# Connector name -> (server binary, CLI flag carrying the connection argument).
+_CONNECTORS: dict[str, tuple[str, str]] = {
+    "duckdb": ("mcp-server-duckdb", "--db"),
+    "postgres": ("mcp-server-postgres", "--dsn"),
+}
+
+
 def build_target_command(connector: str, db: Path | None, dsn: str | None) -> list[str]:
-    if connector == "duckdb":
-        if db is None:
-            raise ValueError("--db is required for duckdb connector")
-        # Prefer the console-script next to Mantora's Python executable (pipx),
-        # since Cursor's PATH may not include the venv bin directory.
-        # NOTE: Don't use `.resolve()` here: venv `python` is often a symlink to the base
-        # interpreter, and resolving would jump out of the venv and miss console scripts
-        # installed into the venv's `bin/`.
-        local_bin = Path(sys.executable).parent / "mcp-server-duckdb"
-        if local_bin.exists():
-            return [str(local_bin), "--db", str(db)]
-        path_bin = shutil.which("mcp-server-duckdb")
-        if path_bin is None:
-            raise RuntimeError(
-                "mcp-server-duckdb is required for the duckdb connector. "
-                "Install with `pip install 'mantora[duckdb]'`, "
-                "`pipx inject mantora mcp-server-duckdb`, or `pip install mcp-server-duckdb`."
-            )
-        return [path_bin, "--db", str(db)]
-    if connector == "postgres":
-        if not dsn:
-            raise ValueError("--dsn is required for postgres connector")
-        local_bin = Path(sys.executable).parent / "mcp-server-postgres"
-        if local_bin.exists():
-            return [str(local_bin), "--dsn", dsn]
-        path_bin = shutil.which("mcp-server-postgres")
-        if path_bin is None:
-            raise RuntimeError(
-                "mcp-server-postgres is required for the postgres connector. "
-                "Install with `pip install 'mantora[postgres]'`, "
-                "`pipx inject mantora mcp-server-postgres`, "
-                "or `pip install mcp-server-postgres`."
-            )
-        return [path_bin, "--dsn", dsn]
+    spec = _CONNECTORS.get(connector)
+    if spec is None:
+        raise ValueError(f"Unsupported connector: {connector}")
+    binary, flag = spec
 
-    raise ValueError(f"Unsupported connector: {connector}")
+    value = (str(db) if db is not None else None) if flag == "--db" else dsn or None
+    if value is None:
+        raise ValueError(f"{flag} is required for {connector} connector")
+
+    path_bin = _locate_binary(binary)
+    if path_bin is None:
+        raise RuntimeError(
+            f"{binary} is required for the {connector} connector. "
+            f"Install with `pip install 'mantora[{connector}]'`, "
+            f"`pipx inject mantora {binary}`, or `pip install {binary}`."
+        )
+    return [path_bin, flag, value]
 
 
 def _resolve_store_path(config: ProxyConfig, explicit: Path | None) -> Path:
@@ -144,6 +151,8 @@ def _resolve_store_path(config: ProxyConfig, explicit: Path | None) -> Path:
 
 
 def _apply_connector(args: argparse.Namespace, config: ProxyConfig) -> None:
+    from mantora.config import TargetConfig
+
     if args.connector:
         command = build_target_command(args.connector, args.db, args.dsn)
         config.target = TargetConfig(type=args.connector, command=command)
@@ -156,35 +165,51 @@ def _apply_connector(args: argparse.Namespace, config: ProxyConfig) -> None:
 def _print_startup(config: ProxyConfig, session_id: str | None) -> None:
     # Use stderr for logs since stdout is used for MCP JSON-RPC
     # We'll use our error_console which writes to stderr
+    from mantora.cli.ui import error_console as console
+
+    policy = config.policy
+    rules = (
+        [
+            name
+            for name, enabled in (
+                ("block_ddl", policy.block_ddl),
+                ("block_dml", policy.block_dml),
+                ("block_multi_statement", policy.block_multi_statement),
+                ("block_delete_without_where", policy.block_delete_without_where),
+            )
+            if enabled
+        ]
+        if policy.protective_mode
+        else []
+    )
+
+    # Under an MCP client stderr is a log file, not a terminal: one plain line is
+    # enough and skips laying out the panel.
+    if not console.is_terminal:
+        console.print(
+            "MCP proxy ready:"
+            f" protective_mode={'on' if policy.protective_mode else 'off'}"
+            f" rules={','.join(rules) or '-'}"
+            f" session={session_id or '-'}"
+            f" connector={config.target.type or '-'}",
+            markup=False,
+            highlight=False,
+            soft_wrap=True,
+        )
+        return
+
     from rich.panel import Panel
     from rich.table import Table
 
-    from mantora.cli.ui import error_console as console
-
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Key", style="bold white", justify="right")
     table.add_column("Value", style="cyan")
 
-    mode = (
-        "[bold green]ON[/bold green]"
-        if config.policy.protective_mode
-        else "[bold red]OFF[/bold red]"
-    )
+    mode = "[bold green]ON[/bold green]" if policy.protective_mode else "[bold red]OFF[/bold red]"
     table.add_row("Protective Mode", mode)
 
-    if config.policy.protective_mode:
-        rules = []
-        if config.policy.block_ddl:
-            rules.append("block_ddl")
-        if config.policy.block_dml:
-            rules.append("block_dml")
-        if config.policy.block_multi_statement:
-            rules.append("block_multi_statement")
-        if config.policy.block_delete_without_where:
-            rules.append("block_delete_without_where")
-
-        if rules:
-            table.add_row("Active Rules", ", ".join(rules))
+    if rules:
+        table.add_row("Active Rules", ", ".join(rules))
 
     if session_id:
         table.add_row("Session ID", session_id)
@@ -203,13 +228,28 @@ def _print_startup(config: ProxyConfig, session_id: str | None) -> None:
     )
 
 
-def _build_proxy(config: ProxyConfig, store_path: Path, session_title: str | None) -> MCPProxy:
+def _open_store(config: ProxyConfig, store_path: Path) -> SQLiteSessionStore:
+    from mantora.store.sqlite import SQLiteSessionStore
+
     store_path.parent.mkdir(parents=True, exist_ok=True)
-    store = SQLiteSessionStore(
+    return SQLiteSessionStore(
         store_path,
         retention_days=config.limits.retention_days,
         max_db_bytes=config.limits.max_db_bytes,
     )
+
+
+def _build_proxy(
+    config: ProxyConfig,
+    store_path: Path,
+    session_title: str | None,
+    *,
+    store: SQLiteSessionStore | None = None,
+) -> MCPProxy:
+    from mantora.mcp import MCPProxy, PolicyHooks
+
+    if store is None:
+        store = _open_store(config, store_path)
     hooks = PolicyHooks(
         config=config,
         policy=config.policy,
@@ -224,8 +264,18 @@ def _build_proxy(config: ProxyConfig, store_path: Path, session_title: str | Non
     return proxy
 
 
-def _run_proxy(config: ProxyConfig, store_path: Path, session_title: str | None) -> None:
-    proxy = _build_proxy(config, store_path, session_title)
+def _run_proxy(
+    config: ProxyConfig,
+    store_path: Path,
+    session_title: str | None,
+    *,
+    store: SQLiteSessionStore | None = None,
+) -> None:
+    import asyncio
+
+    from mantora.store.sqlite import SQLiteSessionStore
+
+    proxy = _build_proxy(config, store_path, session_title, store=store)
 
     async def runner() -> None:
         try:
@@ -240,52 +290,63 @@ def _run_proxy(config: ProxyConfig, store_path: Path, session_title: str | None)
             if isinstance(store, SQLiteSessionStore):
                 store.close()
 
-    asyncio.run(runner())
+    # uvloop ships with uvicorn[standard] on POSIX; its libuv loop is faster at the
+    # pipe I/O the proxy spends its time on. Fall back to asyncio elsewhere.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(runner())
+    else:
+        # asyncio.Runner rather than uvloop.run, which only exists in uvloop >= 0.18.
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as loop_runner:
+            loop_runner.run(runner())
 
 
 def run_mcp(args: argparse.Namespace) -> int:
+    from mantora.config import TargetConfig, load_proxy_config
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    cli_overrides: dict[str, Any] = {}
     protective = _parse_protective(args.protective)
+    if protective is not None:
+        cli_overrides["protective_mode"] = protective
+    if args.tag is not None:
+        cli_overrides["tag"] = args.tag
 
-    config = load_proxy_config(
-        config_path=args.config,
-        cli_overrides={
-            "protective_mode": protective,
-            "tag": args.tag,
-        },
-    )
+    config = load_proxy_config(config_path=args.config, cli_overrides=cli_overrides or None)
 
-    # NEW: Load active target from UI database before applying CLI connector
+    # Load the active target from the UI database unless --connector overrides it.
+    # The same store is then handed to the proxy rather than reopened.
     store_path = _resolve_store_path(config, explicit=None)
-    if store_path.exists():
-        from mantora.store.sqlite import SQLiteSessionStore
-
-        temp_store = SQLiteSessionStore(store_path)
-        try:
-            active_target = temp_store.get_active_target()
-            if active_target:
-                # Override config with UI-configured target
-                # Resolve command path (e.g., 'mcp-server-duckdb' -> full path in pipx venv)
-                resolved_command = _resolve_command(active_target.command)
-                config.target = TargetConfig(
-                    type=active_target.type,
-                    command=resolved_command,
-                    env=active_target.env,
-                )
-                logger = logging.getLogger(__name__)
-                logger.info(
-                    "Using UI-configured target: %s (command: %s)",
-                    active_target.name,
-                    resolved_command[0] if resolved_command else "none",
-                )
-        finally:
-            temp_store.close()
+    store = _open_store(config, store_path) if store_path.exists() else None
+    try:
+        active_target = (
+            store.get_active_target() if store is not None and not args.connector else None
+        )
+        if active_target:
+            # Override config with UI-configured target
+            # Resolve command path (e.g., 'mcp-server-duckdb' -> full path in pipx venv)
+            resolved_command = _resolve_command(active_target.command)
+            config.target = TargetConfig(
+                type=active_target.type,
+                command=resolved_command,
+                env=active_target.env,
+            )
+            logger.info(
+                "Using UI-configured target: %s (command: %s)",
+                active_target.name,
+                resolved_command[0] if resolved_command else "none",
+            )
 
-    _apply_connector(args, config)
+        _apply_connector(args, config)
+    except BaseException:
+        if store is not None:
+            store.close()
+        raise
 
-    _run_proxy(config, store_path, args.session)
+    _run_proxy(config, store_path, args.session, store=store)
     return 0
 
 
@@ -326,6 +387,8 @@ Configuration:
 
     args = parser.parse_args()
 
+    from mantora.config import load_proxy_config
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -5,11 +5,11 @@ from __future__ import annotations
 from typing import Any
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 from rich.theme import Theme
 
+# Renderables (Panel, Table, Text) are imported inside the helpers that draw them:
+# the headless MCP proxy only needs the consoles.
+
 # Custom theme for Mantora CLI
 theme = Theme(
     {
@@ -34,6 +34,9 @@ MANTORA_LOGO = """
 
 def print_banner(host: str, port: int, config_path: Any) -> None:
     """Print the startup banner with connection details."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
 
     # Header Panel with Logo and Version
     header = Panel(
@@ -83,6 +86,9 @@ def print_banner(host: str, port: int, config_path: Any) -> None:
 
 def print_error(title: str, message: str, tip: str | None = None) -> None:
     """Print a styled error message with an optional actionable tip."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     content = Text()
     content.append(f"{message}\n", style="white")
 
@@ -1,19 +1,15 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
-import contextlib
 import logging
-import webbrowser
 from pathlib import Path
 
-import uvicorn
-
-from mantora.app import create_app
-from mantora.config import load_settings, resolve_config_path
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
 
 
 def _is_shutdown_noise(exc: BaseException) -> bool:
+    import asyncio
+
     if isinstance(exc, asyncio.CancelledError | KeyboardInterrupt | GeneratorExit):
         return True
     if isinstance(exc, BaseExceptionGroup):
@@ -58,9 +54,18 @@ def _print_banner(host: str, port: int, config_path: Path) -> None:
 
 
 def run_up(args: argparse.Namespace) -> int:
+    # Server-side imports stay local so other subcommands start quickly.
+    import asyncio
+    import contextlib
+    import threading
+    import webbrowser
+
+    import uvicorn
     from rich.logging import RichHandler
 
+    from mantora.app import create_app
     from mantora.cli.ui import console
+    from mantora.config import load_settings, resolve_config_path
 
     # Configure root logger with Rich
     # Note: rich_tracebacks=False prevents noisy shutdown tracebacks
@@ -74,7 +79,7 @@ def run_up(args: argparse.Namespace) -> int:
 
     # Force uvicorn error log to propagate to root (which has RichHandler)
     # We leave access log disabled below, so we don't need to configure it
-    for logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+    for logger_name in _UVICORN_LOGGERS:
         logger = logging.getLogger(logger_name)
         logger.handlers.clear()
         logger.propagate = True
@@ -86,7 +91,8 @@ def run_up(args: argparse.Namespace) -> int:
 
     if args.open_browser:
         url = f"http://{args.host}:{args.port}"
-        webbrowser.open(url)
+        # Launching a browser can block on fork/exec; don't hold up the server boot.
+        threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
 
     rich_handler.addFilter(NoisyShutdownFilter())
 
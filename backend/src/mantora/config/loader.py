@@ -6,6 +6,7 @@ Uses stdlib tomllib (Python 3.11+).
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import tomllib
@@ -80,6 +81,20 @@ def _parse_toml(path: Path) -> dict[str, Any]:
         return tomllib.load(f)
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_toml_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    return _parse_toml(Path(path))
+
+
+def _load_toml(path: Path) -> Mapping[str, Any]:
+    """Parse ``path``, reusing the previous parse while the file is unchanged.
+
+    The result is shared between callers and must not be mutated; the builders
+    below copy any section they rewrite.
+    """
+    return _parse_toml_cached(str(path), path.stat().st_mtime_ns)
+
+
 def resolve_config_path(config_path: Path | None = None) -> Path:
     """Resolve the config path used for display or creation."""
     if config_path:
@@ -97,23 +112,27 @@ def _build_policy_config(data: Mapping[str, Any]) -> PolicyConfig:
     return PolicyConfig.model_validate(policy_data)
 
 
-def _build_limits_config(data: Mapping[str, Any]) -> LimitsConfig:
-    limits_data = dict(data.get("limits", {}))
-
-    if "preview_rows" not in limits_data and "max_preview_rows" in limits_data:
-        limits_data["preview_rows"] = limits_data.pop("max_preview_rows")
-
-    if "preview_bytes" not in limits_data and "max_preview_payload_bytes" in limits_data:
-        limits_data["preview_bytes"] = limits_data.pop("max_preview_payload_bytes")
+# Legacy [limits] key -> current key. The current key wins when both are set.
+_LIMITS_ALIASES = {
+    "max_preview_rows": "preview_rows",
+    "max_preview_payload_bytes": "preview_bytes",
+    "max_columns": "preview_columns",
+}
 
-    if "preview_columns" not in limits_data and "max_columns" in limits_data:
-        limits_data["preview_columns"] = limits_data.pop("max_columns")
 
+def _build_limits_config(data: Mapping[str, Any]) -> LimitsConfig:
+    raw: Mapping[str, Any] = data.get("limits", {})
+    limits_data = {_LIMITS_ALIASES.get(key, key): value for key, value in raw.items()}
+    # Re-apply current keys so they override a legacy alias regardless of file order.
+    limits_data.update((key, raw[key]) for key in _LIMITS_ALIASES.values() if key in raw)
     return LimitsConfig.model_validate(limits_data)
 
 
 def merge_cli_overrides(config: ProxyConfig, overrides: Mapping[str, Any]) -> ProxyConfig:
     """Apply CLI overrides to an existing proxy config."""
+    if not overrides:
+        return config
+
     if "protective_mode" in overrides and overrides["protective_mode"] is not None:
         config.policy.protective_mode = bool(overrides["protective_mode"])
 
@@ -129,20 +148,10 @@ def merge_cli_overrides(config: ProxyConfig, overrides: Mapping[str, Any]) -> Pr
     return config
 
 
-def load_proxy_config(
-    config_path: Path | None = None, *, cli_overrides: Mapping[str, Any] | None = None
-) -> ProxyConfig:
-    """Load proxy configuration from TOML file.
+def _read_config(config_path: Path | None) -> tuple[Path, Mapping[str, Any]] | None:
+    """Resolve and parse the config file shared by both loaders.
 
-    Args:
-        config_path: Explicit path to config file. If None, searches default locations.
-        cli_overrides: Optional CLI overrides to apply after loading.
-
-    Returns:
-        ProxyConfig with loaded or default values.
-
-    Raises:
-        FileNotFoundError: If an explicit config_path is provided but does not exist.
+    Returns ``None`` when no explicit path is given and no config file is found.
     """
     if config_path:
         if not config_path.exists():
@@ -154,38 +163,66 @@ def load_proxy_config(
     else:
         found_path = _find_config_file()
         if found_path is None:
-            config = ProxyConfig()
-            if cli_overrides:
-                config = merge_cli_overrides(config, cli_overrides)
-            return config
+            return None
         path = found_path
 
     try:
-        data = _parse_toml(path)
+        data = _load_toml(path)
     except Exception as e:
         raise RuntimeError(f"Failed to parse configuration file at {path}: {e}") from e
+    return path, data
 
-    # Extract proxy-relevant sections
-    proxy_data: dict[str, Any] = {
+
+def _config_relative_path(config_file: Path, value: str) -> Path:
+    """Resolve a path from the config against the config file location."""
+    resolved = Path(value)
+    if not resolved.is_absolute():
+        resolved = config_file.parent / resolved
+    return resolved
+
+
+def _base_config_data(data: Mapping[str, Any]) -> dict[str, Any]:
+    # Built per loader: callers mutate policy/limits when applying CLI overrides.
+    return {
         "policy": _build_policy_config(data),
         "limits": _build_limits_config(data),
     }
 
+
+def load_proxy_config(
+    config_path: Path | None = None, *, cli_overrides: Mapping[str, Any] | None = None
+) -> ProxyConfig:
+    """Load proxy configuration from TOML file.
+
+    Args:
+        config_path: Explicit path to config file. If None, searches default locations.
+        cli_overrides: Optional CLI overrides to apply after loading.
+
+    Returns:
+        ProxyConfig with loaded or default values.
+
+    Raises:
+        FileNotFoundError: If an explicit config_path is provided but does not exist.
+    """
+    loaded = _read_config(config_path)
+    if loaded is None:
+        config = ProxyConfig()
+        if cli_overrides:
+            config = merge_cli_overrides(config, cli_overrides)
+        return config
+    path, data = loaded
+
+    # Extract proxy-relevant sections
+    proxy_data = _base_config_data(data)
+
     if "target" in data:
         proxy_data["target"] = data["target"]
 
     if "sqlite_path" in data:
-        db_path = Path(data["sqlite_path"])
-        # Resolve relative paths against the config file location
-        if not db_path.is_absolute():
-            db_path = path.parent / db_path
-        proxy_data["sqlite_path"] = db_path
+        proxy_data["sqlite_path"] = _config_relative_path(path, data["sqlite_path"])
 
     if "project_root" in data:
-        project_root = Path(data["project_root"])
-        if not project_root.is_absolute():
-            project_root = path.parent / project_root
-        proxy_data["project_root"] = project_root
+        proxy_data["project_root"] = _config_relative_path(path, data["project_root"])
 
     if "tag" in data:
         proxy_data["tag"] = data["tag"]
@@ -200,37 +237,18 @@ def load_settings(
     config_path: Path | None = None, *, cli_overrides: Mapping[str, Any] | None = None
 ) -> Settings:
     """Load application settings from TOML file."""
-    if config_path:
-        if not config_path.exists():
-            raise FileNotFoundError(
-                f"Configuration file not found at explicitly provided path: {config_path}. "
-                "Ensure the file exists or omit the argument to use default search paths."
-            )
-        path: Path = config_path
-    else:
-        found_path = _find_config_file()
-        if found_path is None:
-            return Settings()
-        path = found_path
-
-    try:
-        data = _parse_toml(path)
-    except Exception as e:
-        raise RuntimeError(f"Failed to parse configuration file at {path}: {e}") from e
+    loaded = _read_config(config_path)
+    if loaded is None:
+        return Settings()
+    path, data = loaded
 
-    settings_data: dict[str, Any] = {
-        "policy": _build_policy_config(data),
-        "limits": _build_limits_config(data),
-    }
+    settings_data = _base_config_data(data)
 
     if "cors_allow_origins" in data:
         settings_data["cors_allow_origins"] = data["cors_allow_origins"]
 
     if "sqlite_path" in data:
-        db_path = Path(data["sqlite_path"])
-        if not db_path.is_absolute():
-            db_path = path.parent / db_path
-        settings_data["storage"] = {"sqlite_path": db_path}
+        settings_data["storage"] = {"sqlite_path": _config_relative_path(path, data["sqlite_path"])}
 
     settings = Settings.model_validate(settings_data)
 
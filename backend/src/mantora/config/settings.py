@@ -13,13 +13,19 @@ class SafetyMode(str, Enum):
     transparent = "transparent"
 
 
+# Config models use defer_build: their validators are built on first use rather than
+# at import, since most processes only ever validate a few of them once.
 class Caps(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     max_preview_rows: int = 10
     max_preview_payload_bytes: int = 512 * 1024
     max_columns: int = 80
 
 
 class LimitsConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     preview_rows: int = Field(default=10, ge=1)
     preview_bytes: int = Field(default=512 * 1024, ge=1)
     preview_columns: int = Field(default=80, ge=1)
@@ -28,6 +34,8 @@ class LimitsConfig(BaseModel):
 
 
 class PolicyConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     protective_mode: bool = True
     block_ddl: bool = True
     block_dml: bool = True
@@ -45,12 +53,24 @@ class StorageBackend(str, Enum):
 
 
 class Storage(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     backend: StorageBackend = StorageBackend.sqlite
     sqlite_path: Path = Field(default_factory=_default_sqlite_path)
 
 
+# Legacy ``caps`` keys -> LimitsConfig fields.
+_LEGACY_CAPS_FIELDS = {
+    "max_preview_rows": "preview_rows",
+    "max_preview_payload_bytes": "preview_bytes",
+    "max_columns": "preview_columns",
+    "retention_days": "retention_days",
+    "max_db_bytes": "max_db_bytes",
+}
+
+
 class Settings(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     policy: PolicyConfig = Field(default_factory=PolicyConfig)
     limits: LimitsConfig = Field(default_factory=LimitsConfig)
@@ -83,20 +103,15 @@ class Settings(BaseModel):
             caps = data.pop("caps")
             if "limits" not in data:
                 if isinstance(caps, Caps):
+                    caps = caps.model_dump()
+                if isinstance(caps, dict):
+                    # Missing keys fall back to the LimitsConfig field defaults.
                     data["limits"] = LimitsConfig(
-                        preview_rows=caps.max_preview_rows,
-                        preview_bytes=caps.max_preview_payload_bytes,
-                        preview_columns=caps.max_columns,
-                    )
-                elif isinstance(caps, dict):
-                    data["limits"] = LimitsConfig(
-                        preview_rows=caps.get("max_preview_rows", LimitsConfig().preview_rows),
-                        preview_bytes=caps.get(
-                            "max_preview_payload_bytes", LimitsConfig().preview_bytes
-                        ),
-                        preview_columns=caps.get("max_columns", LimitsConfig().preview_columns),
-                        retention_days=caps.get("retention_days", LimitsConfig().retention_days),
-                        max_db_bytes=caps.get("max_db_bytes", LimitsConfig().max_db_bytes),
+                        **{
+                            field: caps[key]
+                            for key, field in _LEGACY_CAPS_FIELDS.items()
+                            if key in caps
+                        }
                     )
 
         return data
@@ -107,7 +122,9 @@ class Settings(BaseModel):
 
     @property
     def caps(self) -> Caps:
-        return Caps(
+        # Not cached: limits are mutated after construction (CLI overrides). The
+        # values were already validated by LimitsConfig, so skip Caps validation.
+        return Caps.model_construct(
             max_preview_rows=self.limits.preview_rows,
             max_preview_payload_bytes=self.limits.preview_bytes,
             max_columns=self.limits.preview_columns,
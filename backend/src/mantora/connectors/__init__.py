@@ -1,8 +1,10 @@
 """Connectors package - adapters for normalizing target MCP tool calls."""
 
-from mantora.connectors.bigquery import BigQueryAdapter
-from mantora.connectors.databricks import DatabricksAdapter
-from mantora.connectors.duckdb import DuckDBAdapter
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from mantora.connectors.interface import (
     DEFAULT_PREVIEW_CAP_BYTES,
     Adapter,
@@ -10,9 +12,37 @@ from mantora.connectors.interface import (
     NormalizedStep,
     StepCategory,
 )
-from mantora.connectors.postgres import PostgresAdapter
-from mantora.connectors.registry import get_adapter, list_adapters, register_adapter
-from mantora.connectors.snowflake import SnowflakeAdapter
+
+if TYPE_CHECKING:
+    from mantora.connectors.bigquery import BigQueryAdapter
+    from mantora.connectors.databricks import DatabricksAdapter
+    from mantora.connectors.duckdb import DuckDBAdapter
+    from mantora.connectors.postgres import PostgresAdapter
+    from mantora.connectors.registry import get_adapter, list_adapters, register_adapter
+    from mantora.connectors.snowflake import SnowflakeAdapter
+
+# Adapters and the registry load on first access, so importing a submodule such as
+# ``mantora.connectors.interface`` does not pull in every target adapter.
+_LAZY_ATTRS = {
+    "BigQueryAdapter": "mantora.connectors.bigquery",
+    "DatabricksAdapter": "mantora.connectors.databricks",
+    "DuckDBAdapter": "mantora.connectors.duckdb",
+    "PostgresAdapter": "mantora.connectors.postgres",
+    "SnowflakeAdapter": "mantora.connectors.snowflake",
+    "get_adapter": "mantora.connectors.registry",
+    "list_adapters": "mantora.connectors.registry",
+    "register_adapter": "mantora.connectors.registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DEFAULT_PREVIEW_CAP_BYTES",
@@ -59,6 +59,13 @@ class BigQueryAdapter(BaseAdapter):
         "query": "execute_sql",
     }
 
+    _list_types: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("table", "tables"),
+        ("dataset", "datasets"),
+        ("project", "projects"),
+    )
+    _default_list_type: ClassVar[str] = "unknown"
+
     @property
     def target_type(self) -> str:
         return "bigquery"
@@ -98,14 +105,6 @@ class BigQueryAdapter(BaseAdapter):
 
         if category == "list":
             # list_dataset_ids and list_table_ids tools
-            lowered = tool_name.lower()
-            if "dataset" in lowered and "table" not in lowered:
-                evidence["list_type"] = "datasets"
-            elif "table" in lowered:
-                evidence["list_type"] = "tables"
-            elif "project" in lowered:
-                evidence["list_type"] = "projects"
-            else:
-                evidence["list_type"] = "unknown"
+            evidence["list_type"] = self._list_type(tool_name)
 
         return evidence
@@ -51,6 +51,11 @@ class DatabricksAdapter(BaseAdapter):
         "desc": "describe_table",
     }
 
+    _list_types: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("catalog", "catalogs"),
+        ("schema", "schemas"),
+    )
+
     @property
     def target_type(self) -> str:
         return "databricks"
@@ -84,12 +89,6 @@ class DatabricksAdapter(BaseAdapter):
                     break
 
         if category == "list":
-            lowered = tool_name.lower()
-            if "catalog" in lowered:
-                evidence["list_type"] = "catalogs"
-            elif "schema" in lowered:
-                evidence["list_type"] = "schemas"
-            else:
-                evidence["list_type"] = "tables"
+            evidence["list_type"] = self._list_type(tool_name)
 
         return evidence
@@ -48,6 +48,8 @@ class DuckDBAdapter(BaseAdapter):
         "schema": "describe_table",
     }
 
+    _list_types: ClassVar[tuple[tuple[str, str], ...]] = (("database", "databases"),)
+
     @property
     def target_type(self) -> str:
         return "duckdb"
@@ -76,9 +78,6 @@ class DuckDBAdapter(BaseAdapter):
 
         # For list tools, note what's being listed
         if category == "list":
-            if "database" in tool_name.lower():
-                evidence["list_type"] = "databases"
-            else:
-                evidence["list_type"] = "tables"
+            evidence["list_type"] = self._list_type(tool_name)
 
         return evidence
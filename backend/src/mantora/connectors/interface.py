@@ -7,6 +7,7 @@ Per PRI-HARD-CAPS-ALWAYS: adapters must not create unbounded previews.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any, ClassVar, Literal, Protocol
 
@@ -18,8 +19,26 @@ StepCategory = Literal["query", "schema", "list", "cast", "session", "unknown"]
 # Default preview cap (8KB)
 DEFAULT_PREVIEW_CAP_BYTES = 8 * 1024
 
+_PREVIEW_JSON_ENCODER = json.JSONEncoder(indent=2, default=str)
 
-@dataclass(frozen=True)
+
+def _json_prefix(value: Any, max_bytes: int) -> str:
+    """Encode ``value`` as indented JSON, stopping once the text exceeds ``max_bytes``.
+
+    Every character is at least one UTF-8 byte, so a prefix longer than
+    ``max_bytes`` characters caps to the same text as the full encoding.
+    """
+    parts: list[str] = []
+    size = 0
+    for chunk in _PREVIEW_JSON_ENCODER.iterencode(value):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            break
+    return "".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
 class NormalizedStep:
     """Normalized representation of a tool interaction.
 
@@ -137,6 +156,23 @@ class BaseAdapter:
     # Maps alternative names to canonical names
     _tool_aliases: ClassVar[dict[str, str]] = {}
 
+    # Ordered (substring, list_type) pairs for list tools; first match wins
+    _list_types: ClassVar[tuple[tuple[str, str], ...]] = ()
+    _default_list_type: ClassVar[str] = "tables"
+
+    # Tool name (canonical or alias) -> category, flattened once per subclass
+    _resolved_categories: ClassVar[dict[str, StepCategory]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._resolved_categories = {
+            **cls._tool_categories,
+            **{
+                alias: cls._tool_categories.get(canonical, "unknown")
+                for alias, canonical in cls._tool_aliases.items()
+            },
+        }
+
     @property
     def target_type(self) -> str:
         raise NotImplementedError
@@ -146,8 +182,15 @@ class BaseAdapter:
         return self._tool_aliases.get(tool_name, tool_name)
 
     def categorize_tool(self, tool_name: str) -> StepCategory:
-        resolved = self._resolve_tool_name(tool_name)
-        return self._tool_categories.get(resolved, "unknown")
+        return self._resolved_categories.get(tool_name, "unknown")
+
+    def _list_type(self, tool_name: str) -> str:
+        """Classify what a list tool lists from its name."""
+        lowered = tool_name.lower()
+        for needle, list_type in self._list_types:
+            if needle in lowered:
+                return list_type
+        return self._default_list_type
 
     def extract_evidence(
         self, tool_name: str, arguments: dict[str, Any], result: Any
@@ -176,13 +219,16 @@ class BaseAdapter:
         if result is None:
             return "", False
 
+        # Plain strings are the common case; skip the attribute probes below.
+        if type(result) is str:
+            return cap_text(result, max_bytes=max_bytes)
+
         # Handle MCP CallToolResult
-        if hasattr(result, "content"):
-            content = result.content
-            if content and len(content) > 0:
-                first = content[0]
-                if hasattr(first, "text"):
-                    return cap_text(first.text, max_bytes=max_bytes)
+        content = getattr(result, "content", None)
+        if content:
+            text = getattr(content[0], "text", None)
+            if text is not None:
+                return cap_text(text, max_bytes=max_bytes)
 
         # Handle string result
         if isinstance(result, str):
@@ -190,10 +236,7 @@ class BaseAdapter:
 
         # Handle dict/list - convert to string
         if isinstance(result, dict | list):
-            import json
-
-            text = json.dumps(result, indent=2, default=str)
-            return cap_text(text, max_bytes=max_bytes)
+            return cap_text(_json_prefix(result, max_bytes), max_bytes=max_bytes)
 
         # Fallback
         return cap_text(str(result), max_bytes=max_bytes)
@@ -54,6 +54,11 @@ class PostgresAdapter(BaseAdapter):
         "pg_exec": "execute",
     }
 
+    _list_types: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("database", "databases"),
+        ("schema", "schemas"),
+    )
+
     @property
     def target_type(self) -> str:
         return "postgres"
@@ -93,11 +98,6 @@ class PostgresAdapter(BaseAdapter):
 
         # For list tools, note what's being listed
         if category == "list":
-            if "database" in tool_name.lower():
-                evidence["list_type"] = "databases"
-            elif "schema" in tool_name.lower():
-                evidence["list_type"] = "schemas"
-            else:
-                evidence["list_type"] = "tables"
+            evidence["list_type"] = self._list_type(tool_name)
 
         return evidence
@@ -5,6 +5,7 @@ Per DEC-V0-ADAPTERS-PER-TARGET: normalization via per-target adapters.
 
 from __future__ import annotations
 
+import functools
 from typing import ClassVar
 
 from mantora.connectors.bigquery import BigQueryAdapter
@@ -56,9 +57,13 @@ _ADAPTERS: dict[str, type[Adapter]] = {
 _adapter_instances: dict[str, Adapter] = {}
 
 
+@functools.lru_cache(maxsize=32)
 def get_adapter(target_type: str) -> Adapter:
     """Get an adapter for the given target type.
 
+    Results are cached per raw ``target_type`` so repeat lookups from the proxy
+    skip normalization; ``register_adapter`` clears the cache.
+
     Args:
         target_type: The type of target (e.g., 'duckdb', 'postgres').
 
@@ -95,6 +100,7 @@ def register_adapter(target_type: str, adapter_cls: type[Adapter]) -> None:
 
     # Clear cached instance if exists
     _adapter_instances.pop(normalized, None)
+    get_adapter.cache_clear()
 
 
 def list_adapters() -> list[str]:
@@ -58,6 +58,12 @@ class SnowflakeAdapter(BaseAdapter):
         "desc": "describe",
     }
 
+    _list_types: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("database", "databases"),
+        ("schema", "schemas"),
+        ("warehouse", "warehouses"),
+    )
+
     @property
     def target_type(self) -> str:
         return "snowflake"
@@ -86,14 +92,6 @@ class SnowflakeAdapter(BaseAdapter):
                     break
 
         if category == "list":
-            lowered = tool_name.lower()
-            if "database" in lowered:
-                evidence["list_type"] = "databases"
-            elif "schema" in lowered:
-                evidence["list_type"] = "schemas"
-            elif "warehouse" in lowered:
-                evidence["list_type"] = "warehouses"
-            else:
-                evidence["list_type"] = "tables"
+            evidence["list_type"] = self._list_type(tool_name)
 
         return evidence
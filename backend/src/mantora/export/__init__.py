@@ -2,7 +2,13 @@
 
 from mantora.export.cast_json import export_cast_json
 from mantora.export.cast_md import export_cast_md
-from mantora.export.session_json import export_session_json
+from mantora.export.session_json import export_session_json, iter_export_session_json
 from mantora.export.session_md import export_session_md
 
-__all__ = ["export_cast_json", "export_cast_md", "export_session_json", "export_session_md"]
+__all__ = [
+    "export_cast_json",
+    "export_cast_md",
+    "export_session_json",
+    "export_session_md",
+    "iter_export_session_json",
+]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from typing import Any
 from uuid import UUID
 
@@ -20,21 +21,29 @@ def export_session_json(*, store: SessionStore, session_id: UUID, caps: Caps) ->
     Per DEC-V0-REPLAY-TIMELINE: steps are exported in timeline order.
     Per PRI-HARD-CAPS-ALWAYS: export is bounded by caps.
     """
+    return "".join(iter_export_session_json(store=store, session_id=session_id, caps=caps))
+
+
+def iter_export_session_json(*, store: SessionStore, session_id: UUID, caps: Caps) -> Iterator[str]:
+    """Yield ``export_session_json`` output in chunks, one step or cast at a time.
+
+    The concatenated chunks are byte-identical to ``export_session_json``. Raises
+    KeyError before yielding anything if the session does not exist.
+    """
     session = store.get_session(session_id)
     if session is None:
         raise KeyError(session_id)
 
-    steps_all = list(store.list_steps(session_id))
-    casts_all = list(store.list_casts(session_id))
-
+    # Read one row past the cap: it only tells us whether the export is truncated.
     max_items = caps.max_preview_rows
-    steps = steps_all[:max_items]
-    casts = casts_all[:max_items]
+    steps = list(store.list_steps(session_id, limit=max_items + 1))
+    casts = list(store.list_casts(session_id, limit=max_items + 1))
 
-    steps_truncated = len(steps_all) > len(steps)
-    casts_truncated = len(casts_all) > len(casts)
+    steps_truncated = len(steps) > max_items
+    casts_truncated = len(casts) > max_items
+    del steps[max_items:], casts[max_items:]
 
-    payload: dict[str, Any] = {
+    sections: dict[str, Any] = {
         "schema_version": SCHEMA_VERSION,
         "session": {
             "id": str(session.id),
@@ -51,15 +60,34 @@ def export_session_json(*, store: SessionStore, session_id: UUID, caps: Caps) ->
             "casts_truncated": casts_truncated,
             "max_items": max_items,
         },
-        "steps": [_step_to_export(step=s, caps=caps) for s in steps],
-        "casts": [_cast_to_export(c=c, caps=caps) for c in casts],
+        "steps": (_step_to_export(step=s, caps=caps) for s in steps),
+        "casts": (_cast_to_export(c=c, caps=caps) for c in casts),
     }
-
+    return _iter_sorted_json_object(sections)
+
+
+def _iter_sorted_json_object(sections: dict[str, Any]) -> Iterator[str]:
+    # Emits exactly what json.dumps(..., sort_keys=True, indent=2) would for this
+    # object, except that generator values are encoded lazily as arrays. Indentation
+    # is applied by re-indenting nested dumps; JSON strings never contain raw newlines.
+    yield "{"
+    for i, key in enumerate(sorted(sections)):
+        yield ("\n  " if i == 0 else ",\n  ") + _dumps(key) + ":"
+        value = sections[key]
+        if not isinstance(value, Iterator):
+            yield _dumps(value).replace("\n", "\n  ")
+            continue
+        empty = True
+        for item in value:
+            yield ("[\n    " if empty else ",\n    ") + _dumps(item).replace("\n", "\n    ")
+            empty = False
+        yield "[]" if empty else "\n  ]"
+    yield "\n}\n"
+
+
+def _dumps(value: Any) -> str:
     # Deterministic output: stable key ordering + stable separators.
-    return (
-        json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), indent=2)
-        + "\n"
-    )
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), indent=2)
 
 
 def _step_to_export(*, step: ObservedStep, caps: Caps) -> dict[str, Any]:
@@ -39,6 +39,7 @@ from mantora.connectors.registry import get_adapter
 from mantora.context import ContextResolver
 from mantora.mcp.tools import CastTools, SessionTools
 from mantora.models.events import ObservedStep, SessionContext, TruncatedText
+from mantora.models.ids import uuid7
 from mantora.policy.allowlist import is_tool_known_safe
 from mantora.policy.blocker import PendingDecision, PendingRequest, PendingStatus, blocker_summary
 from mantora.policy.linter import extract_tables_touched, lint_sql
@@ -341,7 +342,7 @@ class MCPProxy:
         Blocking is synchronous from the agent's perspective: we do not return until decided.
         """
         start_time = time.perf_counter()
-        step_id = uuid4()  # Pre-allocate ID to link artifacts (like casts) to this step
+        step_id = uuid7()  # Pre-allocate ID to link artifacts (like casts) to this step
         cast_result: dict[str, Any] | None = None
         rpc_is_error = False
 
@@ -39,7 +39,8 @@ _PROJECT_KEYS = {"project", "project_id", "projectid"}
 def sanitize_trace_payload(payload: Any) -> Any:
     """Sanitize a JSON-like payload for writing to golden fixtures.
 
-    This function is deterministic and safe to run repeatedly.
+    This function is deterministic and safe to run repeatedly. Dict keys come back
+    in sorted order, so callers can serialize the result without ``sort_keys``.
     """
     return _sanitize(payload, parent_key=None)
 
@@ -47,7 +48,7 @@ def sanitize_trace_payload(payload: Any) -> Any:
 def _sanitize(value: Any, *, parent_key: str | None) -> Any:
     if isinstance(value, dict):
         sanitized: dict[str, Any] = {}
-        for key, item in value.items():
+        for key, item in sorted(value.items(), key=lambda kv: str(kv[0])):
             key_str = str(key)
             sanitized[key_str] = _sanitize(item, parent_key=key_str)
         return sanitized
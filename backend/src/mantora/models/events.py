@@ -38,6 +38,27 @@ class Session(BaseModel):
     context: SessionContext | None = None
 
 
+class SessionListContext(BaseModel):
+    """Context fields shown in the sessions list (subset of SessionContext)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    repo_name: str | None = None
+    branch: str | None = None
+    tag: str | None = None
+
+
+class SessionListRow(BaseModel):
+    """Lightweight projection of a session for list views."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID
+    title: str | None
+    created_at: datetime
+    context: SessionListContext | None = None
+
+
 ObservedStepKind = Literal["tool_call", "tool_result", "note", "blocker", "blocker_decision"]
 StepCategory = Literal["query", "schema", "list", "cast", "unknown"]
 StepDecision = Literal["pending", "allowed", "denied", "timeout"]
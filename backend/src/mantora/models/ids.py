@@ -0,0 +1,67 @@
+"""Time-ordered identifiers for high-volume records (steps).
+
+UUIDv7 (RFC 9562) puts a millisecond Unix timestamp in the high bits, so ids for
+steps created in sequence are (mostly) increasing. That keeps inserts into the
+``steps`` primary-key index append-only and matches the ``(created_at, id)``
+ordering used to page steps.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Random bits are drawn from a pre-filled buffer instead of one urandom call per id.
+_ENTROPY_CHUNK = 4096
+_RAND_BYTES = 10
+_entropy = b""
+_entropy_pos = 0
+_entropy_lock = threading.Lock()
+
+
+def _random_bytes() -> bytes:
+    global _entropy, _entropy_pos
+    with _entropy_lock:
+        if _entropy_pos + _RAND_BYTES > len(_entropy):
+            _entropy = os.urandom(_ENTROPY_CHUNK)
+            _entropy_pos = 0
+        chunk = _entropy[_entropy_pos : _entropy_pos + _RAND_BYTES]
+        _entropy_pos += _RAND_BYTES
+    return chunk
+
+
+def _reset_entropy() -> None:
+    # A forked child must not replay the parent's unused random bytes as its own ids.
+    global _entropy, _entropy_pos, _entropy_lock
+    _entropy = b""
+    _entropy_pos = 0
+    _entropy_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reset_entropy)
+
+
+def uuid7(unix_ns: int | None = None) -> UUID:
+    """Return a UUIDv7 for ``unix_ns`` (defaults to the current time)."""
+    if unix_ns is None:
+        unix_ns = time.time_ns()
+    rand = int.from_bytes(_random_bytes(), "big")
+    unix_ms = unix_ns // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 68) & 0xFFF) << 64  # rand_a (12 bits)
+    value |= 0b10 << 62  # RFC 9562 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b (62 bits)
+    return UUID(int=value)
+
+
+def timestamped_uuid7() -> tuple[datetime, UUID]:
+    """Return ``(created_at, id)`` derived from a single clock read."""
+    unix_ns = time.time_ns()
+    return _EPOCH + timedelta(microseconds=unix_ns // 1000), uuid7(unix_ns)
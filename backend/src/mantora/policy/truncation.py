@@ -2,6 +2,15 @@ from __future__ import annotations
 
 
 def cap_text(text: str, *, max_bytes: int) -> tuple[str, bool]:
+    # UTF-8 needs at most 4 bytes per code point, so short text cannot exceed the cap.
+    if len(text) * 4 <= max_bytes:
+        return text, False
+    # ASCII text is one byte per character: slice the str without encoding it.
+    if text.isascii():
+        if len(text) <= max_bytes:
+            return text, False
+        return text[:max_bytes], True
+
     raw = text.encode("utf-8")
     if len(raw) <= max_bytes:
         return text, False
@@ -0,0 +1,28 @@
+"""Shared SQLite connection setup for the session store and retention pruning."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the store's PRAGMA set to a freshly opened connection.
+
+    WAL lets readers proceed while a write is in flight. WAL cannot be enabled for
+    in-memory databases (or on some network filesystems); SQLite keeps the old
+    journal mode silently, so the result is checked and logged.
+    """
+    conn.execute("PRAGMA foreign_keys = ON")
+    row = conn.execute("PRAGMA journal_mode = WAL").fetchone()
+    if row is None or str(row[0]).lower() != "wal":
+        logger.warning("SQLite WAL mode unavailable; journal_mode=%s", row[0] if row else None)
+    # NORMAL is crash-safe in WAL mode (only a power loss can drop the last commits)
+    # and avoids an fsync on every autocommit write.
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+    conn.execute("PRAGMA wal_autocheckpoint = 1000")  # Auto-checkpoint every 1000 pages
+    conn.execute("PRAGMA busy_timeout = 30000")  # 30 second busy timeout
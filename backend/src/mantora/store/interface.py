@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Sequence
 from datetime import datetime
 from typing import Protocol
@@ -9,9 +8,16 @@ from uuid import UUID
 from pydantic import JsonValue
 
 from mantora.casts.models import Cast
-from mantora.models.events import ObservedStep, Session, SessionContext
+from mantora.models.events import (
+    ObservedStep,
+    Session,
+    SessionContext,
+    SessionListRow,
+    SessionSummary,
+)
 from mantora.models.targets import Target
 from mantora.policy.blocker import PendingRequest, PendingStatus
+from mantora.store.notify import StepNotifier
 
 
 class SessionStore(Protocol):
@@ -35,6 +41,20 @@ class SessionStore(Protocol):
         has_blocks: bool | None = None,
     ) -> Sequence[Session]: ...
 
+    def list_session_rows(
+        self,
+        *,
+        q: str | None = None,
+        tag: str | None = None,
+        repo_name: str | None = None,
+        branch: str | None = None,
+        since: datetime | None = None,
+        has_warnings: bool | None = None,
+        has_blocks: bool | None = None,
+    ) -> Sequence[SessionListRow]:
+        """Like ``list_sessions`` but only loads the fields a list view renders."""
+        ...
+
     def get_session(self, session_id: UUID) -> Session | None: ...
 
     def update_session_tag(self, session_id: UUID, *, tag: str | None) -> Session | None: ...
@@ -82,14 +102,43 @@ class SessionStore(Protocol):
         """
         ...
 
-    def list_steps(self, session_id: UUID) -> Sequence[ObservedStep]: ...
+    def list_steps(self, session_id: UUID, *, limit: int | None = None) -> Sequence[ObservedStep]:
+        """Steps in timeline order; at most ``limit`` of them when given."""
+        ...
+
+    def list_steps_after(
+        self,
+        session_id: UUID,
+        *,
+        cursor: tuple[datetime, UUID] | None,
+        limit: int = 100,
+    ) -> Sequence[ObservedStep]:
+        """List up to ``limit`` steps ordered after ``cursor``.
+
+        Steps are ordered by ``(created_at, id)``; ``cursor`` is that key for the last
+        step already seen, or None to start from the beginning.
+        """
+        ...
+
+    def get_session_summary(self, session_id: UUID) -> SessionSummary:
+        """Aggregate step counts for a session without loading step payloads.
 
-    def get_step_queue(self, session_id: UUID) -> asyncio.Queue[ObservedStep] | None: ...
+        Unknown sessions (or sessions without steps) yield all-zero counts.
+        """
+        ...
+
+    def get_session_rollup(self, session_id: UUID) -> SessionSummary:
+        """Like ``get_session_summary`` plus duration, status and tables touched."""
+        ...
+
+    def get_step_notifier(self, session_id: UUID) -> StepNotifier | None: ...
 
     # Cast artifact methods
     def add_cast(self, cast: Cast) -> None: ...
 
-    def list_casts(self, session_id: UUID) -> Sequence[Cast]: ...
+    def list_casts(self, session_id: UUID, *, limit: int | None = None) -> Sequence[Cast]:
+        """Casts in creation order; at most ``limit`` of them when given."""
+        ...
 
     def get_cast(self, cast_id: UUID) -> Cast | None: ...
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Sequence
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
@@ -8,17 +7,26 @@ from uuid import UUID, uuid4
 from pydantic import JsonValue
 
 from mantora.casts.models import Cast
-from mantora.models.events import ObservedStep, Session, SessionContext
+from mantora.models.events import (
+    ObservedStep,
+    Session,
+    SessionContext,
+    SessionListContext,
+    SessionListRow,
+    SessionSummary,
+)
 from mantora.models.targets import Target
 from mantora.policy.blocker import PendingRequest, PendingStatus
 from mantora.store.interface import SessionStore
+from mantora.store.notify import StepNotifier
+from mantora.store.summary import rollup_steps, summarize_steps
 
 
 class MemorySessionStore(SessionStore):
     def __init__(self) -> None:
         self._sessions: dict[UUID, Session] = {}
         self._steps: dict[UUID, list[ObservedStep]] = {}
-        self._queues: dict[UUID, asyncio.Queue[ObservedStep]] = {}
+        self._notifiers: dict[UUID, StepNotifier] = {}
         self._casts: dict[UUID, Cast] = {}  # cast_id -> Cast
         self._session_casts: dict[UUID, list[UUID]] = {}  # session_id -> cast_ids
         self._pending: dict[UUID, PendingRequest] = {}  # request_id -> PendingRequest
@@ -39,7 +47,7 @@ class MemorySessionStore(SessionStore):
         self._sessions[session_id] = session
         self._session_client_ids[session_id] = client_id
         self._steps[session_id] = []
-        self._queues[session_id] = asyncio.Queue()
+        self._notifiers[session_id] = StepNotifier()
         self._session_casts[session_id] = []
         return session
 
@@ -94,6 +102,42 @@ class MemorySessionStore(SessionStore):
         filtered = [s for s in sessions if matches(s)]
         return sorted(filtered, key=lambda s: s.created_at, reverse=True)
 
+    def list_session_rows(
+        self,
+        *,
+        q: str | None = None,
+        tag: str | None = None,
+        repo_name: str | None = None,
+        branch: str | None = None,
+        since: datetime | None = None,
+        has_warnings: bool | None = None,
+        has_blocks: bool | None = None,
+    ) -> Sequence[SessionListRow]:
+        sessions = self.list_sessions(
+            q=q,
+            tag=tag,
+            repo_name=repo_name,
+            branch=branch,
+            since=since,
+            has_warnings=has_warnings,
+            has_blocks=has_blocks,
+        )
+        return [
+            SessionListRow(
+                id=s.id,
+                title=s.title,
+                created_at=s.created_at,
+                context=(
+                    SessionListContext(
+                        repo_name=s.context.repo_name, branch=s.context.branch, tag=s.context.tag
+                    )
+                    if s.context is not None
+                    else None
+                ),
+            )
+            for s in sessions
+        ]
+
     def get_session(self, session_id: UUID) -> Session | None:
         return self._sessions.get(session_id)
 
@@ -159,8 +203,8 @@ class MemorySessionStore(SessionStore):
             self._session_client_ids.pop(session_id, None)
             if session_id in self._steps:
                 del self._steps[session_id]
-            if session_id in self._queues:
-                del self._queues[session_id]
+            if session_id in self._notifiers:
+                del self._notifiers[session_id]
 
             # Clean up casts
             cast_ids = self._session_casts.get(session_id, [])
@@ -183,7 +227,7 @@ class MemorySessionStore(SessionStore):
             raise KeyError(step.session_id)
 
         self._steps[step.session_id].append(step)
-        self._queues[step.session_id].put_nowait(step)
+        self._notifiers[step.session_id].notify()
 
     def update_step(
         self,
@@ -218,16 +262,34 @@ class MemorySessionStore(SessionStore):
                         decision=updated_decision,
                     )
                     self._steps[session_id][i] = updated_step
-                    # Notify via queue
-                    self._queues[session_id].put_nowait(updated_step)
+                    self._notifiers[session_id].notify()
                     return True
         return False
 
-    def list_steps(self, session_id: UUID) -> Sequence[ObservedStep]:
-        return list(self._steps.get(session_id, []))
+    def list_steps(self, session_id: UUID, *, limit: int | None = None) -> Sequence[ObservedStep]:
+        return self._steps.get(session_id, [])[:limit]
+
+    def list_steps_after(
+        self,
+        session_id: UUID,
+        *,
+        cursor: tuple[datetime, UUID] | None,
+        limit: int = 100,
+    ) -> Sequence[ObservedStep]:
+        steps = sorted(self._steps.get(session_id, []), key=lambda s: (s.created_at, str(s.id)))
+        if cursor is not None:
+            after = (cursor[0], str(cursor[1]))
+            steps = [s for s in steps if (s.created_at, str(s.id)) > after]
+        return steps[:limit]
+
+    def get_session_summary(self, session_id: UUID) -> SessionSummary:
+        return summarize_steps(self._steps.get(session_id, []))
+
+    def get_session_rollup(self, session_id: UUID) -> SessionSummary:
+        return rollup_steps(self._steps.get(session_id, []))
 
-    def get_step_queue(self, session_id: UUID) -> asyncio.Queue[ObservedStep] | None:
-        return self._queues.get(session_id)
+    def get_step_notifier(self, session_id: UUID) -> StepNotifier | None:
+        return self._notifiers.get(session_id)
 
     def add_cast(self, cast: Cast) -> None:
         if cast.session_id not in self._sessions:
@@ -236,9 +298,9 @@ class MemorySessionStore(SessionStore):
         self._casts[cast.id] = cast
         self._session_casts[cast.session_id].append(cast.id)
 
-    def list_casts(self, session_id: UUID) -> Sequence[Cast]:
+    def list_casts(self, session_id: UUID, *, limit: int | None = None) -> Sequence[Cast]:
         cast_ids = self._session_casts.get(session_id, [])
-        return [self._casts[cid] for cid in cast_ids if cid in self._casts]
+        return [self._casts[cid] for cid in cast_ids if cid in self._casts][:limit]
 
     def get_cast(self, cast_id: UUID) -> Cast | None:
         return self._casts.get(cast_id)
@@ -0,0 +1,42 @@
+"""Wake-ups for SSE subscribers when a session's steps change.
+
+Steps are written from FastAPI's threadpool (sync routes) while stream handlers wait
+on an event loop, so notifications are handed to each subscriber's loop with
+``call_soon_threadsafe`` rather than touching asyncio objects from the writer thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+
+
+class StepNotifier:
+    """Fan-out of "steps changed" signals to every subscriber of one session."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Event]:
+        """Register an event on the running loop that is set whenever steps change."""
+        entry = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._subscribers.append(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                self._subscribers.remove(entry)
+
+    def notify(self) -> None:
+        """Wake every subscriber. Safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, event in subscribers:
+            # The subscriber's loop may already be closed during shutdown.
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(event.set)
@@ -5,6 +5,8 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import cast
 
+from mantora.store.connection import configure_connection
+
 
 def _db_size_bytes(db_path: Path) -> int:
     try:
@@ -19,7 +21,7 @@ def prune_sqlite_sessions(
     cutoff = datetime.now(UTC) - timedelta(days=retention_days)
     conn = sqlite3.connect(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
+        configure_connection(conn)
         pruned = 0
         if retention_days > 0:
             row = conn.execute(
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import queue
 import sqlite3
 import threading
-from collections.abc import Sequence
-from contextlib import suppress
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal, cast
@@ -21,12 +24,93 @@ from mantora.models.events import (
     ObservedStepKind,
     Session,
     SessionContext,
+    SessionListContext,
+    SessionListRow,
+    SessionSummary,
     TruncatedText,
 )
 from mantora.models.targets import Target
 from mantora.policy.blocker import PendingRequest, PendingStatus
+from mantora.store.connection import configure_connection
 from mantora.store.interface import SessionStore
+from mantora.store.notify import StepNotifier
 from mantora.store.retention import prune_sqlite_sessions
+from mantora.store.summary import CAST_TOOL_NAMES, QUERY_TOOL_NAMES, with_rollup
+
+# Columns read by _row_to_step; shared by the step list queries.
+_STEP_COLUMNS = ", ".join(
+    (
+        "id",
+        "session_id",
+        "created_at",
+        "kind",
+        "name",
+        "status",
+        "duration_ms",
+        "summary_text",
+        "risk_level",
+        "warnings_json",
+        "target_type",
+        "tool_category",
+        "sql_text",
+        "sql_truncated",
+        "sql_classification",
+        "policy_rule_ids_json",
+        "decision",
+        "result_rows_shown",
+        "result_rows_total",
+        "captured_bytes",
+        "error_message",
+        "tables_touched_json",
+        "args_json",
+        "result_json",
+        "preview_text",
+        "preview_truncated",
+    )
+)
+
+
+# Union a step's tables into the session's sorted, de-duplicated tables_touched_json.
+_MERGE_SESSION_TABLES_SQL = """
+UPDATE sessions SET tables_touched_json = (
+    SELECT json_group_array(value) FROM (
+        SELECT value FROM json_each(coalesce(sessions.tables_touched_json, '[]'))
+        UNION
+        SELECT value FROM json_each(?)
+        ORDER BY value
+    )
+)
+WHERE id = ?
+""".strip()
+
+# Rebuild tables_touched_json for every session from its steps (migration backfill).
+_BACKFILL_SESSION_TABLES_SQL = """
+UPDATE sessions SET tables_touched_json = (
+    SELECT json_group_array(value) FROM (
+        SELECT DISTINCT t.value AS value
+        FROM steps, json_each(steps.tables_touched_json) AS t
+        WHERE steps.session_id = sessions.id AND steps.tables_touched_json IS NOT NULL
+        ORDER BY value
+    )
+)
+""".strip()
+
+
+def _sql_limit(limit: int | None) -> int:
+    # A negative LIMIT means "no limit" in SQLite.
+    return -1 if limit is None else limit
+
+
+@dataclass
+class _StepWrite:
+    """A step row waiting for the next group commit in ``SQLiteSessionStore.add_step``."""
+
+    row: tuple[object, ...]
+    session_id: UUID
+    tables_touched: list[str] | None
+    done: bool = False
+    error: Exception | None = None
+    crossed_prune_interval: bool = False
 
 
 def _connect(db_path: Path) -> sqlite3.Connection:
@@ -34,11 +118,7 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     # timeout=30.0 allows waiting for locks (essential for DELETE mode contention)
     conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30.0)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
-    conn.execute("PRAGMA synchronous = FULL")
-    conn.execute("PRAGMA wal_autocheckpoint = 1000")  # Auto-checkpoint every 1000 pages
-    conn.execute("PRAGMA busy_timeout = 30000")  # 30 second busy timeout
+    configure_connection(conn)
     return conn
 
 
@@ -53,22 +133,64 @@ class SQLiteSessionStore(SessionStore):
         self._db_path = db_path
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # One writer connection serialized by _lock, plus a pool of reader connections.
+        # WAL lets readers run concurrently with each other and with the writer.
         self._conn = _connect(self._db_path)
-        self._lock = threading.Lock()
+        # Reentrant so the thread inside transaction() can keep writing while it holds it.
+        self._lock = threading.RLock()
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._max_idle_readers = os.cpu_count() or 4
+        # Guards _closed against readers being returned while close() drains the pool.
+        self._readers_lock = threading.Lock()
+        self._closed = False
         self._prune_lock = threading.Lock()
 
-        self._queues: dict[UUID, asyncio.Queue[ObservedStep]] = {}
+        self._notifiers: dict[UUID, StepNotifier] = {}
+        self._pending_lock = threading.Lock()
+        self._pending_steps: list[_StepWrite] = []
 
         limits = LimitsConfig()
         self._retention_days = limits.retention_days if retention_days is None else retention_days
         self._max_db_bytes = limits.max_db_bytes if max_db_bytes is None else max_db_bytes
         self._step_count = 0
+        # Thread id of the caller inside transaction(), if any.
+        self._transaction_owner: int | None = None
 
         self._init_schema()
 
     def close(self) -> None:
         with self._lock:
             self._conn.close()
+        with self._readers_lock:
+            self._closed = True
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool (opening one if none is idle)."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = _connect(self._db_path)
+            conn.execute("PRAGMA query_only = ON")
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            # Readers still borrowed when close() ran are closed on return, not pooled.
+            with self._readers_lock:
+                keep = not self._closed and self._readers.qsize() < self._max_idle_readers
+                if keep:
+                    self._readers.put(conn)
+            if not keep:
+                conn.close()
 
     def _init_schema(self) -> None:
         with self._lock:
@@ -85,7 +207,8 @@ class SQLiteSessionStore(SessionStore):
                     commit_sha TEXT,
                     is_dirty INTEGER,
                     config_source TEXT,
-                    tag TEXT
+                    tag TEXT,
+                    tables_touched_json TEXT
                 )
                 """
             )
@@ -243,10 +366,22 @@ class SQLiteSessionStore(SessionStore):
             self._conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_sessions_branch ON sessions(branch_name)"
             )
+            # Composite indexes for the list filters; they also serve the
+            # ORDER BY created_at DESC without a separate sort.
+            self._conn.execute("DROP INDEX IF EXISTS idx_sessions_repo")
+            self._conn.execute("DROP INDEX IF EXISTS idx_sessions_tag")
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_sessions_repo_branch_created_at
+                ON sessions(repo_name, branch_name, created_at)
+                """
+            )
             self._conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_sessions_repo ON sessions(repo_name)"
+                """
+                CREATE INDEX IF NOT EXISTS idx_sessions_tag_created_at
+                ON sessions(tag, created_at)
+                """
             )
-            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_tag ON sessions(tag)")
 
             # Lightweight migrations for older DBs (add columns if missing)
             step_cols = {row["name"] for row in self._conn.execute("PRAGMA table_info(steps)")}
@@ -280,16 +415,69 @@ class SQLiteSessionStore(SessionStore):
                 self._conn.execute("ALTER TABLE steps ADD COLUMN error_message TEXT")
             if "tables_touched_json" not in step_cols:
                 self._conn.execute("ALTER TABLE steps ADD COLUMN tables_touched_json TEXT")
+            # Partial indexes backing the has_warnings / has_blocks EXISTS filters.
+            # Their WHERE clauses must match _session_filters for SQLite to use them.
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_steps_session_warnings
+                ON steps(session_id)
+                WHERE warnings_json IS NOT NULL AND warnings_json != '[]'
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_steps_session_blockers
+                ON steps(session_id) WHERE kind = 'blocker'
+                """
+            )
+
+            # Added after steps.tables_touched_json so the backfill can read it.
+            if "tables_touched_json" not in session_cols:
+                self._conn.execute("ALTER TABLE sessions ADD COLUMN tables_touched_json TEXT")
+                self._conn.execute(_BACKFILL_SESSION_TABLES_SQL)
+        self._checkpoint()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes made through this store into a single SQLite transaction.
+
+        Checkpoints and pruning are deferred until the transaction commits.
+        Reads that open their own connection do not see uncommitted rows.
+        The write lock is held for the whole block, so writes from other threads
+        wait and commit on their own instead of joining this transaction.
+        Not reentrant.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._transaction_owner = threading.get_ident()
+            try:
+                yield
+            except BaseException:
+                self._transaction_owner = None
+                self._conn.execute("ROLLBACK")
+                raise
+            self._transaction_owner = None
+            self._conn.execute("COMMIT")
         self._checkpoint()
 
+    @property
+    def _in_transaction(self) -> bool:
+        """Whether the calling thread is inside ``transaction()``."""
+        return self._transaction_owner == threading.get_ident()
+
     def _checkpoint(self) -> None:
         """Force a WAL checkpoint to ensure data is visible to the Docker app."""
+        if self._in_transaction:
+            return
         with self._lock, suppress(Exception):
             self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     def _schedule_prune(self) -> None:
         if self._retention_days <= 0 and self._max_db_bytes <= 0:
             return
+        if self._in_transaction:
+            # Pruning uses its own connection and would wait on our write lock.
+            return
 
         try:
             loop = asyncio.get_running_loop()
@@ -368,9 +556,66 @@ class SQLiteSessionStore(SessionStore):
         self._checkpoint()
 
         session = Session(id=session_id, title=title, created_at=created_at, context=context)
-        self._queues[session_id] = asyncio.Queue()
+        self._notifiers[session_id] = StepNotifier()
         return session
 
+    @staticmethod
+    def _session_filters(
+        *,
+        q: str | None,
+        tag: str | None,
+        repo_name: str | None,
+        branch: str | None,
+        since: datetime | None,
+        has_warnings: bool | None,
+        has_blocks: bool | None,
+    ) -> tuple[str, list[object]]:
+        """Build the ``WHERE`` clause and parameters shared by the session list queries."""
+        where: list[str] = []
+        params: list[object] = []
+
+        if tag is not None:
+            where.append("tag = ?")
+            params.append(tag)
+        if repo_name is not None:
+            where.append("repo_name = ?")
+            params.append(repo_name)
+        if branch is not None:
+            where.append("branch_name = ?")
+            params.append(branch)
+        if since is not None:
+            where.append("created_at >= ?")
+            params.append(since.isoformat())
+
+        if has_warnings is not None:
+            clause = (
+                "EXISTS (SELECT 1 FROM steps WHERE steps.session_id = sessions.id "
+                "AND warnings_json IS NOT NULL AND warnings_json != '[]')"
+            )
+            where.append(clause if has_warnings else f"NOT {clause}")
+
+        if has_blocks is not None:
+            clause = (
+                "EXISTS (SELECT 1 FROM steps WHERE steps.session_id = sessions.id "
+                "AND kind = 'blocker')"
+            )
+            where.append(clause if has_blocks else f"NOT {clause}")
+
+        if q is not None and q.strip():
+            needle = f"%{q.strip().lower()}%"
+            where.append(
+                "("
+                "LOWER(COALESCE(title, '')) LIKE ? OR "
+                "LOWER(COALESCE(repo_name, '')) LIKE ? OR "
+                "LOWER(COALESCE(branch_name, '')) LIKE ? OR "
+                "LOWER(COALESCE(tag, '')) LIKE ?"
+                ")"
+            )
+            params.extend([needle, needle, needle, needle])
+
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        return where_sql, params
+
     def list_sessions(
         self,
         *,
@@ -382,73 +627,36 @@ class SQLiteSessionStore(SessionStore):
         has_warnings: bool | None = None,
         has_blocks: bool | None = None,
     ) -> Sequence[Session]:
-        # Create a fresh connection for read operations to ensure WAL visibility
-        conn = _connect(self._db_path)
-        try:
-            where: list[str] = []
-            params: list[object] = []
-
-            if tag is not None:
-                where.append("tag = ?")
-                params.append(tag)
-            if repo_name is not None:
-                where.append("repo_name = ?")
-                params.append(repo_name)
-            if branch is not None:
-                where.append("branch_name = ?")
-                params.append(branch)
-            if since is not None:
-                where.append("created_at >= ?")
-                params.append(since.isoformat())
-
-            if has_warnings is not None:
-                clause = (
-                    "EXISTS (SELECT 1 FROM steps WHERE steps.session_id = sessions.id "
-                    "AND warnings_json IS NOT NULL AND warnings_json != '[]')"
-                )
-                where.append(clause if has_warnings else f"NOT {clause}")
-
-            if has_blocks is not None:
-                clause = (
-                    "EXISTS (SELECT 1 FROM steps WHERE steps.session_id = sessions.id "
-                    "AND kind = 'blocker')"
-                )
-                where.append(clause if has_blocks else f"NOT {clause}")
-
-            if q is not None and q.strip():
-                needle = f"%{q.strip().lower()}%"
-                where.append(
-                    "("
-                    "LOWER(COALESCE(title, '')) LIKE ? OR "
-                    "LOWER(COALESCE(repo_name, '')) LIKE ? OR "
-                    "LOWER(COALESCE(branch_name, '')) LIKE ? OR "
-                    "LOWER(COALESCE(tag, '')) LIKE ?"
-                    ")"
-                )
-                params.extend([needle, needle, needle, needle])
-
-            where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        with self._reader() as conn:
+            where_sql, params = self._session_filters(
+                q=q,
+                tag=tag,
+                repo_name=repo_name,
+                branch=branch,
+                since=since,
+                has_warnings=has_warnings,
+                has_blocks=has_blocks,
+            )
 
-            with self._lock:
-                rows = conn.execute(
-                    f"""
-                    SELECT
-                        id,
-                        title,
-                        created_at,
-                        repo_root,
-                        repo_name,
-                        branch_name,
-                        commit_sha,
-                        is_dirty,
-                        config_source,
-                        tag
-                    FROM sessions
-                    {where_sql}
-                    ORDER BY created_at DESC
-                    """.strip(),
-                    params,
-                ).fetchall()
+            rows = conn.execute(
+                f"""
+                SELECT
+                    id,
+                    title,
+                    created_at,
+                    repo_root,
+                    repo_name,
+                    branch_name,
+                    commit_sha,
+                    is_dirty,
+                    config_source,
+                    tag
+                FROM sessions
+                {where_sql}
+                ORDER BY created_at DESC
+                """.strip(),
+                params,
+            ).fetchall()
 
             sessions: list[Session] = []
             for row in rows:
@@ -497,32 +705,76 @@ class SQLiteSessionStore(SessionStore):
                     )
                 )
             return sessions
-        finally:
-            conn.close()
+
+    def list_session_rows(
+        self,
+        *,
+        q: str | None = None,
+        tag: str | None = None,
+        repo_name: str | None = None,
+        branch: str | None = None,
+        since: datetime | None = None,
+        has_warnings: bool | None = None,
+        has_blocks: bool | None = None,
+    ) -> Sequence[SessionListRow]:
+        with self._reader() as conn:
+            where_sql, params = self._session_filters(
+                q=q,
+                tag=tag,
+                repo_name=repo_name,
+                branch=branch,
+                since=since,
+                has_warnings=has_warnings,
+                has_blocks=has_blocks,
+            )
+            rows = conn.execute(
+                f"""
+                SELECT id, title, created_at, repo_name, branch_name, tag
+                FROM sessions
+                {where_sql}
+                ORDER BY created_at DESC
+                """.strip(),
+                params,
+            ).fetchall()
+
+            return [
+                SessionListRow(
+                    id=UUID(row["id"]),
+                    title=row["title"],
+                    created_at=datetime.fromisoformat(row["created_at"]),
+                    context=(
+                        SessionListContext(
+                            repo_name=row["repo_name"],
+                            branch=row["branch_name"],
+                            tag=row["tag"],
+                        )
+                        if any(row[k] is not None for k in ("repo_name", "branch_name", "tag"))
+                        else None
+                    ),
+                )
+                for row in rows
+            ]
 
     def get_session(self, session_id: UUID) -> Session | None:
-        # Create a fresh connection for read operations to ensure WAL visibility
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    """
-                    SELECT
-                        id,
-                        title,
-                        created_at,
-                        repo_root,
-                        repo_name,
-                        branch_name,
-                        commit_sha,
-                        is_dirty,
-                        config_source,
-                        tag
-                    FROM sessions
-                    WHERE id = ?
-                    """.strip(),
-                    (str(session_id),),
-                ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    id,
+                    title,
+                    created_at,
+                    repo_root,
+                    repo_name,
+                    branch_name,
+                    commit_sha,
+                    is_dirty,
+                    config_source,
+                    tag
+                FROM sessions
+                WHERE id = ?
+                """.strip(),
+                (str(session_id),),
+            ).fetchone()
 
             if row is None:
                 return None
@@ -570,8 +822,6 @@ class SQLiteSessionStore(SessionStore):
                 created_at=datetime.fromisoformat(row["created_at"]),
                 context=context,
             )
-        finally:
-            conn.close()
 
     def update_session_tag(self, session_id: UUID, *, tag: str | None) -> Session | None:
         with self._lock:
@@ -626,34 +876,26 @@ class SQLiteSessionStore(SessionStore):
         return self.get_session(session_id)
 
     def get_session_client_id(self, session_id: UUID) -> str | None:
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    "SELECT client_id FROM sessions WHERE id = ?",
-                    (str(session_id),),
-                ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT client_id FROM sessions WHERE id = ?",
+                (str(session_id),),
+            ).fetchone()
             if row is None:
                 return None
             raw = row["client_id"]
             return raw if isinstance(raw, str) and raw.strip() else None
-        finally:
-            conn.close()
 
     def get_client_default_repo_root(self, client_id: str) -> str | None:
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    "SELECT repo_root FROM client_defaults WHERE client_id = ?",
-                    (client_id,),
-                ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT repo_root FROM client_defaults WHERE client_id = ?",
+                (client_id,),
+            ).fetchone()
             if row is None:
                 return None
             raw = row["repo_root"]
             return raw if isinstance(raw, str) and raw.strip() else None
-        finally:
-            conn.close()
 
     def set_client_default_repo_root(self, client_id: str, *, repo_root: str | None) -> None:
         now = datetime.now(UTC).isoformat()
@@ -681,42 +923,38 @@ class SQLiteSessionStore(SessionStore):
 
     def session_exists(self, session_id: UUID) -> bool:
         """Check if a session exists without fetching full session data."""
-        conn = _connect(self._db_path)
-        try:
+        query = "SELECT 1 FROM sessions WHERE id = ?"
+        if self._in_transaction:
+            # Write paths check existence before inserting; inside transaction() they
+            # must see sessions created earlier in the same block.
             with self._lock:
-                row = conn.execute(
-                    "SELECT 1 FROM sessions WHERE id = ?",
-                    (str(session_id),),
-                ).fetchone()
-            return row is not None
-        finally:
-            conn.close()
+                row = self._conn.execute(query, (str(session_id),)).fetchone()
+        else:
+            with self._reader() as conn:
+                row = conn.execute(query, (str(session_id),)).fetchone()
+        return row is not None
 
     def get_last_active_at(self, session_id: UUID) -> datetime | None:
         """Get the timestamp of the last activity in a session."""
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                # Check if session exists
-                session_row = conn.execute(
-                    "SELECT 1 FROM sessions WHERE id = ?",
-                    (str(session_id),),
-                ).fetchone()
-                if session_row is None:
-                    return None
-
-                # Get the most recent step timestamp
-                step_row = conn.execute(
-                    "SELECT MAX(created_at) as last_active FROM steps WHERE session_id = ?",
-                    (str(session_id),),
-                ).fetchone()
-
-                if step_row is None or step_row["last_active"] is None:
-                    return None
-
-                return datetime.fromisoformat(step_row["last_active"])
-        finally:
-            conn.close()
+        with self._reader() as conn:
+            # Check if session exists
+            session_row = conn.execute(
+                "SELECT 1 FROM sessions WHERE id = ?",
+                (str(session_id),),
+            ).fetchone()
+            if session_row is None:
+                return None
+
+            # Get the most recent step timestamp
+            step_row = conn.execute(
+                "SELECT MAX(created_at) as last_active FROM steps WHERE session_id = ?",
+                (str(session_id),),
+            ).fetchone()
+
+            if step_row is None or step_row["last_active"] is None:
+                return None
+
+            return datetime.fromisoformat(step_row["last_active"])
 
     def delete_session(self, session_id: UUID) -> bool:
         """Delete a session and all related data (steps, casts, pending_requests).
@@ -738,12 +976,159 @@ class SQLiteSessionStore(SessionStore):
                 (str(session_id),),
             )
 
-        # Clean up in-memory queue if present
-        self._queues.pop(session_id, None)
+        # Clean up in-memory notifier if present
+        self._notifiers.pop(session_id, None)
         self._checkpoint()
         return True
 
     def add_step(self, step: ObservedStep) -> None:
+        # Group commit: concurrent writers queue their row, and whichever thread takes
+        # the write lock next inserts every queued row in one transaction.
+        write = _StepWrite(
+            row=self._step_row(step),
+            session_id=step.session_id,
+            tables_touched=step.tables_touched,
+        )
+        if self._in_transaction:
+            # Only this thread's rows may join its transaction; rows queued by other
+            # threads wait for the lock and commit on their own.
+            with self._lock:
+                self._insert_steps([write])
+        else:
+            with self._pending_lock:
+                self._pending_steps.append(write)
+
+        with self._lock:
+            if not write.done:
+                with self._pending_lock:
+                    batch, self._pending_steps = self._pending_steps, []
+                self._insert_steps(batch)
+            should_prune = write.crossed_prune_interval
+        if write.error is not None:
+            raise write.error
+        self._checkpoint()
+
+        notifier = self._notifiers.get(step.session_id)
+        if notifier is not None:
+            notifier.notify()
+        if should_prune:
+            self._schedule_prune()
+
+    @contextmanager
+    def _savepoint(self, name: str) -> Iterator[None]:
+        """Run a block under a SAVEPOINT, undoing only its changes on error."""
+        self._conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute(f"ROLLBACK TO {name}")
+            self._conn.execute(f"RELEASE {name}")
+            raise
+        self._conn.execute(f"RELEASE {name}")
+
+    def _execute_step_writes(self, writes: list[_StepWrite]) -> None:
+        self._conn.executemany(
+            """
+            INSERT INTO steps (
+                id,
+                session_id,
+                created_at,
+                kind,
+                name,
+                status,
+                duration_ms,
+                summary_text,
+                risk_level,
+                warnings_json,
+                target_type,
+                tool_category,
+                sql_text,
+                sql_truncated,
+                sql_classification,
+                policy_rule_ids_json,
+                decision,
+                result_rows_shown,
+                result_rows_total,
+                captured_bytes,
+                error_message,
+                tables_touched_json,
+                args_json,
+                result_json,
+                preview_text,
+                preview_truncated
+            )
+            VALUES (
+                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            )
+            """.strip(),
+            [write.row for write in writes],
+        )
+        self._conn.executemany(
+            _MERGE_SESSION_TABLES_SQL,
+            [
+                (json.dumps(write.tables_touched), str(write.session_id))
+                for write in writes
+                if write.tables_touched
+            ],
+        )
+
+    def _insert_steps(self, batch: list[_StepWrite]) -> None:
+        """Insert queued step rows in a single transaction. Caller holds ``_lock``."""
+        session_ids = sorted({str(write.session_id) for write in batch})
+        placeholders = ",".join("?" * len(session_ids))
+        existing = {
+            row["id"]
+            for row in self._conn.execute(
+                f"SELECT id FROM sessions WHERE id IN ({placeholders})", session_ids
+            ).fetchall()
+        }
+        for write in batch:
+            write.done = True
+            if str(write.session_id) not in existing:
+                write.error = KeyError(write.session_id)
+        writes = [write for write in batch if write.error is None]
+        if not writes:
+            return
+
+        owns_transaction = not self._in_transaction
+        try:
+            if owns_transaction:
+                self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                with self._savepoint("step_batch"):
+                    self._execute_step_writes(writes)
+            except sqlite3.Error:
+                # One bad row (e.g. a retried step id) must not fail the other
+                # writers in the batch: retry each row so errors stay with their writer.
+                for write in writes:
+                    try:
+                        with self._savepoint("step_row"):
+                            self._execute_step_writes([write])
+                    except sqlite3.Error as err:
+                        write.error = err
+            if owns_transaction:
+                self._conn.execute("COMMIT")
+        except sqlite3.Error as err:
+            if owns_transaction:
+                with suppress(sqlite3.Error):
+                    self._conn.execute("ROLLBACK")
+            for write in writes:
+                if write.error is None:
+                    write.error = err
+            return
+
+        inserted = sum(1 for write in writes if write.error is None)
+        if not inserted:
+            return
+
+        before = self._step_count
+        self._step_count += inserted
+        if self._step_count // 100 != before // 100:
+            # Only one writer needs to kick off pruning for the batch.
+            batch[-1].crossed_prune_interval = True
+
+    @staticmethod
+    def _step_row(step: ObservedStep) -> tuple[object, ...]:
         warnings_json = (
             json.dumps(step.warnings, separators=(",", ":")) if step.warnings is not None else None
         )
@@ -780,88 +1165,34 @@ class SQLiteSessionStore(SessionStore):
             preview_text = step.preview.text
             preview_truncated = 1 if step.preview.truncated else 0
 
-        with self._lock:
-            exists = self._conn.execute(
-                "SELECT 1 FROM sessions WHERE id = ?",
-                (str(step.session_id),),
-            ).fetchone()
-            if exists is None:
-                raise KeyError(step.session_id)
-
-            self._conn.execute(
-                """
-                INSERT INTO steps (
-                    id,
-                    session_id,
-                    created_at,
-                    kind,
-                    name,
-                    status,
-                    duration_ms,
-                    summary_text,
-                    risk_level,
-                    warnings_json,
-                    target_type,
-                    tool_category,
-                    sql_text,
-                    sql_truncated,
-                    sql_classification,
-                    policy_rule_ids_json,
-                    decision,
-                    result_rows_shown,
-                    result_rows_total,
-                    captured_bytes,
-                    error_message,
-                    tables_touched_json,
-                    args_json,
-                    result_json,
-                    preview_text,
-                    preview_truncated
-                )
-                VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-                """.strip(),
-                (
-                    str(step.id),
-                    str(step.session_id),
-                    step.created_at.isoformat(),
-                    step.kind,
-                    step.name,
-                    step.status,
-                    step.duration_ms,
-                    step.summary,
-                    step.risk_level,
-                    warnings_json,
-                    step.target_type,
-                    step.tool_category,
-                    sql_text,
-                    sql_truncated,
-                    step.sql_classification,
-                    policy_rule_ids_json,
-                    step.decision,
-                    step.result_rows_shown,
-                    step.result_rows_total,
-                    step.captured_bytes,
-                    step.error_message,
-                    tables_touched_json,
-                    args_json,
-                    result_json,
-                    preview_text,
-                    preview_truncated,
-                ),
-            )
-            self._step_count += 1
-            should_prune = self._step_count % 100 == 0
-        self._checkpoint()
-
-        queue = self._queues.get(step.session_id)
-        if queue is None:
-            queue = asyncio.Queue()
-            self._queues[step.session_id] = queue
-        queue.put_nowait(step)
-        if should_prune:
-            self._schedule_prune()
+        return (
+            str(step.id),
+            str(step.session_id),
+            step.created_at.isoformat(),
+            step.kind,
+            step.name,
+            step.status,
+            step.duration_ms,
+            step.summary,
+            step.risk_level,
+            warnings_json,
+            step.target_type,
+            step.tool_category,
+            sql_text,
+            sql_truncated,
+            step.sql_classification,
+            policy_rule_ids_json,
+            step.decision,
+            step.result_rows_shown,
+            step.result_rows_total,
+            step.captured_bytes,
+            step.error_message,
+            tables_touched_json,
+            args_json,
+            result_json,
+            preview_text,
+            preview_truncated,
+        )
 
     def update_step(
         self,
@@ -905,209 +1236,181 @@ class SQLiteSessionStore(SessionStore):
                 (new_summary, new_status, new_args_json, decision, str(step_id)),
             )
 
+            session_id = UUID(row["session_id"])
+
         self._checkpoint()
 
-        # Fetch the updated step and notify via queue
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    """
-                    SELECT
-                        id, session_id, created_at, kind, name, status,
-                        duration_ms, summary_text, risk_level, warnings_json,
-                        target_type, tool_category,
-                        sql_text, sql_truncated, sql_classification,
-                        policy_rule_ids_json, decision,
-                        result_rows_shown, result_rows_total, captured_bytes, error_message,
-                        args_json, result_json, preview_text, preview_truncated
-                    FROM steps
-                    WHERE id = ?
-                    """,
-                    (str(step_id),),
-                ).fetchone()
-
-            if row:
-                args_parsed = json.loads(row["args_json"]) if row["args_json"] else None
-                result_parsed = json.loads(row["result_json"]) if row["result_json"] else None
-
-                warnings = (
-                    json.loads(row["warnings_json"]) if row["warnings_json"] is not None else None
-                )
-                policy_rule_ids = (
-                    json.loads(row["policy_rule_ids_json"])
-                    if row["policy_rule_ids_json"] is not None
-                    else None
-                )
+        notifier = self._notifiers.get(session_id)
+        if notifier is not None:
+            notifier.notify()
 
-                sql: TruncatedText | None = None
-                if row["sql_text"] is not None:
-                    sql = TruncatedText(
-                        text=row["sql_text"],
-                        truncated=bool(row["sql_truncated"]),
-                    )
+        return True
 
-                preview: TruncatedText | None = None
-                if row["preview_text"] is not None:
-                    preview = TruncatedText(
-                        text=row["preview_text"],
-                        truncated=bool(row["preview_truncated"]),
-                    )
+    def list_steps(self, session_id: UUID, *, limit: int | None = None) -> Sequence[ObservedStep]:
+        with self._reader() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_STEP_COLUMNS}
+                FROM steps
+                WHERE session_id = ?
+                ORDER BY created_at ASC
+                LIMIT ?
+                """.strip(),
+                (str(session_id), _sql_limit(limit)),
+            ).fetchall()
+            return [self._row_to_step(row) for row in rows]
 
-                updated_step = ObservedStep(
-                    id=UUID(row["id"]),
-                    session_id=UUID(row["session_id"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    kind=cast(ObservedStepKind, row["kind"]),
-                    name=row["name"],
-                    status=cast(Literal["ok", "error"], row["status"]),
-                    duration_ms=row["duration_ms"],
-                    summary=row["summary_text"],
-                    risk_level=row["risk_level"],
-                    warnings=warnings,
-                    target_type=row["target_type"],
-                    tool_category=row["tool_category"],
-                    sql=sql,
-                    sql_classification=row["sql_classification"],
-                    policy_rule_ids=policy_rule_ids,
-                    decision=row["decision"],
-                    result_rows_shown=row["result_rows_shown"],
-                    result_rows_total=row["result_rows_total"],
-                    captured_bytes=row["captured_bytes"],
-                    error_message=row["error_message"],
-                    args=args_parsed,
-                    result=result_parsed,
-                    preview=preview,
-                )
+    def list_steps_after(
+        self,
+        session_id: UUID,
+        *,
+        cursor: tuple[datetime, UUID] | None,
+        limit: int = 100,
+    ) -> Sequence[ObservedStep]:
+        with self._reader() as conn:
+            if cursor is None:
+                where_sql = "session_id = ?"
+                params: tuple[object, ...] = (str(session_id),)
+            else:
+                created_at = cursor[0].isoformat()
+                where_sql = "session_id = ? AND (created_at > ? OR (created_at = ? AND id > ?))"
+                params = (str(session_id), created_at, created_at, str(cursor[1]))
+            rows = conn.execute(
+                f"""
+                SELECT {_STEP_COLUMNS}
+                FROM steps
+                WHERE {where_sql}
+                ORDER BY created_at ASC, id ASC
+                LIMIT ?
+                """.strip(),
+                (*params, limit),
+            ).fetchall()
+            return [self._row_to_step(row) for row in rows]
+
+    def _row_to_step(self, row: Any) -> ObservedStep:
+        """Convert a ``steps`` row (selected with ``_STEP_COLUMNS``) to an ObservedStep."""
+        args = json.loads(row["args_json"]) if row["args_json"] is not None else None
+        result = json.loads(row["result_json"]) if row["result_json"] is not None else None
+
+        warnings = json.loads(row["warnings_json"]) if row["warnings_json"] is not None else None
+        tables_touched = (
+            json.loads(row["tables_touched_json"])
+            if row["tables_touched_json"] is not None
+            else None
+        )
+        policy_rule_ids = (
+            json.loads(row["policy_rule_ids_json"])
+            if row["policy_rule_ids_json"] is not None
+            else None
+        )
 
-                session_id = UUID(row["session_id"])
-                queue = self._queues.get(session_id)
-                if queue is None:
-                    queue = asyncio.Queue()
-                    self._queues[session_id] = queue
-                queue.put_nowait(updated_step)
-        finally:
-            conn.close()
+        sql: TruncatedText | None = None
+        if row["sql_text"] is not None:
+            sql = TruncatedText(
+                text=row["sql_text"],
+                truncated=bool(row["sql_truncated"]),
+            )
 
-        return True
+        preview: TruncatedText | None
+        if row["preview_text"] is None:
+            preview = None
+        else:
+            preview = TruncatedText(
+                text=row["preview_text"],
+                truncated=bool(row["preview_truncated"]),
+            )
 
-    def list_steps(self, session_id: UUID) -> Sequence[ObservedStep]:
-        # Create a fresh connection for read operations to ensure WAL visibility
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                rows = conn.execute(
-                    """
-                    SELECT
-                        id,
-                        session_id,
-                        created_at,
-                        kind,
-                        name,
-                        status,
-                        duration_ms,
-                        summary_text,
-                        risk_level,
-                        warnings_json,
-                        target_type,
-                        tool_category,
-                        sql_text,
-                        sql_truncated,
-                        sql_classification,
-                        policy_rule_ids_json,
-                        decision,
-                        result_rows_shown,
-                        result_rows_total,
-                        captured_bytes,
-                        error_message,
-                        tables_touched_json,
-                        args_json,
-                        result_json,
-                        preview_text,
-                        preview_truncated
-                    FROM steps
-                    WHERE session_id = ?
-                    ORDER BY created_at ASC
-                    """.strip(),
-                    (str(session_id),),
-                ).fetchall()
+        return ObservedStep(
+            id=UUID(row["id"]),
+            session_id=UUID(row["session_id"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            kind=cast(ObservedStepKind, row["kind"]),
+            name=row["name"],
+            status=cast(Literal["ok", "error"], row["status"]),
+            duration_ms=row["duration_ms"],
+            summary=row["summary_text"],
+            risk_level=row["risk_level"],
+            warnings=warnings,
+            tables_touched=tables_touched,
+            target_type=row["target_type"],
+            tool_category=row["tool_category"],
+            sql=sql,
+            sql_classification=row["sql_classification"],
+            policy_rule_ids=policy_rule_ids,
+            decision=row["decision"],
+            result_rows_shown=row["result_rows_shown"],
+            result_rows_total=row["result_rows_total"],
+            captured_bytes=row["captured_bytes"],
+            error_message=row["error_message"],
+            args=args,
+            result=result,
+            preview=preview,
+        )
 
-            steps: list[ObservedStep] = []
-            for row in rows:
-                args = json.loads(row["args_json"]) if row["args_json"] is not None else None
-                result = json.loads(row["result_json"]) if row["result_json"] is not None else None
+    def get_session_summary(self, session_id: UUID) -> SessionSummary:
+        summary, _ = self._aggregate_steps(session_id)
+        return summary
 
-                warnings = (
-                    json.loads(row["warnings_json"]) if row["warnings_json"] is not None else None
-                )
-                tables_touched = (
-                    json.loads(row["tables_touched_json"])
-                    if row["tables_touched_json"] is not None
-                    else None
-                )
-                policy_rule_ids = (
-                    json.loads(row["policy_rule_ids_json"])
-                    if row["policy_rule_ids_json"] is not None
-                    else None
-                )
+    def get_session_rollup(self, session_id: UUID) -> SessionSummary:
+        summary, duration_ms_total = self._aggregate_steps(session_id)
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT tables_touched_json FROM sessions WHERE id = ?",
+                (str(session_id),),
+            ).fetchone()
+        tables_json = row["tables_touched_json"] if row is not None else None
+        return with_rollup(
+            summary,
+            duration_ms_total=duration_ms_total,
+            tables_touched=json.loads(tables_json) if tables_json else (),
+        )
 
-                sql: TruncatedText | None = None
-                if row["sql_text"] is not None:
-                    sql = TruncatedText(
-                        text=row["sql_text"],
-                        truncated=bool(row["sql_truncated"]),
-                    )
+    def _aggregate_steps(self, session_id: UUID) -> tuple[SessionSummary, int]:
+        """Count steps in SQL (see ``summarize_steps``) without reading payload columns.
 
-                preview: TruncatedText | None
-                if row["preview_text"] is None:
-                    preview = None
-                else:
-                    preview = TruncatedText(
-                        text=row["preview_text"],
-                        truncated=bool(row["preview_truncated"]),
-                    )
+        Returns the summary and the total ``duration_ms``.
+        """
+        query_names = ", ".join("?" * len(QUERY_TOOL_NAMES))
+        cast_names = ", ".join("?" * len(CAST_TOOL_NAMES))
+        with self._reader() as conn:
+            row = conn.execute(
+                f"""
+                SELECT
+                    COUNT(*) FILTER (WHERE kind = 'tool_call') AS tool_calls,
+                    COUNT(*) FILTER (
+                        WHERE kind = 'tool_call' AND name IN ({query_names})
+                    ) AS queries,
+                    COUNT(*) FILTER (
+                        WHERE kind = 'tool_call' AND name IN ({cast_names})
+                    ) AS casts,
+                    COUNT(*) FILTER (WHERE kind = 'blocker') AS blockers,
+                    COUNT(*) FILTER (
+                        WHERE kind = 'blocker_decision' AND decision = 'allowed'
+                    ) AS allowed_decisions,
+                    COUNT(*) FILTER (WHERE status = 'error') AS errors,
+                    COALESCE(SUM(json_array_length(warnings_json)), 0) AS warnings,
+                    COALESCE(SUM(duration_ms), 0) AS duration_ms_total
+                FROM steps
+                WHERE session_id = ?
+                """.strip(),
+                (*QUERY_TOOL_NAMES, *CAST_TOOL_NAMES, str(session_id)),
+            ).fetchone()
 
-                steps.append(
-                    ObservedStep(
-                        id=UUID(row["id"]),
-                        session_id=UUID(row["session_id"]),
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        kind=cast(ObservedStepKind, row["kind"]),
-                        name=row["name"],
-                        status=cast(Literal["ok", "error"], row["status"]),
-                        duration_ms=row["duration_ms"],
-                        summary=row["summary_text"],
-                        risk_level=row["risk_level"],
-                        warnings=warnings,
-                        tables_touched=tables_touched,
-                        target_type=row["target_type"],
-                        tool_category=row["tool_category"],
-                        sql=sql,
-                        sql_classification=row["sql_classification"],
-                        policy_rule_ids=policy_rule_ids,
-                        decision=row["decision"],
-                        result_rows_shown=row["result_rows_shown"],
-                        result_rows_total=row["result_rows_total"],
-                        captured_bytes=row["captured_bytes"],
-                        error_message=row["error_message"],
-                        args=args,
-                        result=result,
-                        preview=preview,
-                    )
-                )
-            return steps
-        finally:
-            conn.close()
+        summary = SessionSummary(
+            tool_calls=row["tool_calls"],
+            queries=row["queries"],
+            casts=row["casts"],
+            # Net blocks (prevent specific edge cases where allowed > blocked)
+            blocks=max(0, row["blockers"] - row["allowed_decisions"]),
+            errors=row["errors"],
+            warnings=row["warnings"],
+        )
+        return summary, int(row["duration_ms_total"])
 
-    def get_step_queue(self, session_id: UUID) -> asyncio.Queue[ObservedStep] | None:
-        if self.get_session(session_id) is None:
+    def get_step_notifier(self, session_id: UUID) -> StepNotifier | None:
+        if not self.session_exists(session_id):
             return None
-
-        queue = self._queues.get(session_id)
-        if queue is None:
-            queue = asyncio.Queue()
-            self._queues[session_id] = queue
-        return queue
+        return self._notifiers.setdefault(session_id, StepNotifier())
 
     def add_cast(self, cast_obj: Cast) -> None:
         origin_step_ids_json = (
@@ -1170,56 +1473,52 @@ class SQLiteSessionStore(SessionStore):
             )
         self._checkpoint()
 
-    def list_casts(self, session_id: UUID) -> Sequence[Cast]:
-        # Create a fresh connection for read operations to ensure WAL visibility
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                rows = conn.execute(
-                    """
-                    SELECT
-                        id, session_id, created_at, kind, title,
-                        origin_step_id, origin_step_ids_json,
-                        sql, rows_json, total_rows,
-                        vega_lite_spec_json, data_json, markdown, truncated
-                    FROM casts
-                    WHERE session_id = ?
-                    ORDER BY created_at ASC
-                    """,
-                    (str(session_id),),
-                ).fetchall()
+    def list_casts(self, session_id: UUID, *, limit: int | None = None) -> Sequence[Cast]:
+        with self._reader() as conn:
+            rows = conn.execute(
+                """
+                SELECT
+                    id, session_id, created_at, kind, title,
+                    origin_step_id, origin_step_ids_json,
+                    sql, rows_json, total_rows,
+                    vega_lite_spec_json, data_json, markdown, truncated
+                FROM casts
+                WHERE session_id = ?
+                ORDER BY created_at ASC
+                LIMIT ?
+                """,
+                (str(session_id), _sql_limit(limit)),
+            ).fetchall()
 
             return [self._row_to_cast(row) for row in rows]
-        finally:
-            conn.close()
 
     def get_cast(self, cast_id: UUID) -> Cast | None:
-        # Create a fresh connection for read operations to ensure WAL visibility
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    """
-                    SELECT
-                        id, session_id, created_at, kind, title,
-                        origin_step_id, origin_step_ids_json,
-                        sql, rows_json, total_rows,
-                        vega_lite_spec_json, data_json, markdown, truncated
-                    FROM casts
-                    WHERE id = ?
-                    """,
-                    (str(cast_id),),
-                ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    id, session_id, created_at, kind, title,
+                    origin_step_id, origin_step_ids_json,
+                    sql, rows_json, total_rows,
+                    vega_lite_spec_json, data_json, markdown, truncated
+                FROM casts
+                WHERE id = ?
+                """,
+                (str(cast_id),),
+            ).fetchone()
 
             if row is None:
                 return None
 
             return self._row_to_cast(row)
-        finally:
-            conn.close()
 
     def _row_to_cast(self, row: Any) -> Cast:
-        """Convert a database row to a Cast object."""
+        """Convert a database row to a Cast object.
+
+        Casts are validated when they are created, so rows read back from the
+        database are trusted and built with ``model_construct``; revalidating
+        every preview row would dominate ``list_casts`` for large tables.
+        """
         base_kwargs = {
             "id": UUID(row["id"]),
             "session_id": UUID(row["session_id"]),
@@ -1235,8 +1534,9 @@ class SQLiteSessionStore(SessionStore):
 
         kind = row["kind"]
         if kind == "table":
-            return TableCast(
+            return TableCast.model_construct(
                 **base_kwargs,
+                kind="table",
                 sql=row["sql"],
                 rows=json.loads(row["rows_json"]) if row["rows_json"] else [],
                 total_rows=row["total_rows"],
@@ -1257,7 +1557,7 @@ class SQLiteSessionStore(SessionStore):
         reason: str | None,
         blocker_step_id: UUID | None,
     ) -> PendingRequest:
-        if self.get_session(session_id) is None:
+        if not self.session_exists(session_id):
             raise KeyError(session_id)
 
         req_id = request_id or uuid4()
@@ -1307,22 +1607,20 @@ class SQLiteSessionStore(SessionStore):
         )
 
     def get_pending_request(self, request_id: UUID) -> PendingRequest | None:
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    """
-                    SELECT
-                        id, session_id, created_at,
-                        tool_name, arguments_json,
-                        classification, risk_level, reason,
-                        blocker_step_id,
-                        status, decided_at
-                    FROM pending_requests
-                    WHERE id = ?
-                    """.strip(),
-                    (str(request_id),),
-                ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    id, session_id, created_at,
+                    tool_name, arguments_json,
+                    classification, risk_level, reason,
+                    blocker_step_id,
+                    status, decided_at
+                FROM pending_requests
+                WHERE id = ?
+                """.strip(),
+                (str(request_id),),
+            ).fetchone()
             if row is None:
                 return None
 
@@ -1340,14 +1638,11 @@ class SQLiteSessionStore(SessionStore):
                 status=PendingStatus(row["status"]),
                 decided_at=datetime.fromisoformat(row["decided_at"]) if row["decided_at"] else None,
             )
-        finally:
-            conn.close()
 
     def list_pending_requests(
         self, session_id: UUID, *, status: PendingStatus | None = None
     ) -> Sequence[PendingRequest]:
-        conn = _connect(self._db_path)
-        try:
+        with self._reader() as conn:
             sql = """
                 SELECT
                     id, session_id, created_at,
@@ -1364,8 +1659,7 @@ class SQLiteSessionStore(SessionStore):
                 params.append(status.value)
             sql += " ORDER BY created_at ASC"
 
-            with self._lock:
-                rows = conn.execute(sql, tuple(params)).fetchall()
+            rows = conn.execute(sql, tuple(params)).fetchall()
 
             items: list[PendingRequest] = []
             for row in rows:
@@ -1392,8 +1686,6 @@ class SQLiteSessionStore(SessionStore):
                     )
                 )
             return items
-        finally:
-            conn.close()
 
     def decide_pending_request(
         self, request_id: UUID, *, status: PendingStatus
@@ -1506,16 +1798,14 @@ class SQLiteSessionStore(SessionStore):
     def list_targets(self) -> Sequence[Target]:
         """List all configured targets."""
 
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                rows = conn.execute(
-                    """
-                    SELECT id, name, type, command_json, env_json, is_active, created_at, updated_at
-                    FROM targets
-                    ORDER BY created_at DESC
-                    """
-                ).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, name, type, command_json, env_json, is_active, created_at, updated_at
+                FROM targets
+                ORDER BY created_at DESC
+                """
+            ).fetchall()
 
             targets: list[Target] = []
             for row in rows:
@@ -1532,23 +1822,19 @@ class SQLiteSessionStore(SessionStore):
                     )
                 )
             return targets
-        finally:
-            conn.close()
 
     def get_target(self, target_id: UUID) -> Target | None:
         """Get a specific target by ID."""
 
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    """
-                    SELECT id, name, type, command_json, env_json, is_active, created_at, updated_at
-                    FROM targets
-                    WHERE id = ?
-                    """,
-                    (str(target_id),),
-                ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT id, name, type, command_json, env_json, is_active, created_at, updated_at
+                FROM targets
+                WHERE id = ?
+                """,
+                (str(target_id),),
+            ).fetchone()
 
             if row is None:
                 return None
@@ -1563,23 +1849,19 @@ class SQLiteSessionStore(SessionStore):
                 created_at=datetime.fromisoformat(row["created_at"]),
                 updated_at=datetime.fromisoformat(row["updated_at"]),
             )
-        finally:
-            conn.close()
 
     def get_active_target(self) -> Target | None:
         """Get the currently active target."""
 
-        conn = _connect(self._db_path)
-        try:
-            with self._lock:
-                row = conn.execute(
-                    """
-                    SELECT id, name, type, command_json, env_json, is_active, created_at, updated_at
-                    FROM targets
-                    WHERE is_active = 1
-                    LIMIT 1
-                    """
-                ).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT id, name, type, command_json, env_json, is_active, created_at, updated_at
+                FROM targets
+                WHERE is_active = 1
+                LIMIT 1
+                """
+            ).fetchone()
 
             if row is None:
                 return None
@@ -1594,8 +1876,6 @@ class SQLiteSessionStore(SessionStore):
                 created_at=datetime.fromisoformat(row["created_at"]),
                 updated_at=datetime.fromisoformat(row["updated_at"]),
             )
-        finally:
-            conn.close()
 
     def update_target(
         self,
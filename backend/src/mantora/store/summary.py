@@ -0,0 +1,85 @@
+"""Session summary aggregation shared by the session stores.
+
+SQLite computes the same counts in SQL (see ``SQLiteSessionStore.get_session_summary``);
+these helpers define the semantics and back the in-memory store.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from operator import attrgetter
+from typing import Literal
+
+from mantora.models.events import ObservedStep, SessionSummary
+
+# Tool names that count towards the "queries" and "casts" totals.
+QUERY_TOOL_NAMES = frozenset({"query", "cast_table"})
+CAST_TOOL_NAMES = frozenset({"cast_table", "cast_chart", "cast_note"})
+
+
+def summarize_steps(steps: Iterable[ObservedStep]) -> SessionSummary:
+    """Compute summary statistics for a session.
+
+    Args:
+        steps: Steps in the session.
+
+    Returns:
+        SessionSummary with aggregated counts.
+    """
+    steps = list(steps)
+    # Tally with Counter (C-implemented) instead of branching per step in Python.
+    kinds = Counter(map(attrgetter("kind"), steps))
+    tool_names = Counter(s.name for s in steps if s.kind == "tool_call")
+    # Allowed decisions are deducted from blocks.
+    allowed_decisions = sum(
+        1 for s in steps if s.kind == "blocker_decision" and s.decision == "allowed"
+    )
+
+    tool_calls = kinds["tool_call"]
+    queries = sum(tool_names[name] for name in QUERY_TOOL_NAMES)
+    casts = sum(tool_names[name] for name in CAST_TOOL_NAMES)
+    blocks = kinds["blocker"]
+    errors = Counter(map(attrgetter("status"), steps))["error"]
+    warnings_count = sum(len(s.warnings) for s in steps if s.warnings)
+
+    return SessionSummary(
+        tool_calls=tool_calls,
+        queries=queries,
+        casts=casts,
+        # Net blocks (prevent specific edge cases where allowed > blocked)
+        blocks=max(0, blocks - allowed_decisions),
+        errors=errors,
+        warnings=warnings_count,
+    )
+
+
+def with_rollup(
+    summary: SessionSummary, *, duration_ms_total: int, tables_touched: Iterable[str]
+) -> SessionSummary:
+    """Enrich a summary with the detail-view rollup fields."""
+    status: Literal["clean", "warnings", "blocked"]
+    if summary.blocks > 0:
+        status = "blocked"
+    elif summary.warnings > 0:
+        status = "warnings"
+    else:
+        status = "clean"
+
+    return summary.model_copy(
+        update={
+            "duration_ms_total": duration_ms_total,
+            "status": status,
+            "tables_touched": sorted(set(tables_touched)),
+        }
+    )
+
+
+def rollup_steps(steps: Iterable[ObservedStep]) -> SessionSummary:
+    """Compute the summary plus rollup fields for a session's steps."""
+    steps = list(steps)
+    return with_rollup(
+        summarize_steps(steps),
+        duration_ms_total=sum(s.duration_ms or 0 for s in steps),
+        tables_touched=(table for s in steps for table in s.tables_touched or ()),
+    )
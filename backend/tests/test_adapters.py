@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
 from dataclasses import dataclass
 
 import pytest
@@ -16,8 +19,9 @@ from mantora.connectors import (
     get_adapter,
     list_adapters,
 )
-from mantora.connectors.interface import DEFAULT_PREVIEW_CAP_BYTES
+from mantora.connectors.interface import DEFAULT_PREVIEW_CAP_BYTES, BaseAdapter
 from mantora.connectors.registry import GenericAdapter
+from mantora.policy.truncation import cap_text
 
 # --- Adapter Registry Tests ---
 
@@ -73,6 +77,46 @@ def test_get_adapter_case_insensitive() -> None:
     assert isinstance(adapter, DuckDBAdapter)
 
 
+@pytest.mark.parametrize(
+    "adapter_cls",
+    [BigQueryAdapter, DatabricksAdapter, DuckDBAdapter, PostgresAdapter, SnowflakeAdapter],
+)
+def test_resolved_categories_match_alias_lookup(adapter_cls: type[BaseAdapter]) -> None:
+    """Flattened categories agree with resolving the alias then the category."""
+    adapter = adapter_cls()
+    names = {*adapter._tool_categories, *adapter._tool_aliases, "not_a_tool"}
+    for name in names:
+        canonical = adapter._tool_aliases.get(name, name)
+        assert adapter.categorize_tool(name) == adapter._tool_categories.get(canonical, "unknown")
+
+
+def test_connectors_package_loads_adapters_lazily() -> None:
+    code = (
+        "import sys, mantora.connectors.interface as i, mantora.connectors as c; "
+        "before = 'mantora.connectors.registry' in sys.modules; "
+        "print(before, c.get_adapter('duckdb').target_type)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert out.split() == ["False", "duckdb"]
+
+
+def test_register_adapter_replaces_cached_instance() -> None:
+    """Registering an adapter invalidates cached lookups for that type."""
+    from mantora.connectors import registry
+
+    assert isinstance(get_adapter("Custom_DB"), GenericAdapter)
+    registry.register_adapter("custom_db", DuckDBAdapter)
+    try:
+        assert isinstance(get_adapter("Custom_DB"), DuckDBAdapter)
+        assert get_adapter("custom_db") is get_adapter("Custom_DB")
+    finally:
+        registry._ADAPTERS.pop("custom_db")
+        registry._adapter_instances.pop("custom_db", None)
+        get_adapter.cache_clear()
+
+
 def test_list_adapters() -> None:
     """List adapters returns known types."""
     adapters = list_adapters()
@@ -270,6 +314,17 @@ class TestPreviewCapping:
         assert "rows" in result.preview_text
         assert result.preview_truncated is False
 
+    def test_preview_of_large_dict_matches_capped_full_dump(self, adapter: DuckDBAdapter) -> None:
+        """Stopping JSON encoding early yields the same capped text as a full dump."""
+        dict_result = {"rows": [["é" * 7, i, None] for i in range(5000)]}
+        result = adapter.normalize("query", {"sql": "SELECT 1"}, dict_result)
+
+        expected = cap_text(
+            json.dumps(dict_result, indent=2, default=str), max_bytes=DEFAULT_PREVIEW_CAP_BYTES
+        )
+        assert (result.preview_text, result.preview_truncated) == expected
+        assert result.preview_truncated is True
+
     def test_preview_handles_none_result(self, adapter: DuckDBAdapter) -> None:
         """Preview handles None results."""
         result = adapter.normalize("query", {"sql": "SELECT 1"}, None)
@@ -57,3 +57,10 @@ def test_bigquery_adapter_categorizes_official_tools() -> None:
     assert adapter.categorize_tool("get_table_info") == "schema"
     assert adapter.categorize_tool("list_table_ids") == "list"
     assert adapter.categorize_tool("list_dataset_ids") == "list"
+
+
+def test_bigquery_adapter_list_types() -> None:
+    adapter = BigQueryAdapter()
+    assert adapter.extract_evidence("list_dataset_ids", {}, None)["list_type"] == "datasets"
+    assert adapter.extract_evidence("list_table_ids", {}, None)["list_type"] == "tables"
+    assert adapter.extract_evidence("list_projects", {}, None)["list_type"] == "projects"
@@ -37,6 +37,15 @@ class TestCapTextPreview:
         assert len(result.data.encode("utf-8")) <= 20
         assert result.bytes_truncated
 
+    def test_ascii_and_multibyte_boundaries(self) -> None:
+        """ASCII and mixed text are capped to the same bytes as encode-and-slice."""
+        for text in ("a" * 30, "ab" + "é" * 10, "x" * 18 + "🎉"):
+            for max_bytes in (0, 1, 7, 19, 20, 21, 40, 200):
+                expected = text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+                result = cap_text_preview(text, max_bytes=max_bytes)
+                assert result.data == expected
+                assert result.bytes_truncated == (len(text.encode("utf-8")) > max_bytes)
+
     def test_truncation_summary(self) -> None:
         """Truncation summary is generated correctly."""
         result = cap_text_preview("a" * 100, max_bytes=50)
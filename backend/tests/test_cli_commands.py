@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
+from mantora import __version__
+from mantora.cli import demo as cli_demo
+from mantora.cli import mcp as cli_mcp
 from mantora.cli.demo import run_duckdb_demo, run_postgres_demo
-from mantora.cli.main import build_parser
-from mantora.cli.mcp import run_mcp
+from mantora.cli.main import build_parser, main
+from mantora.cli.mcp import build_target_command, run_mcp
 from mantora.cli.up import run_up
+from mantora.config import ProxyConfig
+from mantora.config import loader as config_loader
 
 
 def test_up_command_parsing() -> None:
@@ -46,3 +55,152 @@ def test_demo_postgres_routing() -> None:
     assert args.command == "demo"
     assert args.demo_command == "postgres"
     assert args.func is run_postgres_demo
+
+
+def test_cli_import_skips_server_and_proxy_stacks() -> None:
+    code = (
+        "import sys, mantora.cli.main; "
+        "print(sorted(m for m in ('uvicorn', 'fastapi', 'mantora.mcp', 'mantora.app') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert out.strip() == "[]"
+
+
+def test_build_target_command_caches_binary_lookup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lookups: list[str] = []
+
+    def fake_which(name: str) -> str:
+        lookups.append(name)
+        return f"/opt/bin/{name}"
+
+    (tmp_path / "mcp-server-postgres").touch()
+    monkeypatch.setattr("sys.executable", str(tmp_path / "python"))
+    monkeypatch.setattr("shutil.which", fake_which)
+    cli_mcp._locate_binary.cache_clear()
+    cli_mcp._venv_bin_names.cache_clear()
+    try:
+        for _ in range(3):
+            assert build_target_command("duckdb", Path("demo.duckdb"), None) == [
+                "/opt/bin/mcp-server-duckdb",
+                "--db",
+                "demo.duckdb",
+            ]
+        assert lookups == ["mcp-server-duckdb"]
+        # Console scripts next to the interpreter win over PATH.
+        assert build_target_command("postgres", None, "postgresql://x")[0] == str(
+            tmp_path / "mcp-server-postgres"
+        )
+        assert lookups == ["mcp-server-duckdb"]
+    finally:
+        cli_mcp._locate_binary.cache_clear()
+        cli_mcp._venv_bin_names.cache_clear()
+
+
+def test_run_compose_uses_resolved_docker_binary(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    commands: list[list[str]] = []
+    monkeypatch.setattr("subprocess.run", lambda command, check: commands.append(command))
+    compose = tmp_path / "docker-compose.yml"
+
+    monkeypatch.setattr("shutil.which", lambda name: f"/usr/bin/{name}")
+    cli_demo._run_compose(compose)
+    assert commands == [["/usr/bin/docker", "compose", "-f", str(compose), "up", "-d"]]
+
+    monkeypatch.setattr("shutil.which", lambda name: None)
+    with pytest.raises(RuntimeError, match="Docker is not installed"):
+        cli_demo._run_compose(compose)
+
+
+def test_version_fast_path(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--version"]) == 0
+    assert capsys.readouterr().out == f"mantora {__version__}\n"
+
+
+def test_build_parser_registers_only_the_requested_subcommand() -> None:
+    parser = build_parser(["up", "--no-open"])
+    assert parser.parse_args(["up", "--no-open"]).func is run_up
+    with pytest.raises(SystemExit):
+        parser.parse_args(["mcp"])
+
+
+def test_run_mcp_reuses_the_store_it_reads_the_active_target_from(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mantora.store.sqlite import SQLiteSessionStore
+
+    db_path = tmp_path / "sessions.db"
+    seed = SQLiteSessionStore(db_path)
+    target = seed.create_target(name="ui", type="duckdb", command=["/bin/ui-server"])
+    seed.set_active_target(target.id)
+    seed.close()
+
+    captured: dict[str, object] = {}
+
+    def fake_run_proxy(
+        config: ProxyConfig,
+        store_path: Path,
+        session_title: str | None,
+        *,
+        store: SQLiteSessionStore | None = None,
+    ) -> None:
+        captured.update(command=config.target.command, store=store)
+
+    monkeypatch.setenv("MANTORA_STORAGE__SQLITE__PATH", str(db_path))
+    monkeypatch.setattr(config_loader, "_find_config_file", lambda: None)
+    monkeypatch.setattr(cli_mcp, "_run_proxy", fake_run_proxy)
+    args = build_parser().parse_args(["mcp"])
+
+    assert run_mcp(args) == 0
+    assert captured["command"] == ["/bin/ui-server"]
+    store = captured["store"]
+    assert isinstance(store, SQLiteSessionStore)
+    assert store.get_active_target() is not None
+    store.close()
+
+    # --connector wins without consulting the UI-selected target.
+    monkeypatch.setattr(
+        SQLiteSessionStore, "get_active_target", lambda self: pytest.fail("target lookup")
+    )
+    monkeypatch.setattr(cli_mcp, "_locate_binary", lambda name: f"/opt/bin/{name}")
+    args = build_parser().parse_args(["mcp", "--connector", "duckdb", "--db", "demo.duckdb"])
+    assert run_mcp(args) == 0
+    assert captured["command"] == ["/opt/bin/mcp-server-duckdb", "--db", "demo.duckdb"]
+    store = captured["store"]
+    assert isinstance(store, SQLiteSessionStore)
+    store.close()
+
+
+def test_print_startup_is_one_line_when_stderr_is_not_a_terminal(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    from mantora.config import PolicyConfig, TargetConfig
+
+    config = ProxyConfig(
+        policy=PolicyConfig(
+            protective_mode=True,
+            block_ddl=True,
+            block_dml=False,
+            block_multi_statement=False,
+            block_delete_without_where=False,
+        ),
+        target=TargetConfig(type="duckdb"),
+    )
+    cli_mcp._print_startup(config, "abc")
+
+    err = capsys.readouterr().err.strip()
+    assert err == "MCP proxy ready: protective_mode=on rules=block_ddl session=abc connector=duckdb"
+
+
+def test_resolve_command_only_resolves_bare_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli_mcp, "_locate_binary", lambda name: f"/opt/bin/{name}")
+
+    assert cli_mcp._resolve_command(["server", "--x"]) == ["/opt/bin/server", "--x"]
+    assert cli_mcp._resolve_command(["./server"]) == ["./server"]
+    assert cli_mcp._resolve_command(["/usr/bin/server"]) == ["/usr/bin/server"]
+    assert cli_mcp._resolve_command([]) == []
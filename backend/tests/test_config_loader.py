@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
-from mantora.config import ProxyConfig, load_proxy_config
+from mantora.config import ProxyConfig, load_proxy_config, loader, resolve_config_path
 
 
 def test_load_proxy_config_defaults() -> None:
@@ -129,3 +130,60 @@ def test_load_proxy_config_cli_override(tmp_path: Path) -> None:
     )
 
     assert not config.policy.protective_mode
+
+
+def test_config_search_sees_files_created_later(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    local = tmp_path / "mantora.toml"
+    assert resolve_config_path().resolve() != local
+    local.write_text("tag = 'late'\n")
+    assert resolve_config_path().resolve() == local
+
+
+def test_config_file_is_parsed_once_until_modified(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_file = tmp_path / "mantora.toml"
+    config_file.write_text("[limits]\npreview_rows = 5\n")
+    parses: list[Path] = []
+    real_parse = loader._parse_toml
+
+    def counting_parse(path: Path) -> dict[str, object]:
+        parses.append(path)
+        return real_parse(path)
+
+    monkeypatch.setattr(loader, "_parse_toml", counting_parse)
+    loader._parse_toml_cached.cache_clear()
+    try:
+        assert loader.load_proxy_config(config_path=config_file).limits.preview_rows == 5
+        assert loader.load_settings(config_path=config_file).limits.preview_rows == 5
+        assert len(parses) == 1
+
+        config_file.write_text("[limits]\npreview_rows = 7\n")
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+        assert loader.load_settings(config_path=config_file).limits.preview_rows == 7
+        assert len(parses) == 2
+    finally:
+        loader._parse_toml_cached.cache_clear()
+
+
+def test_load_proxy_config_maps_legacy_limit_keys(tmp_path: Path) -> None:
+    config_file = tmp_path / "mantora.toml"
+    config_file.write_text(
+        dedent("""
+        [limits]
+        max_preview_rows = 3
+        preview_bytes = 2048
+        max_preview_payload_bytes = 1024
+        max_columns = 4
+        """)
+    )
+
+    limits = load_proxy_config(config_path=config_file).limits
+    assert limits.preview_rows == 3
+    # The current key wins over its legacy alias.
+    assert limits.preview_bytes == 2048
+    assert limits.preview_columns == 4
@@ -6,8 +6,11 @@ from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
+from fastapi.testclient import TestClient
 
-from mantora.config.settings import Caps
+import mantora.api.routes_sessions as routes_sessions
+from mantora.app import create_app
+from mantora.config.settings import Caps, Settings, Storage, StorageBackend
 from mantora.context import ContextResolver
 from mantora.export.receipt import generate_pr_receipt
 from mantora.models.events import ObservedStep, SessionContext, TruncatedText
@@ -123,6 +126,55 @@ def test_context_resolver_can_infer_repo_from_hint_paths(
     assert ctx.commit is not None and len(ctx.commit) == 40
 
 
+def test_repo_root_resolution_is_cached_per_real_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Path | None] = []
+
+    def fake_resolve(*, project_root: Path | None = None, **_: object) -> SessionContext:
+        calls.append(project_root)
+        return SessionContext(repo_root=str(project_root), config_source="ui")
+
+    monkeypatch.setattr(routes_sessions._RESOLVER, "resolve", fake_resolve)
+    monkeypatch.setattr(routes_sessions, "_repo_context_cache", {})
+
+    first = routes_sessions._resolve_repo_context(str(tmp_path))
+    again = routes_sessions._resolve_repo_context(str(tmp_path / "sub" / ".."))
+    assert first is again
+    assert len(calls) == 1
+
+    monkeypatch.setattr(routes_sessions, "_REPO_CONTEXT_TTL_S", 0.0)
+    routes_sessions._repo_context_cache.clear()
+    routes_sessions._resolve_repo_context(str(tmp_path))
+    routes_sessions._resolve_repo_context(str(tmp_path))
+    assert len(calls) == 3
+
+
+def test_update_repo_root_keeps_tag_and_clears_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    resolved = SessionContext(
+        repo_root="/src/repo", repo_name="repo", branch="main", config_source="ui", tag="x"
+    )
+    monkeypatch.setattr(routes_sessions, "_resolve_repo_context", lambda raw: resolved)
+    app = create_app(settings=Settings(storage=Storage(backend=StorageBackend.memory)))
+    client = TestClient(app)
+    store = app.state.store
+    session = store.create_session(
+        title="t", context=SessionContext(tag="JIRA-1"), client_id="client-1"
+    )
+
+    resp = client.put(f"/api/sessions/{session.id}/repo-root", json={"repo_root": "/src/repo"})
+    assert resp.status_code == 200
+    context = resp.json()["context"]
+    assert (context["repo_name"], context["branch"], context["tag"]) == ("repo", "main", "JIRA-1")
+    assert store.get_client_default_repo_root("client-1") == "/src/repo"
+
+    resp = client.put(f"/api/sessions/{session.id}/repo-root", json={"repo_root": ""})
+    assert resp.status_code == 200
+    context = resp.json()["context"]
+    assert context["repo_name"] is None
+    assert context["tag"] == "JIRA-1"
+
+
 def test_extract_tables_touched_joins_and_schema_qualified() -> None:
     tables = extract_tables_touched(
         "WITH t AS (SELECT 1) SELECT * FROM foo.bar JOIN baz b ON b.id = 1"
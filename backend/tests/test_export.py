@@ -55,6 +55,11 @@ def test_export_json_includes_steps_in_order() -> None:
     assert data["schema_version"] == "mantora.session.v0"
     assert data["session"]["id"] == str(session.id)
     assert [s["name"] for s in data["steps"]] == ["first", "second"]
+    # Streamed chunks must match the canonical deterministic encoding byte for byte.
+    canonical = json.dumps(
+        data, ensure_ascii=False, sort_keys=True, separators=(",", ":"), indent=2
+    )
+    assert resp.text == canonical + "\n"
 
 
 def test_export_md_contains_timeline_headings_and_cast_evidence() -> None:
@@ -148,6 +153,26 @@ def test_cast_export_endpoints_work() -> None:
     assert data["schema_version"] == "mantora.cast.v0"
     assert data["cast"]["id"] == str(cast.id)
 
+    resp_cast = client.get(f"/api/casts/{cast.id}")
+    assert resp_cast.status_code == 200
+    assert resp_cast.json() == {
+        "id": str(cast.id),
+        "session_id": str(session.id),
+        "created_at": "2026-01-01T00:02:00+00:00",
+        "kind": "table",
+        "title": "Result table",
+        "origin_step_id": str(origin_step.id),
+        "origin_step_ids": [],
+        "sql": "SELECT 1",
+        "rows": [{"x": 1}],
+        "total_rows": 1,
+        "truncated": False,
+    }
+
+    resp_list = client.get(f"/api/sessions/{session.id}/casts")
+    assert resp_list.status_code == 200
+    assert [c["id"] for c in resp_list.json()] == [str(cast.id)]
+
 
 def test_export_respects_max_preview_rows_cap() -> None:
     settings = Settings(
@@ -198,7 +223,7 @@ def test_export_md_blockers_golden_snapshot() -> None:
         update={"id": fixed_session_id, "created_at": datetime(2026, 1, 1, 0, 0, tzinfo=UTC)}
     )
     store._steps[fixed_session_id] = store._steps.pop(session.id)
-    store._queues[fixed_session_id] = store._queues.pop(session.id)
+    store._notifiers[fixed_session_id] = store._notifiers.pop(session.id)
     store._session_casts[fixed_session_id] = store._session_casts.pop(session.id)
     session_id = fixed_session_id
 
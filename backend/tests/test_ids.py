@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from mantora.models.ids import timestamped_uuid7, uuid7
+
+
+def test_uuid7_sets_version_variant_and_timestamp() -> None:
+    unix_ns = 1_767_225_600_123_456_789  # 2026-01-01T00:00:00.123456789Z
+    value = uuid7(unix_ns)
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert value.int >> 80 == unix_ns // 1_000_000
+
+
+def test_uuid7_is_ordered_across_milliseconds_and_unique() -> None:
+    ids = [uuid7(n * 1_000_000) for n in range(1, 2000)]
+    assert ids == sorted(ids, key=lambda u: u.int)
+    assert len({uuid7(0) for _ in range(2000)}) == 2000
+
+
+def test_timestamped_uuid7_shares_the_clock_read() -> None:
+    created_at, value = timestamped_uuid7()
+    assert created_at.tzinfo is UTC
+    assert abs((datetime.now(UTC) - created_at).total_seconds()) < 5
+    epoch = datetime(1970, 1, 1, tzinfo=UTC)
+    assert value.int >> 80 == (created_at - epoch) // timedelta(milliseconds=1)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_draws_fresh_entropy() -> None:
+    uuid7(0)  # fill the parent's buffer
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, uuid7(0).bytes)
+        os._exit(0)
+    os.close(write_fd)
+    child_bytes = os.read(read_fd, 16)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert child_bytes != uuid7(0).bytes
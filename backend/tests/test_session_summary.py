@@ -1,20 +1,25 @@
-from datetime import UTC, datetime
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from mantora.api.routes_sessions import _compute_summary, get_session_rollup
+import pytest
+
+from mantora.api.routes_sessions import get_session_rollup
 from mantora.models.events import ObservedStep
+from mantora.store.interface import SessionStore
+from mantora.store.memory import MemorySessionStore
 from mantora.store.sqlite import SQLiteSessionStore
+from mantora.store.summary import summarize_steps
 
 
-def test_compute_summary_aggregates_counts() -> None:
-    """Test that _compute_summary correctly counts step types."""
-    steps = [
+def _summary_steps(session_id: UUID) -> list[ObservedStep]:
+    return [
         # Tool call: query (counts as tool_call + query)
         ObservedStep(
             id=uuid4(),
-            session_id=uuid4(),
+            session_id=session_id,
             created_at=datetime.now(UTC),
             kind="tool_call",
             name="query",
@@ -23,7 +28,7 @@ def test_compute_summary_aggregates_counts() -> None:
         # Tool call: cast_table (counts as tool_call + query + cast)
         ObservedStep(
             id=uuid4(),
-            session_id=uuid4(),
+            session_id=session_id,
             created_at=datetime.now(UTC),
             kind="tool_call",
             name="cast_table",
@@ -32,7 +37,7 @@ def test_compute_summary_aggregates_counts() -> None:
         # Tool call: generic (counts as tool_call only)
         ObservedStep(
             id=uuid4(),
-            session_id=uuid4(),
+            session_id=session_id,
             created_at=datetime.now(UTC),
             kind="tool_call",
             name="list_tables",
@@ -41,7 +46,7 @@ def test_compute_summary_aggregates_counts() -> None:
         # Blocker (counts as block)
         ObservedStep(
             id=uuid4(),
-            session_id=uuid4(),
+            session_id=session_id,
             created_at=datetime.now(UTC),
             kind="blocker",
             name="delete_production",
@@ -50,7 +55,7 @@ def test_compute_summary_aggregates_counts() -> None:
         # Error status (counts as error)
         ObservedStep(
             id=uuid4(),
-            session_id=uuid4(),
+            session_id=session_id,
             created_at=datetime.now(UTC),
             kind="tool_call",
             name="broken_tool",
@@ -59,7 +64,7 @@ def test_compute_summary_aggregates_counts() -> None:
         # Warnings (counts as warnings)
         ObservedStep(
             id=uuid4(),
-            session_id=uuid4(),
+            session_id=session_id,
             created_at=datetime.now(UTC),
             kind="tool_call",
             name="query",
@@ -68,7 +73,20 @@ def test_compute_summary_aggregates_counts() -> None:
         ),
     ]
 
-    summary = _compute_summary(steps)
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[SessionStore]:
+    if request.param == "memory":
+        yield MemorySessionStore()
+        return
+    sqlite_store = SQLiteSessionStore(tmp_path / "sessions.db")
+    yield sqlite_store
+    sqlite_store.close()
+
+
+def test_summarize_steps_aggregates_counts() -> None:
+    """Test that summarize_steps correctly counts step types."""
+    summary = summarize_steps(_summary_steps(uuid4()))
 
     assert summary.tool_calls == 5  # query, cast_table, list_tables, broken_tool, query(warnings)
     assert summary.queries == 3  # query, cast_table, query(warnings)
@@ -78,6 +96,37 @@ def test_compute_summary_aggregates_counts() -> None:
     assert summary.warnings == 2  # From the last step
 
 
+def test_store_session_summary_matches_python_aggregation(store: SessionStore) -> None:
+    session = store.create_session(title="Summary")
+    steps = _summary_steps(session.id)
+    base = datetime.now(UTC)
+    for i, step in enumerate(steps):
+        store.add_step(step.model_copy(update={"created_at": base + timedelta(milliseconds=i)}))
+    # An allowed decision nets out the blocker.
+    store.add_step(
+        ObservedStep(
+            id=uuid4(),
+            session_id=session.id,
+            created_at=base + timedelta(seconds=1),
+            kind="blocker_decision",
+            name="delete_production",
+            decision="allowed",
+        )
+    )
+
+    summary = store.get_session_summary(session.id)
+    assert summary == summarize_steps(store.list_steps(session.id))
+    assert summary.tool_calls == 5
+    assert summary.queries == 3
+    assert summary.casts == 1
+    assert summary.blocks == 0
+    assert summary.errors == 1
+    assert summary.warnings == 2
+
+    empty = store.get_session_summary(uuid4())
+    assert (empty.tool_calls, empty.blocks, empty.warnings) == (0, 0, 0)
+
+
 def test_session_rollup_aggregates_tables(tmp_path: Path) -> None:
     """Test that session rollup correctly aggregates touched tables."""
     db_path = tmp_path / "sessions.db"
@@ -74,4 +74,22 @@ def test_cors_origins_configured() -> None:
     cors_middleware = [m for m in app.user_middleware if "CORSMiddleware" in str(m.cls)]
     assert cors_middleware
     options = getattr(cors_middleware[0], "options", cors_middleware[0].kwargs)
-    assert options["allow_origins"] == ["http://localhost:3001"]
+    assert options["allow_origins"] == frozenset({"http://localhost:3001"})
+
+
+def test_legacy_caps_dict_maps_to_limits() -> None:
+    """Legacy caps dict keys map onto limits; missing keys keep their defaults."""
+    settings = Settings(caps={"max_preview_rows": 5, "retention_days": 3})
+    assert settings.limits.preview_rows == 5
+    assert settings.limits.retention_days == 3
+    assert settings.limits.preview_bytes == 512 * 1024
+
+
+def test_caps_reflects_limits_changed_after_construction() -> None:
+    settings = Settings()
+    settings.limits.preview_rows = 7
+    assert settings.caps == Caps(
+        max_preview_rows=7,
+        max_preview_payload_bytes=settings.limits.preview_bytes,
+        max_columns=settings.limits.preview_columns,
+    )
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
+from uuid import UUID
 
+import pytest
 from fastapi.testclient import TestClient
 
-from mantora.app import create_app
+import mantora.app as app_module
+from mantora.app import _resolve_frontend_dist, create_app, get_frontend_dist_path
 from mantora.config.settings import LimitsConfig, Settings, Storage, StorageBackend
 
 
@@ -51,3 +54,88 @@ def test_smoke_sessions_and_steps(tmp_path: Path) -> None:
     # Delete non-existent
     delete_missing = client.delete("/api/sessions/00000000-0000-0000-0000-000000000000")
     assert delete_missing.status_code == 404
+
+
+def test_smoke_pending_allow_and_missing(tmp_path: Path) -> None:
+    settings = Settings(
+        storage=Storage(
+            backend=StorageBackend.sqlite,
+            sqlite_path=tmp_path / "sessions.db",
+        ),
+    )
+    app = create_app(settings=settings)
+    client = TestClient(app)
+
+    session_id = client.post("/api/sessions", json={"title": "demo"}).json()["session"]["id"]
+    pending = app.state.store.create_pending_request(
+        session_id=UUID(session_id),
+        tool_name="query",
+        arguments={"sql": "DELETE FROM t"},
+        classification="destructive",
+        risk_level="critical",
+        reason="DELETE without WHERE",
+        blocker_step_id=None,
+    )
+
+    allow = client.post(f"/api/pending/{pending.id}/allow")
+    assert allow.status_code == 200
+    assert allow.json()["status"] == "allowed"
+
+    missing = client.post("/api/pending/00000000-0000-0000-0000-000000000000/deny")
+    assert missing.status_code == 404
+
+
+def test_frontend_dist_lookup_is_cached_per_env_value(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text("<html>spa</html>")
+    monkeypatch.setenv("MANTORA_FRONTEND_DIST", str(dist))
+    _resolve_frontend_dist.cache_clear()
+    try:
+        assert get_frontend_dist_path() == dist
+        misses = _resolve_frontend_dist.cache_info().misses
+        assert get_frontend_dist_path() == dist
+        assert _resolve_frontend_dist.cache_info().misses == misses
+
+        app = create_app(settings=Settings(storage=Storage(backend=StorageBackend.memory)))
+        client = TestClient(app)
+        resp = client.get("/sessions/abc")
+        assert resp.text == "<html>spa</html>"
+        etag = resp.headers["etag"]
+        assert client.get("/").headers["etag"] == etag
+        revalidated = client.get("/", headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        missing_api = client.get("/api/nope")
+        assert missing_api.status_code == 404
+        assert missing_api.json() == {"detail": "API route not found"}
+        assert "/{full_path}" not in app.openapi()["paths"]
+    finally:
+        _resolve_frontend_dist.cache_clear()
+
+
+def test_create_app_prunes_once_and_reopens_store_per_lifespan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Path] = []
+
+    def fake_prune(*, db_path: Path, retention_days: int, max_db_bytes: int) -> int:
+        calls.append(db_path)
+        return 0
+
+    monkeypatch.setattr(app_module, "prune_sqlite_sessions", fake_prune)
+    settings = Settings(
+        limits=LimitsConfig(retention_days=14),
+        storage=Storage(backend=StorageBackend.sqlite, sqlite_path=tmp_path / "sessions.db"),
+    )
+    app = create_app(settings=settings)
+
+    with TestClient(app) as client:
+        assert client.post("/api/sessions", json={"title": "first"}).status_code == 200
+    # A second lifespan gets a fresh store after the first one was closed.
+    with TestClient(app) as client:
+        assert len(client.get("/api/sessions").json()) == 1
+
+    assert calls == [tmp_path / "sessions.db"]
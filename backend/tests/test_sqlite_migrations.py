@@ -109,3 +109,47 @@ def test_sqlite_schema_migrates_steps_columns_additively(tmp_path: Path) -> None
         assert loaded == [step]
     finally:
         store.close()
+
+
+def test_sqlite_schema_backfills_session_tables_touched(tmp_path: Path) -> None:
+    """Older DBs get sessions.tables_touched_json rebuilt from their steps."""
+    db_path = tmp_path / "sessions.db"
+    store = SQLiteSessionStore(db_path)
+    session = store.create_session(title="legacy")
+    for tables in (["orders", "users"], ["users"], None):
+        store.add_step(
+            ObservedStep(
+                id=uuid4(),
+                session_id=session.id,
+                created_at=datetime.now(UTC),
+                name="query",
+                tables_touched=tables,
+            )
+        )
+    store.close()
+
+    # Simulate a DB written before the column existed.
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("ALTER TABLE sessions DROP COLUMN tables_touched_json")
+        conn.commit()
+    finally:
+        conn.close()
+
+    store = SQLiteSessionStore(db_path)
+    try:
+        assert store.get_session_rollup(session.id).tables_touched == ["orders", "users"]
+
+        store.add_step(
+            ObservedStep(
+                id=uuid4(),
+                session_id=session.id,
+                created_at=datetime.now(UTC),
+                name="query",
+                tables_touched=["accounts", "orders"],
+            )
+        )
+        rollup = store.get_session_rollup(session.id)
+        assert rollup.tables_touched == ["accounts", "orders", "users"]
+    finally:
+        store.close()
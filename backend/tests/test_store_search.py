@@ -82,3 +82,58 @@ def test_list_sessions_filters(tmp_path: Path) -> None:
     assert res[0].id == s1.id
 
     store.close()
+
+
+def test_list_session_rows_projects_list_fields(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    tagged = store.create_session(
+        title="Tagged",
+        context=SessionContext(
+            repo_root="/src/repo-a", repo_name="repo-a", branch="main", tag="JIRA-1"
+        ),
+    )
+    plain = store.create_session(title="Plain")
+
+    rows = {row.id: row for row in store.list_session_rows()}
+    assert set(rows) == {tagged.id, plain.id}
+    ctx = rows[tagged.id].context
+    assert ctx is not None
+    assert ctx.model_dump() == {
+        "repo_name": "repo-a",
+        "branch": "main",
+        "tag": "JIRA-1",
+    }
+    assert rows[plain.id].context is None
+
+    filtered = store.list_session_rows(tag="JIRA-1")
+    assert [row.id for row in filtered] == [tagged.id]
+
+    store.close()
+
+
+def test_list_session_filters_use_indexes(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+
+    def plan(**filters: object) -> str:
+        args: dict[str, object] = {
+            "q": None,
+            "tag": None,
+            "repo_name": None,
+            "branch": None,
+            "since": None,
+            "has_warnings": None,
+            "has_blocks": None,
+        }
+        args.update(filters)
+        where_sql, params = store._session_filters(**args)  # type: ignore[arg-type]
+        rows = store._conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT id FROM sessions {where_sql} ORDER BY created_at DESC",
+            params,
+        ).fetchall()
+        return "\n".join(row[3] for row in rows)
+
+    assert "idx_sessions_tag_created_at" in plan(tag="JIRA-1")
+    assert "idx_sessions_repo_branch_created_at" in plan(repo_name="repo-a", branch="main")
+    assert "idx_steps_session_warnings" in plan(has_warnings=True)
+    assert "idx_steps_session_blockers" in plan(has_blocks=True)
+    store.close()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from uuid import uuid4
@@ -9,7 +11,9 @@ from uuid import uuid4
 import pytest
 
 import mantora.store.sqlite as sqlite_store
+from mantora.casts.models import TableCast
 from mantora.models.events import ObservedStep, TruncatedText
+from mantora.store.connection import configure_connection
 from mantora.store.retention import prune_sqlite_sessions
 from mantora.store.sqlite import SQLiteSessionStore
 
@@ -43,8 +47,8 @@ def test_sqlite_store_persists_sessions_and_steps(tmp_path: Path) -> None:
     loaded_steps = list(store2.list_steps(session.id))
     assert loaded_steps == [step]
 
-    assert store2.get_step_queue(session.id) is not None
-    assert store2.get_step_queue(uuid4()) is None
+    assert store2.get_step_notifier(session.id) is not None
+    assert store2.get_step_notifier(uuid4()) is None
 
     store2.close()
 
@@ -195,3 +199,277 @@ def test_prune_sqlite_sessions_respects_max_db_bytes(tmp_path: Path) -> None:
     store2 = SQLiteSessionStore(db_path, retention_days=0, max_db_bytes=0)
     assert list(store2.list_sessions()) == []
     store2.close()
+
+
+def test_sqlite_store_transaction_commits_and_rolls_back(tmp_path: Path) -> None:
+    db_path = tmp_path / "sessions.db"
+    store = SQLiteSessionStore(db_path)
+
+    with store.transaction():
+        committed = store.create_session(title="committed")
+        store.add_step(
+            ObservedStep(
+                id=uuid4(),
+                session_id=committed.id,
+                created_at=datetime.now(UTC),
+                kind="note",
+                name="hello",
+            )
+        )
+
+    with pytest.raises(RuntimeError), store.transaction():
+        rolled_back = store.create_session(title="rolled back")
+        raise RuntimeError("boom")
+
+    assert store.get_session(committed.id) is not None
+    assert len(store.list_steps(committed.id)) == 1
+    assert store.get_session(rolled_back.id) is None
+
+    store.close()
+
+
+def test_sqlite_store_transaction_sees_its_own_sessions_on_write_paths(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+
+    with store.transaction():
+        session = store.create_session(title="same block")
+        assert store.get_step_notifier(session.id) is not None
+        pending = store.create_pending_request(
+            session_id=session.id,
+            tool_name="query",
+            arguments={"sql": "DELETE FROM t"},
+            classification="destructive",
+            risk_level="critical",
+            reason="DELETE without WHERE",
+            blocker_step_id=None,
+        )
+
+    fetched = store.get_pending_request(pending.id)
+    assert fetched is not None
+    assert fetched.session_id == session.id
+    store.close()
+
+
+def test_sqlite_connect_uses_wal_with_normal_sync(tmp_path: Path) -> None:
+    conn = sqlite_store._connect(tmp_path / "sessions.db")
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 == NORMAL
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_configure_connection_warns_when_wal_unavailable(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    conn = sqlite3.connect(":memory:")
+    try:
+        with caplog.at_level(logging.WARNING, logger="mantora.store.connection"):
+            configure_connection(conn)
+        assert "WAL mode unavailable" in caplog.text
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_sqlite_store_lists_steps_after_cursor(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="cursor")
+    base = datetime.now(UTC)
+    # Two steps share a timestamp so the id tiebreak is exercised.
+    created = [base, base, base + timedelta(seconds=1)]
+    for ts in created:
+        store.add_step(
+            ObservedStep(id=uuid4(), session_id=session.id, created_at=ts, kind="note", name="n")
+        )
+
+    first = store.list_steps_after(session.id, cursor=None, limit=2)
+    assert len(first) == 2
+    rest = store.list_steps_after(session.id, cursor=(first[-1].created_at, first[-1].id))
+    assert [s.id for s in first] + [s.id for s in rest] == [
+        s.id for s in sorted(store.list_steps(session.id), key=lambda s: (s.created_at, str(s.id)))
+    ]
+    assert store.list_steps_after(session.id, cursor=(rest[-1].created_at, rest[-1].id)) == []
+    store.close()
+
+
+def test_sqlite_store_concurrent_add_step_group_commits(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="burst")
+
+    def add(i: int) -> None:
+        store.add_step(
+            ObservedStep(
+                id=uuid4(),
+                session_id=session.id,
+                created_at=datetime.now(UTC),
+                kind="note",
+                name=f"step-{i}",
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add, range(64)))
+
+    assert {s.name for s in store.list_steps(session.id)} == {f"step-{i}" for i in range(64)}
+
+    with pytest.raises(KeyError):
+        store.add_step(
+            ObservedStep(id=uuid4(), session_id=uuid4(), created_at=datetime.now(UTC), name="x")
+        )
+    store.close()
+
+
+def test_sqlite_store_session_exists(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="exists")
+
+    assert store.session_exists(session.id) is True
+    assert store.session_exists(uuid4()) is False
+    assert store.delete_session(session.id)
+    assert store.session_exists(session.id) is False
+    store.close()
+
+
+def test_sqlite_store_reader_pool_serves_concurrent_reads(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="pool")
+
+    def work(i: int) -> int:
+        store.add_step(
+            ObservedStep(
+                id=uuid4(), session_id=session.id, created_at=datetime.now(UTC), name=f"s{i}"
+            )
+        )
+        return len(store.list_steps(session.id))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        counts = list(pool.map(work, range(32)))
+
+    assert all(1 <= c <= 32 for c in counts)
+    assert len(store.list_steps(session.id)) == 32
+    # Reader connections are read-only.
+    with store._reader() as conn, pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM sessions")
+    store.close()
+
+
+def test_sqlite_store_round_trips_table_casts(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="casts")
+    cast = TableCast(
+        id=uuid4(),
+        session_id=session.id,
+        created_at=datetime.now(UTC),
+        title="Result table",
+        origin_step_id=uuid4(),
+        origin_step_ids=[uuid4()],
+        sql="SELECT 1",
+        rows=[{"x": 1, "y": None}],
+        total_rows=1,
+    )
+    store.add_cast(cast)
+
+    assert store.get_cast(cast.id) == cast
+    assert store.list_casts(session.id) == [cast]
+    store.close()
+
+
+async def test_step_notifier_wakes_every_subscriber_from_writer_thread(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="notify")
+    notifier = store.get_step_notifier(session.id)
+    assert notifier is not None
+
+    step = ObservedStep(id=uuid4(), session_id=session.id, created_at=datetime.now(UTC), name="n")
+    with notifier.subscribe() as first, notifier.subscribe() as second:
+        # Sync routes write from the threadpool, off the event loop.
+        await asyncio.to_thread(store.add_step, step)
+        await asyncio.wait_for(asyncio.gather(first.wait(), second.wait()), timeout=0.1)
+    store.close()
+
+
+def test_sqlite_store_group_commit_isolates_failing_rows(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="batch")
+
+    def new_step() -> ObservedStep:
+        return ObservedStep(
+            id=uuid4(), session_id=session.id, created_at=datetime.now(UTC), name="step"
+        )
+
+    existing = new_step()
+    store.add_step(existing)
+
+    def write(step: ObservedStep) -> sqlite_store._StepWrite:
+        return sqlite_store._StepWrite(
+            row=store._step_row(step), session_id=step.session_id, tables_touched=None
+        )
+
+    fresh = new_step()
+    # A client retry of an already-stored step lands in the same batch as a new one.
+    batch = [write(fresh), write(existing)]
+    with store._lock:
+        store._insert_steps(batch)
+
+    assert batch[0].error is None
+    assert isinstance(batch[1].error, sqlite3.IntegrityError)
+    assert {s.id for s in store.list_steps(session.id)} == {existing.id, fresh.id}
+
+    with store.transaction():
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_step(existing)
+        store.add_step(new_step())
+    assert len(store.list_steps(session.id)) == 3
+    store.close()
+
+
+def test_sqlite_store_transaction_does_not_absorb_other_threads_writes(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="outside")
+    step = ObservedStep(id=uuid4(), session_id=session.id, created_at=datetime.now(UTC), name="s")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with pytest.raises(RuntimeError), store.transaction():
+            store.create_session(title="rolled back")
+            # Another thread writes while the transaction is open; it waits for it.
+            pending = pool.submit(store.add_step, step)
+            assert not pending.done()
+            raise RuntimeError("boom")
+        pending.result(timeout=5)
+
+    assert [s.id for s in store.list_steps(session.id)] == [step.id]
+    assert [s.title for s in store.list_sessions()] == ["outside"]
+    store.close()
+
+
+def test_sqlite_store_list_steps_and_casts_respect_limit(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    session = store.create_session(title="limit")
+    base = datetime.now(UTC)
+    for i in range(3):
+        store.add_step(
+            ObservedStep(
+                id=uuid4(),
+                session_id=session.id,
+                created_at=base + timedelta(seconds=i),
+                name=f"s{i}",
+            )
+        )
+
+    assert [s.name for s in store.list_steps(session.id, limit=2)] == ["s0", "s1"]
+    assert len(store.list_steps(session.id)) == 3
+    assert store.list_casts(session.id, limit=1) == []
+    store.close()
+
+
+def test_sqlite_store_close_closes_borrowed_readers(tmp_path: Path) -> None:
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    with store._reader() as borrowed:
+        store.close()
+    assert store._readers.empty()
+    with pytest.raises(sqlite3.ProgrammingError):
+        borrowed.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError), store._reader():
+        pass
@@ -50,3 +50,12 @@ def test_sanitize_trace_payload_sanitizes_json_strings() -> None:
     assert REDACTED_EMAIL in sanitized["result"]
     assert REDACTED_TIMESTAMP in sanitized["result"]
     assert REDACTED_UUID in sanitized["result"]
+
+
+def test_sanitize_trace_payload_sorts_keys_recursively() -> None:
+    payload = {"b": {"z": 1, "a": [{"y": 2, "x": 3}]}, "a": None}
+
+    sanitized = sanitize_trace_payload(payload)
+    assert list(sanitized) == ["a", "b"]
+    assert list(sanitized["b"]) == ["a", "z"]
+    assert list(sanitized["b"]["a"][0]) == ["x", "y"]
@@ -8,6 +8,7 @@ import type {
   PolicyManifest,
   ReceiptResult,
   Session,
+  SessionListRow,
   SessionSummary,
   Target,
 } from './types';
@@ -40,7 +41,7 @@ export function useSessions(params?: SessionsFilterParams) {
   const qs = buildQueryParams(params);
   return useQuery({
     queryKey: ['sessions', qs],
-    queryFn: () => apiFetch<Session[]>(`/api/sessions${qs}`),
+    queryFn: () => apiFetch<SessionListRow[]>(`/api/sessions${qs}`),
     refetchInterval: 1000,
   });
 }
@@ -23,6 +23,14 @@ export type Session = {
   context?: SessionContext | null;
 };
 
+/** Lightweight row returned by `GET /api/sessions`. */
+export type SessionListRow = {
+  id: string;
+  title: string | null;
+  created_at: string;
+  context?: Pick<SessionContext, 'repo_name' | 'branch' | 'tag'> | null;
+};
+
 export type ObservedStep = {
   id: string;
   session_id: string;
@@ -38,7 +38,7 @@ import {
   useSessionsSummaries,
 } from '../api/queries';
 import { AppHeader } from '../components/Layout/AppHeader';
-import type { Session } from '../api/types';
+import type { SessionListRow } from '../api/types';
 
 function formatRelativeTime(dateString: string): string {
   const date = new Date(dateString);
@@ -341,7 +341,7 @@ export function SessionsPage() {
                   </TableCell>
                 </TableRow>
               ) : (
-                (sessions ?? []).map((s: Session) => (
+                (sessions ?? []).map((s: SessionListRow) => (
                   <TableRow
                     key={s.id}
                     hover